@@ -0,0 +1,177 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from geoh5py import Workspace
+from geoh5py.objects import Octree, Surface
+from simpeg_drivers.utils.utils import active_from_xyz
+
+from plate_simulation.models.events import (
+    Anomaly,
+    Body,
+    Boundary,
+    Erosion,
+    Overburden,
+)
+from plate_simulation.models.plates import Plate
+from plate_simulation.models.series import DikeSwarm, Geology
+from plate_simulation.utils import replicate
+
+
+Kernel = tuple[Callable[[], Any], int, str]
+
+
+class Inputs:
+    """
+    Inputs shared by the kernels of a benchmark configuration.
+
+    :param workspace: Workspace holding the surfaces.
+    :param mesh: Octree mesh.
+    :param topography: Topography surface.
+    :param plates: Plates of the swarm.
+    :param surfaces: Surfaces of the plates.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        workspace: Workspace,
+        mesh: Octree,
+        topography: Surface,
+        plates: list[Plate],
+        surfaces: list[Surface],
+    ):
+        self.workspace = workspace
+        self.mesh = mesh
+        self.topography = topography
+        self.plates = plates
+        self.surfaces = surfaces
+
+
+def boundary_mask(inputs: Inputs) -> Kernel:
+    """Cells below the topography."""
+    boundary = Boundary(inputs.topography)
+    return lambda: boundary.mask(inputs.mesh), inputs.mesh.n_cells, "cells"
+
+
+def topography_masks(inputs: Inputs) -> Kernel:
+    """Overburden and erosion masks, as tested by Geology.build."""
+    overburden = Overburden(topography=inputs.topography, thickness=20.0, value=10.0)
+    erosion = Erosion(surface=inputs.topography)
+    indices = np.arange(inputs.mesh.n_cells)
+    return (
+        lambda: [
+            overburden.mask(inputs.mesh, indices=indices),
+            erosion.mask(inputs.mesh, indices=indices),
+        ],
+        inputs.mesh.n_cells,
+        "cells",
+    )
+
+
+def topography_masks_baseline(inputs: Inputs) -> Kernel:
+    """Overburden and erosion masks computed with active_from_xyz."""
+    boundary = Boundary(inputs.topography)
+    return (
+        lambda: [
+            active_from_xyz(inputs.mesh, boundary.vertical_shift(-20.0), "center"),
+            active_from_xyz(inputs.mesh, boundary.vertical_shift(0.0), "center"),
+        ],
+        inputs.mesh.n_cells,
+        "cells",
+    )
+
+
+def boundary_vertical_shift(inputs: Inputs) -> Kernel:
+    """Vertices of the topography shifted down."""
+    boundary = Boundary(inputs.topography)
+    n_vertices = inputs.topography.n_vertices
+    return lambda: boundary.vertical_shift(-10.0), n_vertices, "vertices"
+
+
+def body_mask(inputs: Inputs) -> Kernel:
+    """Cells within each plate, one plate at a time."""
+    bodies = [Body(surface) for surface in inputs.surfaces]
+    n_cells = inputs.mesh.n_cells * len(bodies)
+    return lambda: [body.mask(inputs.mesh) for body in bodies], n_cells, "cells"
+
+
+def swarm_mask(inputs: Inputs) -> Kernel:
+    """Cells within any plate, in a single pass."""
+    swarm = DikeSwarm([Anomaly(surface, 1.0) for surface in inputs.surfaces])
+    return lambda: swarm.mask(inputs.mesh), inputs.mesh.n_cells, "cells"
+
+
+def plate_vertices(inputs: Inputs) -> Kernel:
+    """Rotated vertices of each plate."""
+    return (
+        lambda: [plate.vertices for plate in inputs.plates],
+        len(inputs.plates),
+        "plates",
+    )
+
+
+def replicate_plates(inputs: Inputs) -> Kernel:
+    """Copies of a plate surface, including the copy of the original."""
+    surface = inputs.surfaces[0]
+    number = len(inputs.plates)
+    return (
+        lambda: replicate(surface.copy(), number, 100.0, 45.0),
+        number,
+        "plates",
+    )
+
+
+def geology_build(inputs: Inputs, chunk_size: int | None = None) -> Kernel:
+    """Plates under an overburden and topography."""
+
+    def build():
+        history = [
+            DikeSwarm([Anomaly(surface, 1.0) for surface in inputs.surfaces]),
+            Overburden(topography=inputs.topography, thickness=20.0, value=10.0),
+            Erosion(surface=inputs.topography),
+        ]
+        return Geology(
+            inputs.workspace,
+            mesh=inputs.mesh,
+            background=100.0,
+            history=history,
+            chunk_size=chunk_size,
+        ).build()
+
+    return build, inputs.mesh.n_cells, "cells"
+
+
+def chunked_geology_build(inputs: Inputs) -> Kernel:
+    """Plates under an overburden and topography, by chunks of 1e4 cells."""
+    return geology_build(inputs, chunk_size=10_000)
+
+
+KERNELS: dict[str, tuple[Callable[[Inputs], Kernel], list[str]]] = {
+    "Boundary.mask": (boundary_mask, ["cells", "topography"]),
+    "topography masks": (topography_masks, ["cells", "topography"]),
+    "topography masks (active_from_xyz)": (
+        topography_masks_baseline,
+        ["cells", "topography"],
+    ),
+    "Boundary.vertical_shift": (boundary_vertical_shift, ["topography"]),
+    "Body.mask": (body_mask, ["cells", "plates"]),
+    "DikeSwarm.mask": (swarm_mask, ["cells", "plates"]),
+    "Plate.vertices": (plate_vertices, ["plates"]),
+    "replicate": (replicate_plates, ["plates"]),
+    "Geology.build": (geology_build, ["cells", "topography", "plates"]),
+    "Geology.build (chunked)": (
+        chunked_geology_build,
+        ["cells", "topography", "plates"],
+    ),
+}
@@ -0,0 +1,286 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from collections.abc import Callable
+from itertools import product
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from geoh5py import Workspace
+
+from benchmarks.kernels import KERNELS, Inputs, Kernel
+from benchmarks.synthetic import (
+    open_octree,
+    plate_surfaces,
+    plate_swarm,
+    synthetic_topography,
+)
+from plate_simulation import __version__
+from plate_simulation.mesh.cache import default_cache_directory
+from plate_simulation.models.cache import MASK_CACHE
+
+
+BASELINE_DIRECTORY = Path(__file__).parent / "baselines"
+
+
+def measure(kernel: Kernel, repeats: int = 3) -> dict[str, Any]:
+    """
+    Best wall time and peak allocated memory of a kernel.
+
+    Cached masks are cleared before each call, and the memory is traced on
+    an additional call, so that it does not slow down the timed ones.
+
+    :param kernel: Function to be measured, number of items it processes and
+        their unit.
+    :param repeats: Number of timed calls.
+    """
+    function, items, unit = kernel
+    times = []
+    for _ in range(repeats):
+        MASK_CACHE.clear()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    MASK_CACHE.clear()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = min(times)
+    return {
+        "time": best,
+        "items": items,
+        "unit": unit,
+        "throughput": items / best if best > 0 else float("inf"),
+        "peak_memory": peak,
+    }
+
+
+def case_name(kernel: str, configuration: dict[str, Any]) -> str:
+    """
+    Name of a benchmark, from its kernel and the values of its parameters.
+
+    :param kernel: Name of the kernel.
+    :param configuration: Values of the parameters the kernel depends on.
+    """
+    values = ",".join(f"{name}={value}" for name, value in configuration.items())
+    return f"{kernel}[{values}]"
+
+
+def run(  # pylint: disable=too-many-arguments, too-many-locals
+    cells: list[int],
+    topographies: list[str],
+    plates: list[int],
+    kernels: list[str],
+    repeats: int = 3,
+    directory: str | Path | None = None,
+    log: Callable[[str], Any] = print,
+) -> dict[str, dict[str, Any]]:
+    """
+    Measure kernels over the combinations of the parameters they depend on.
+
+    Kernels that do not depend on the size of the mesh are only measured on
+    the first one.
+
+    :param cells: Target numbers of cells of the meshes.
+    :param topographies: Topography types, 'flat' or 'rough'.
+    :param plates: Numbers of plates of the swarms.
+    :param kernels: Names of the kernels in :data:`KERNELS`.
+    :param repeats: Number of timed calls of each kernel.
+    :param directory: Directory of the synthetic meshes.
+    :param log: Function printing the result of each benchmark.
+
+    :return: Measures of each benchmark, by name.
+    """
+    directory = Path(directory or default_cache_directory() / "benchmarks")
+    results: dict[str, dict[str, Any]] = {}
+    for index, n_cells in enumerate(cells):
+        with open_octree(directory, n_cells) as mesh:
+            workspace = Workspace()
+            surfaces = {
+                topography: synthetic_topography(
+                    workspace, mesh, rough=topography == "rough"
+                )
+                for topography in topographies
+            }
+            swarms = {}
+            for number in plates:
+                swarm = plate_swarm(mesh, number)
+                swarms[number] = (swarm, plate_surfaces(workspace, swarm))
+
+            for name in kernels:
+                setup, axes = KERNELS[name]
+                if "cells" not in axes and index > 0:
+                    continue
+
+                values = {
+                    "cells": [n_cells] if "cells" in axes else [None],
+                    "topography": topographies if "topography" in axes else [None],
+                    "plates": plates if "plates" in axes else [plates[0]],
+                }
+                for n_cells_, topography, number in product(*values.values()):
+                    configuration = {
+                        "cells": n_cells_,
+                        "topography": topography,
+                        "plates": number if "plates" in axes else None,
+                    }
+                    configuration = {
+                        key: value
+                        for key, value in configuration.items()
+                        if value is not None
+                    }
+                    inputs = Inputs(
+                        workspace,
+                        mesh,
+                        surfaces[topography or topographies[0]],
+                        *swarms[number],
+                    )
+                    result = measure(setup(inputs), repeats=repeats)
+                    key = case_name(name, configuration)
+                    results[key] = {"kernel": name, **configuration, **result}
+                    log(
+                        f"{key:<72} {result['time']:>10.4f} s "
+                        f"{result['throughput']:>12.4g} {result['unit']}/s "
+                        f"{result['peak_memory'] / 2**20:>10.1f} MiB"
+                    )
+            workspace.close()
+
+    return results
+
+
+def machine() -> dict[str, Any]:
+    """Description of the machine and environment running the benchmarks."""
+    return {
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plate_simulation": __version__,
+    }
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    tolerance: float = 0.2,
+) -> dict[str, float]:
+    """
+    Benchmarks slower than their baseline.
+
+    :param results: Measures of each benchmark, by name.
+    :param baseline: Baseline measures, by name.
+    :param tolerance: Relative increase of the time counted as a regression.
+
+    :return: Ratio of the time to the baseline time of the slower benchmarks.
+    """
+    regressions = {}
+    for key, result in results.items():
+        if key not in baseline or baseline[key]["time"] <= 0:
+            continue
+
+        ratio = result["time"] / baseline[key]["time"]
+        if ratio > 1 + tolerance:
+            regressions[key] = ratio
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description="Measure the kernels building plate simulation models."
+    )
+    parser.add_argument(
+        "--cells",
+        type=float,
+        nargs="+",
+        default=[1e4, 1e5, 1e6],
+        help="Target numbers of cells of the synthetic meshes.",
+    )
+    parser.add_argument(
+        "--topography",
+        nargs="+",
+        choices=["flat", "rough"],
+        default=["flat", "rough"],
+        help="Topography types.",
+    )
+    parser.add_argument(
+        "--plates",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100],
+        help="Numbers of plates of the swarms.",
+    )
+    parser.add_argument(
+        "--kernels",
+        nargs="+",
+        choices=list(KERNELS),
+        default=list(KERNELS),
+        help="Kernels to be measured.",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=3, help="Number of timed calls per kernel."
+    )
+    parser.add_argument(
+        "--directory",
+        help="Directory of the synthetic meshes, created on first use.",
+    )
+    parser.add_argument(
+        "--save", help="Name of the baseline to be written with the results."
+    )
+    parser.add_argument(
+        "--compare", help="Name of the baseline to compare the results to."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Relative slowdown reported as a regression.",
+    )
+    args = parser.parse_args()
+
+    measures = run(
+        [int(n_cells) for n_cells in args.cells],
+        args.topography,
+        args.plates,
+        args.kernels,
+        repeats=args.repeats,
+        directory=args.directory,
+    )
+
+    if args.save:
+        BASELINE_DIRECTORY.mkdir(exist_ok=True)
+        with open(
+            BASELINE_DIRECTORY / f"{args.save}.json", "w", encoding="utf8"
+        ) as file:
+            json.dump({"machine": machine(), "results": measures}, file, indent=4)
+
+    if args.compare:
+        with open(BASELINE_DIRECTORY / f"{args.compare}.json", encoding="utf8") as file:
+            reference = json.load(file)
+
+        slower = compare(measures, reference["results"], tolerance=args.tolerance)
+        for name, factor in slower.items():
+            print(f"{name} is {factor:.2f} times slower than {args.compare}.")
+        if slower:
+            sys.exit(1)
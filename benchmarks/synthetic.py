@@ -0,0 +1,175 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+from geoh5py import Workspace
+from geoh5py.objects import Octree, Surface
+from scipy.spatial import Delaunay
+
+from plate_simulation.models.params import PlateParams
+from plate_simulation.models.plates import Plate
+
+
+CELL_SIZE = 10.0
+LEVELS = 4
+
+
+def synthetic_octree(workspace: Workspace, n_cells: int) -> Octree:
+    """
+    Octree mesh of about a given number of cells, refined around the z=0
+    plane.
+
+    Cells double in size away from the plane, in layers as thick as the
+    largest cell, so that the cells of all sizes are aligned.
+
+    :param workspace: Workspace receiving the mesh.
+    :param n_cells: Target number of cells.
+    """
+    largest = 2 ** (LEVELS - 1)
+    per_column = 2 * sum(largest / 4**level for level in range(LEVELS))
+    width = max(int(round(np.sqrt(n_cells / per_column) / largest)), 1) * largest
+    height = 2 * LEVELS * largest
+
+    blocks = []
+    for level in range(LEVELS):
+        size = 2**level
+        i, j, k = np.meshgrid(
+            np.arange(0, width, size),
+            np.arange(0, width, size),
+            np.arange(0, largest, size),
+            indexing="ij",
+        )
+        for bottom in [
+            height // 2 - (level + 1) * largest,
+            height // 2 + level * largest,
+        ]:
+            block = np.zeros(
+                i.size, dtype=[(axis, "<i4") for axis in "IJK"] + [("NCells", "<i4")]
+            )
+            block["I"], block["J"] = i.ravel(), j.ravel()
+            block["K"] = k.ravel() + bottom
+            block["NCells"] = size
+            blocks.append(block)
+
+    return Octree.create(
+        workspace,
+        name=f"octree {n_cells:.0e}",
+        origin=np.r_[0.0, 0.0, -height / 2 * CELL_SIZE],
+        u_count=2 ** int(np.ceil(np.log2(width))),
+        v_count=2 ** int(np.ceil(np.log2(width))),
+        w_count=height,
+        u_cell_size=CELL_SIZE,
+        v_cell_size=CELL_SIZE,
+        w_cell_size=CELL_SIZE,
+        octree_cells=np.hstack(blocks),
+    )
+
+
+@contextmanager
+def open_octree(directory: str | Path, n_cells: int) -> Iterator[Octree]:
+    """
+    Synthetic octree mesh read from a workspace, created on first use.
+
+    Writing large meshes to a workspace is slow, so that each size is only
+    generated once.
+
+    :param directory: Directory of the workspaces holding the meshes.
+    :param n_cells: Target number of cells.
+    """
+    path = Path(directory) / f"octree_{n_cells}.geoh5"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.parent / f".{path.stem}-{uuid4().hex}.geoh5"
+        with Workspace.create(temporary) as workspace:
+            synthetic_octree(workspace, n_cells)
+        os.replace(temporary, path)
+
+    with Workspace(path, mode="r") as workspace:
+        mesh = next(
+            entity for entity in workspace.objects if isinstance(entity, Octree)
+        )
+        _ = mesh.octree_cells
+        yield mesh
+
+
+def synthetic_topography(
+    workspace: Workspace, mesh: Octree, rough: bool = False, n_vertices: int = 100
+) -> Surface:
+    """
+    Topography covering a mesh, along the z=0 plane.
+
+    :param workspace: Workspace receiving the surface.
+    :param mesh: Octree mesh covered by the surface.
+    :param rough: Add random relief of about the size of the largest cells.
+    :param n_vertices: Number of vertices along each horizontal axis.
+    """
+    extent = mesh.u_count * CELL_SIZE
+    x, y = np.meshgrid(
+        np.linspace(-extent / 10, extent * 1.1, n_vertices),
+        np.linspace(-extent / 10, extent * 1.1, n_vertices),
+    )
+    z = np.zeros_like(x)
+    if rough:
+        rng = np.random.default_rng(0)
+        z = rng.normal(scale=2 ** (LEVELS - 1) * CELL_SIZE, size=x.shape)
+
+    vertices = np.c_[x.ravel(), y.ravel(), z.ravel()]
+
+    return Surface.create(
+        workspace,
+        name="rough topography" if rough else "flat topography",
+        vertices=vertices,
+        cells=Delaunay(vertices[:, :2]).simplices,
+    )
+
+
+def plate_swarm(mesh: Octree, number: int) -> list[Plate]:
+    """
+    Plates at random locations below the z=0 plane of a mesh.
+
+    :param mesh: Octree mesh containing the plates.
+    :param number: Number of plates.
+    """
+    rng = np.random.default_rng(0)
+    extent = mesh.u_count * CELL_SIZE
+    depth = 2 ** (LEVELS - 1) * CELL_SIZE
+    plates = []
+    for index in range(number):
+        params = PlateParams(
+            name=f"plate {index}",
+            plate=1.0,
+            width=CELL_SIZE,
+            strike_length=extent / 4,
+            dip_length=depth,
+            dip=rng.uniform(30.0, 90.0),
+            dip_direction=rng.uniform(0.0, 360.0),
+            elevation=-depth,
+        )
+        center = np.r_[rng.uniform(0.25, 0.75, 2) * extent, -depth]
+        plates.append(Plate(params, *center))
+
+    return plates
+
+
+def plate_surfaces(workspace: Workspace, plates: list[Plate]) -> list[Surface]:
+    """
+    Surfaces of plates.
+
+    :param workspace: Workspace receiving the surfaces.
+    :param plates: Plates to be triangulated.
+    """
+    return [plate.create_surface(workspace) for plate in plates]
@@ -0,0 +1,129 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+from geoh5py.data import FloatData
+from geoh5py.groups import Group
+from geoh5py.objects import ObjectBase, Octree, Surface
+from simpeg_drivers import __version__ as simpeg_drivers_version
+
+from plate_simulation import __version__
+from plate_simulation.cache import option_values
+from plate_simulation.models.cache import fingerprint, mesh_key
+from plate_simulation.params import PlateSimulationParams
+
+
+EM_SIMULATIONS = ["tdem", "fem", "magnetotellurics", "tipper"]
+SECONDARY_SUFFIX = "_secondary"
+
+
+def background_fingerprint(
+    params: PlateSimulationParams,
+    survey: ObjectBase,
+    topography: Surface,
+    mesh: Octree,
+) -> str:
+    """
+    Hash of the inputs controlling the response of the model without plates.
+
+    The plate parameters are left out, and the mesh is hashed by its cells,
+    so that the members of a sweep sharing a mesh share the response.
+
+    :param params: Plate simulation parameters.
+    :param survey: Survey object of the simulation.
+    :param topography: Topography surface of the simulation.
+    :param mesh: Octree mesh of the simulation.
+    """
+    values: list[np.ndarray | str] = [
+        __version__,
+        simpeg_drivers_version,
+        np.asarray(params.model.background, dtype=float),
+        params.model.overburden.model_dump_json(),
+        json.dumps(
+            option_values(params.simulation.options), sort_keys=True, default=str
+        ),
+        mesh_key(mesh),
+    ]
+    for entity in [survey, getattr(survey, "complement", None), topography]:
+        for name in ["vertices", "cells"]:
+            array = getattr(entity, name, None)
+            values.append("none" if array is None else np.asarray(array))
+
+    return fingerprint(*values)
+
+
+def find_object(group: Group, name: str) -> ObjectBase | None:
+    """
+    First object of a given name below a group.
+
+    :param group: Group to search.
+    :param name: Name of the object.
+    """
+    for child in group.children:
+        if isinstance(child, ObjectBase) and child.name == name:
+            return child
+        if isinstance(child, Group):
+            found = find_object(child, name)
+            if found is not None:
+                return found
+
+    return None
+
+
+def add_secondary_data(total: ObjectBase, background: ObjectBase) -> list[FloatData]:
+    """
+    Add the difference between the data of a survey and the data of the same
+    name on the survey of the background response.
+
+    The secondary data are grouped as the total data they derive from.
+
+    :param total: Survey holding the response of the full model.
+    :param background: Survey holding the response of the model without
+        plates.
+
+    :return: Secondary data added to the survey.
+    """
+    references = {
+        child.name: child
+        for child in background.children
+        if isinstance(child, FloatData)
+    }
+    secondary: dict[str, FloatData] = {}
+    for child in total.children:
+        if not isinstance(child, FloatData) or child.name.endswith(SECONDARY_SUFFIX):
+            continue
+
+        reference = references.get(child.name)
+        if reference is None or reference.values.shape != child.values.shape:
+            continue
+
+        data = total.add_data(
+            {
+                f"{child.name}{SECONDARY_SUFFIX}": {
+                    "values": child.values - reference.values,
+                    "association": child.association,
+                }
+            }
+        )
+        if isinstance(data, FloatData):
+            secondary[child.name] = data
+
+    for group in list(total.property_groups or []):
+        names = [name for name in group.properties_name if name in secondary]
+        if names:
+            total.add_data_to_group(
+                [secondary[name] for name in names],
+                f"{group.name}{SECONDARY_SUFFIX}",
+            )
+
+    return list(secondary.values())
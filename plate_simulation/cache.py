@@ -0,0 +1,195 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import numpy as np
+from geoh5py import Workspace
+from geoh5py.data import GeometricDataConstants
+from geoh5py.groups import Group
+from geoh5py.objects import ObjectBase, Surface
+from geoh5py.shared import Entity
+from octree_creation_app import __version__ as octree_version
+from simpeg_drivers import __version__ as simpeg_drivers_version
+
+from plate_simulation import __version__
+from plate_simulation.mesh.cache import default_cache_directory
+from plate_simulation.models.cache import fingerprint
+from plate_simulation.params import PlateSimulationParams
+
+
+IGNORED_OPTIONS = [
+    "conda_environment",
+    "data_object",
+    "geoh5",
+    "mesh",
+    "monitoring_directory",
+    "out_group",
+    "run_command",
+    "starting_model",
+    "topography_object",
+    "workspace_geoh5",
+]
+
+
+def option_values(options: dict[str, Any]) -> dict[str, Any]:
+    """
+    Effective values of the options of a ui.json.
+
+    Disabled optional parameters are given as None. The options naming the
+    workspace, output group, survey, topography or objects replaced by the
+    driver are left out.
+
+    :param options: Options of a ui.json, as stored by a group.
+    """
+    values = {}
+    for name, form in options.items():
+        if name in IGNORED_OPTIONS:
+            continue
+
+        if isinstance(form, dict) and "value" in form:
+            enabled = form.get("enabled", True)
+            values[name] = form["value"] if enabled else None
+        else:
+            values[name] = form
+
+    return values
+
+
+def copy_entity(entity: Entity, parent: Entity | Workspace):
+    """
+    Copy an entity and its children.
+
+    Data maps of referenced data are recreated with the referenced data, and
+    are not copied on their own.
+
+    :param entity: Entity to be copied.
+    :param parent: Entity or workspace receiving the copy.
+    """
+    if isinstance(entity, GeometricDataConstants):
+        return
+
+    copy = entity.copy(parent=parent, copy_children=False)
+    for child in getattr(entity, "children", []):
+        copy_entity(child, copy)
+
+
+def result_fingerprint(
+    params: PlateSimulationParams,
+    survey: ObjectBase,
+    topography: Surface,
+    envelope: tuple[np.ndarray, np.ndarray] | None = None,
+) -> str:
+    """
+    Hash of the full input of a plate simulation.
+
+    Parameters only affecting how the result is computed, such as caches or
+    chunk sizes, are left out, while the background response adds secondary
+    data to the result. The survey, topography and envelope are hashed by
+    their geometry, so that copies of a workspace share the result.
+
+    :param params: Plate simulation parameters.
+    :param survey: Survey object of the simulation.
+    :param topography: Topography surface of the simulation.
+    :param envelope: Vertices and triangles of the surface enclosing the
+        plates of the sweep, refining the mesh with the sweep envelope.
+    """
+    values: list[np.ndarray | str] = [
+        __version__,
+        simpeg_drivers_version,
+        octree_version,
+        params.mesh.model_dump_json(exclude={"mesh_cache", "thin_receivers"}),
+        params.model.model_dump_json(exclude={"chunk_size"}),
+        str(params.background_response),
+        json.dumps(
+            option_values(params.simulation.options), sort_keys=True, default=str
+        ),
+        json.dumps(getattr(survey, "metadata", None), sort_keys=True, default=str),
+    ]
+    for entity in [survey, getattr(survey, "complement", None), topography]:
+        for name in ["vertices", "cells"]:
+            array = getattr(entity, name, None)
+            values.append("none" if array is None else np.asarray(array))
+
+    values += ["none"] * 2 if envelope is None else [np.asarray(a) for a in envelope]
+
+    return fingerprint(*values)
+
+
+class ResultCache:
+    """
+    Store of plate simulation results on disk, indexed by the hash of their
+    inputs.
+
+    The content of the output group of each simulation is saved in its own
+    geoh5 file.
+
+    :param directory: Directory of the cache, defaults to
+        :func:`default_cache_directory`.
+    """
+
+    def __init__(self, directory: str | Path | None = None):
+        self.directory = Path(directory or default_cache_directory()) / "results"
+
+    def __contains__(self, key: str) -> bool:
+        return self.path(key).exists()
+
+    def path(self, key: str) -> Path:
+        """
+        Path to the geoh5 file storing a result.
+
+        :param key: Hash of the inputs of the simulation.
+        """
+        return self.directory / f"{key}.geoh5"
+
+    def fetch(self, key: str, parent: Group) -> bool:
+        """
+        Copy a stored result into an output group.
+
+        :param key: Hash of the inputs of the simulation.
+        :param parent: Output group receiving the copy.
+
+        :return: True if the result was stored.
+        """
+        if key not in self:
+            return False
+
+        with Workspace(self.path(key), mode="r") as workspace:
+            for child in workspace.root.children:
+                copy_entity(child, parent)
+
+        return True
+
+    def store(self, key: str, group: Group) -> Path:
+        """
+        Save the content of an output group under the hash of its inputs.
+
+        The result is first written to a temporary file, and moved in place
+        once complete, so that concurrent runs never read partial files.
+
+        :param key: Hash of the inputs of the simulation.
+        :param group: Output group of the simulation.
+
+        :return: Path to the stored file.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary = self.directory / f".{key}-{uuid4().hex}.geoh5"
+        with Workspace.create(temporary) as workspace:
+            for child in group.children:
+                copy_entity(child, workspace)
+
+        os.replace(temporary, self.path(key))
+
+        return self.path(key)
@@ -13,23 +13,63 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 from geoh5py.data import FloatData, ReferencedData
-from geoh5py.groups import UIJsonGroup
+from geoh5py.groups import ContainerGroup, UIJsonGroup
 from geoh5py.objects import Octree, Points, Surface
-from geoh5py.shared.utils import fetch_active_workspace
 from geoh5py.ui_json import InputFile, monitored_directory_copy
 from octree_creation_app.driver import OctreeDriver
+from octree_creation_app.params import OctreeParams
+from octree_creation_app.utils import treemesh_2_octree
 from param_sweeps.generate import generate
+from simpeg.utils.mat_utils import dip_azimuth2cartesian
 from simpeg_drivers.driver import InversionDriver
 from simpeg_drivers.params import InversionBaseParams
 
+from plate_simulation.background import (
+    EM_SIMULATIONS,
+    add_secondary_data,
+    background_fingerprint,
+    find_object,
+)
+from plate_simulation.cache import ResultCache, result_fingerprint
 from plate_simulation.logger import get_logger
-from plate_simulation.models.events import Anomaly, Erosion, Overburden
+from plate_simulation.mesh.cache import MeshCache, mesh_fingerprint
+from plate_simulation.mesh.estimate import fit_cell_budget
+from plate_simulation.models import EventMap
+from plate_simulation.models.cache import mesh_key
+from plate_simulation.models.events import Anomaly, Erosion, Event, Overburden
 from plate_simulation.models.plates import Plate
-from plate_simulation.models.series import DikeSwarm, Geology
+from plate_simulation.models.series import DikeSwarm, Geology, Series
 from plate_simulation.params import PlateSimulationParams
-from plate_simulation.utils import replicate
+from plate_simulation.report import StageReport, stage
+from plate_simulation.sensitivity import LINEAR_SIMULATIONS, SensitivityCache
+from plate_simulation.superposition import Superposition
+from plate_simulation.sweep import plate_envelope, sweep_trials
+from plate_simulation.tracer import active_workspace, span, tracing
+from plate_simulation.utils import replicate, volume_average
+
+
+def run_simulation(driver: InversionDriver):
+    """
+    Run a simulation driver.
+
+    The driver redirects the standard output to its log file while running,
+    which is restored, and the log closed, if the simulation fails.
+
+    :param driver: Simulation driver.
+    """
+    stdout = sys.stdout
+    try:
+        driver.run()
+    finally:
+        if sys.stdout is not stdout:
+            log = getattr(sys.stdout, "log", None)
+            sys.stdout = stdout
+            if log is not None:
+                log.close()
 
 
 class PlateSimulationDriver:
@@ -42,42 +82,264 @@ class PlateSimulationDriver:
     :param mesh: Octree mesh in which model is built for the simulation.
     :param model: Model to simulate.
     :param survey: Survey object for the simulation
+    :param simulation_parameters: Parsed simulation options shared with other
+        simulations on the same survey, parsed from the parameters otherwise.
+    :param meshes: Meshes shared with other simulations in the same workspace,
+        by hash of their inputs. Meshes made by the driver are added to it.
+    :param trials: Values of the parameters varied by the members of the
+        sweep the simulation belongs to, read from the sweep lookup file
+        otherwise.
+    :param report: Report of the time and peak memory of the stages of the
+        run, started by the driver otherwise.
+    :param geologies: Scenarios shared with other simulations in the same
+        workspace, by hash of their mesh. The scenario of the driver is
+        rebuilt with its history, reusing the realizations of unchanged
+        events, and added to it otherwise.
     """
 
-    def __init__(self, params: PlateSimulationParams):
+    def __init__(
+        self,
+        params: PlateSimulationParams,
+        simulation_parameters: InversionBaseParams | None = None,
+        meshes: dict[str, Octree] | None = None,
+        trials: list[dict[str, Any]] | None = None,
+        report: StageReport | None = None,
+        geologies: dict[str, Geology] | None = None,
+    ):
         self.params = params
+        self.meshes = meshes
+        self.geologies = geologies
+        self.trials = trials
+        self.report = report or StageReport()
 
         self._surfaces: list[Surface] | None = None
+        self._envelope: Surface | None = None
+        self._envelope_geometry: tuple[np.ndarray, np.ndarray] | None = None
         self._survey: Points | None = None
         self._mesh: Octree | None = None
         self._model: FloatData | None = None
-        self._simulation_parameters: InversionBaseParams | None = None
+        self._background: np.ndarray | None = None
+        self._simulation_parameters: InversionBaseParams | None = simulation_parameters
         self._simulation_driver: InversionDriver | None = None
         self._out_group = self.validate_out_group(self.params.out_group)
 
         self._logger = get_logger("Plate Simulation")
 
-    def run(self) -> InversionDriver:
-        """Create octree mesh, fill model, and simulate."""
-
-        self._logger.info("running the simulation...")
-        self.simulation_driver.run()
-
-        with fetch_active_workspace(self.params.geoh5, mode="r+"):
-            self.out_group.add_ui_json()
-            if (
-                self.params.monitoring_directory is not None
-                and Path(self.params.monitoring_directory).is_dir()
-            ):
-                monitored_directory_copy(
-                    str(Path(self.params.monitoring_directory).resolve()),
-                    self.out_group,
-                )
+    def run(self) -> InversionDriver | None:
+        """
+        Create octree mesh, fill model, and simulate.
 
+        With the result cache, the result of a simulation of identical inputs
+        is copied instead, and no simulation driver is returned. The time and
+        peak memory of each stage are reported in the metadata of the output
+        group and in a json file next to the workspace.
+        """
+        key = None
+        cached = False
+        with tracing(), self.report.activate():
+            if self.params.result_cache:
+                with active_workspace(self.params.geoh5, mode="r+"):
+                    envelope = (
+                        self.envelope_geometry
+                        if self.params.mesh.sweep_envelope
+                        else None
+                    )
+                    key = result_fingerprint(
+                        self.params, self.survey, self.topography, envelope
+                    )
+                    with stage("fetch result"):
+                        cached = ResultCache().fetch(key, self.out_group)
+
+            if cached:
+                self._logger.info("using the cached result...")
+            else:
+                self._logger.info("running the simulation...")
+                if self.params.sensitivity_cache:
+                    self.attach_sensitivities()
+                elif self.params.superposition:
+                    self.superpose_plates()
+
+                simulation_driver = self.simulation_driver
+                with stage("simulation"):
+                    run_simulation(simulation_driver)
+
+                if self.params.background_response:
+                    with stage("background response"):
+                        self.simulate_background()
+
+            with active_workspace(self.params.geoh5, mode="r+"):
+                if key is not None and not cached:
+                    with stage("store result"):
+                        ResultCache().store(key, self.out_group)
+
+                with stage("write ui.json"):
+                    self.out_group.add_ui_json()
+
+                if (
+                    self.params.monitoring_directory is not None
+                    and Path(self.params.monitoring_directory).is_dir()
+                ):
+                    with stage("monitoring copy"):
+                        monitored_directory_copy(
+                            str(Path(self.params.monitoring_directory).resolve()),
+                            self.out_group,
+                        )
+
+        self.write_report()
         self._logger.info("done.")
-        self._logger.handlers.clear()
 
-        return self.simulation_driver
+        return None if cached else self.simulation_driver
+
+    @property
+    def report_path(self) -> Path | None:
+        """Path to the json file reporting the stages of the run."""
+        h5file = self.params.geoh5.h5file
+        if not isinstance(h5file, str | Path):
+            return None
+
+        h5file = Path(h5file)
+        return h5file.parent / f"{h5file.stem}_{self.out_group.uid}.report.json"
+
+    def write_report(self):
+        """Write the report of the stages of the run to the output group."""
+        with active_workspace(self.params.geoh5, mode="r+"):
+            self.out_group.update_metadata({"report": self.report.to_dict()})
+
+        if self.report_path is not None:
+            self.report.write(self.report_path)
+
+    def attach_sensitivities(self):
+        """
+        Evaluate linear simulations from the sensitivity of identical meshes
+        and surveys, computed and stored on the first run.
+        """
+        inversion_type = self.simulation_parameters.inversion_type
+        if inversion_type not in LINEAR_SIMULATIONS:
+            self._logger.info(
+                "skipping the sensitivity cache of non-linear '%s' simulation...",
+                inversion_type,
+            )
+            return
+
+        with active_workspace(self.params.geoh5, mode="r+"):
+            misfits = self.simulation_driver.data_misfit.objfcts
+
+        cache = SensitivityCache()
+        for misfit in misfits:
+            if cache.attach(misfit.simulation):
+                self._logger.info("using the cached sensitivity...")
+
+    def superpose_plates(self):
+        """
+        Evaluate linear simulations as the response of the model without the
+        plates, stored for identical meshes and surveys, plus the response of
+        the cells changed by the plates.
+        """
+        params = self.simulation_parameters
+        if params.inversion_type not in LINEAR_SIMULATIONS:
+            self._logger.info(
+                "skipping the superposition of non-linear '%s' simulation...",
+                params.inversion_type,
+            )
+            return
+
+        if params.inversion_type == "magnetic vector" and (
+            params.starting_inclination is not None
+            or params.starting_declination is not None
+        ):
+            self._logger.info(
+                "skipping the superposition of magnetization not along the "
+                "inducing field..."
+            )
+            return
+
+        with active_workspace(self.params.geoh5, mode="r+"):
+            misfits = self.simulation_driver.data_misfit.objfcts
+            models = self.simulation_driver.models
+            permutation = self.simulation_driver.inversion_mesh.permutation
+            rotation = self.simulation_driver.inversion_mesh.rotation
+            contrast = np.nan_to_num(self.model.values - self._background)
+
+        order = np.argsort(permutation)
+        cells = (contrast != 0.0)[order][models.active_cells]
+        background = np.nan_to_num(self._background[order][models.active_cells])
+
+        # The plate cells are set to the background rather than subtracting the
+        # contrast, so that the reference is identical for any plate property.
+        reference = models.starting.reshape(-1, cells.size).copy()
+        if params.inversion_type == "magnetic vector":
+            declination = params.inducing_field_declination
+            if rotation is not None:
+                declination += rotation["angle"]
+            direction = dip_azimuth2cartesian(
+                params.inducing_field_inclination, declination
+            )
+            # Offset of the starting magnetization in simpeg-drivers
+            reference[:, cells] = np.outer(direction, background[cells] + 1e-8)
+        else:
+            reference[:, cells] = background[cells]
+
+        reference = reference.ravel()
+        for misfit in misfits:
+            if not Superposition.supports(misfit.simulation):
+                continue
+            model_map = getattr(misfit, "model_map", None)
+            local = reference if model_map is None else model_map @ reference
+            Superposition(misfit.simulation, local).attach()
+
+    def simulate_background(self):
+        """
+        Simulate the response of the model without plates, shared by the
+        simulations of identical backgrounds, overburden, meshes and surveys,
+        and add the secondary response of the plates to the survey.
+        """
+        inversion_type = self.simulation_parameters.inversion_type
+        if inversion_type not in EM_SIMULATIONS:
+            self._logger.info(
+                "skipping the background response of '%s' simulation...",
+                inversion_type,
+            )
+            return
+
+        cache = ResultCache()
+        with active_workspace(self.params.geoh5, mode="r+"):
+            key = background_fingerprint(
+                self.params, self.survey, self.topography, self.mesh
+            )
+            group = ContainerGroup.create(
+                self.params.geoh5, name="Background response", parent=self.out_group
+            )
+            cached = cache.fetch(key, group)
+
+        if cached:
+            self._logger.info("using the cached background response...")
+        else:
+            self._logger.info("simulating the background response...")
+            with active_workspace(self.params.geoh5, mode="r+"):
+                params = self.make_simulation_parameters()
+                params.mesh = self.mesh
+                with stage("write model"):
+                    params.starting_model = self.mesh.add_data(
+                        {"background_model": {"values": self._background}}
+                    )
+                params.out_group = None
+                with stage("simulation setup"):
+                    driver = InversionDriver(params)
+                driver.out_group.parent = group
+
+            with stage("simulation"):
+                run_simulation(driver)
+
+            with active_workspace(self.params.geoh5, mode="r+"):
+                cache.store(key, group)
+
+        with active_workspace(self.params.geoh5, mode="r+"):
+            total = self.simulation_driver.inversion_data.entity
+            background = find_object(group, total.name)
+            if background is None:
+                raise ValueError("Background response could not be found.")
+
+            add_secondary_data(total, background)
 
     @property
     def out_group(self) -> UIJsonGroup:
@@ -95,7 +357,7 @@ class PlateSimulationDriver:
         if isinstance(out_group, UIJsonGroup):
             return out_group
 
-        with fetch_active_workspace(self.params.geoh5, mode="r+"):
+        with active_workspace(self.params.geoh5, mode="r+"):
             out_group = UIJsonGroup.create(
                 self.params.geoh5,
                 name="Plate Simulation",
@@ -112,7 +374,7 @@ class PlateSimulationDriver:
     @property
     def simulation_driver(self) -> InversionDriver:
         if self._simulation_driver is None:
-            with fetch_active_workspace(self.params.geoh5, mode="r+"):
+            with active_workspace(self.params.geoh5, mode="r+"):
                 self.simulation_parameters.mesh = self.mesh
                 self.simulation_parameters.starting_model = self.model
 
@@ -124,7 +386,10 @@ class PlateSimulationDriver:
                     )
 
                 self.simulation_parameters.out_group = None
-                self._simulation_driver = InversionDriver(self.simulation_parameters)
+                with stage("simulation setup"):
+                    self._simulation_driver = InversionDriver(
+                        self.simulation_parameters
+                    )
                 self._simulation_driver.out_group.parent = self.out_group
 
         return self._simulation_driver
@@ -132,11 +397,17 @@ class PlateSimulationDriver:
     @property
     def simulation_parameters(self) -> InversionBaseParams:
         if self._simulation_parameters is None:
-            self._simulation_parameters = self.params.simulation_parameters()
-            if self._simulation_parameters.physical_property == "conductivity":
-                self._simulation_parameters.model_type = "Resistivity (Ohm-m)"
+            with stage("simulation parameters"):
+                self._simulation_parameters = self.make_simulation_parameters()
         return self._simulation_parameters
 
+    def make_simulation_parameters(self) -> InversionBaseParams:
+        """Parse new SimPEG parameters from the simulation options."""
+        parameters = self.params.simulation_parameters()
+        if parameters.physical_property == "conductivity":
+            parameters.model_type = "Resistivity (Ohm-m)"
+        return parameters
+
     @property
     def survey(self):
         if self._survey is None:
@@ -167,25 +438,63 @@ class PlateSimulationDriver:
                 self.params.model.plate,
                 *center,
             )
-            surface = plate.create_surface(self.params.geoh5, self.out_group)
+            with stage("create surfaces"):
+                surface = plate.create_surface(self.params.geoh5, self.out_group)
+
+                if self.params.model.plate.number == 1:
+                    self._surfaces = [surface]
+                else:
+                    self._surfaces = replicate(
+                        surface,
+                        self.params.model.plate.number,
+                        self.params.model.plate.spacing,
+                        self.params.model.plate.dip_direction,
+                    )
 
-            if self.params.model.plate.number == 1:
-                self._surfaces = [surface]
-            else:
-                self._surfaces = replicate(
-                    surface,
-                    self.params.model.plate.number,
-                    self.params.model.plate.spacing,
-                    self.params.model.plate.dip_direction,
+        return self._surfaces
+
+    @property
+    def envelope_geometry(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vertices and triangles of the surface enclosing the plates of all the
+        members of the sweep the simulation belongs to.
+
+        Members are given by the trials of the driver, or read from the sweep
+        lookup file next to the workspace. The envelope reduces to the plates
+        of the simulation otherwise.
+        """
+        if self._envelope_geometry is None:
+            trials = self.trials
+            if trials is None:
+                trials = sweep_trials(Path(self.params.geoh5.h5file).parent)
+            self._envelope_geometry = plate_envelope(
+                self.params.model, self.survey, self.topography, trials
+            )
+
+        return self._envelope_geometry
+
+    @property
+    def envelope(self) -> Surface:
+        """Surface of the sweep envelope, created in the output group."""
+        if self._envelope is None:
+            vertices, cells = self.envelope_geometry
+            with active_workspace(self.params.geoh5, mode="r+"):
+                self._envelope = Surface.create(
+                    self.params.geoh5,
+                    vertices=vertices,
+                    cells=cells,
+                    name=f"{self.params.model.plate.name} envelope",
+                    parent=self.out_group,
                 )
 
-        return self._surfaces
+        return self._envelope
 
     @property
     def mesh(self) -> Octree:
         """Returns an octree mesh built from mesh parameters."""
         if self._mesh is None:
-            self._mesh = self.make_mesh()
+            with stage("make mesh"):
+                self._mesh = self.make_mesh()
 
         return self._mesh
 
@@ -193,7 +502,8 @@ class PlateSimulationDriver:
     def model(self) -> FloatData:
         """Returns the model built from model parameters."""
         if self._model is None:
-            self._model = self.make_model()
+            with stage("make model"):
+                self._model = self.make_model()
 
         return self._model
 
@@ -201,19 +511,126 @@ class PlateSimulationDriver:
         """
         Build specialized mesh for plate simulation from parameters.
 
-        Mesh contains refinements for topography and any plates.
+        Mesh contains refinements for topography and any plates. If the mesh
+        cache is enabled, or meshes are shared with the driver, a mesh built
+        previously from identical inputs is copied instead. With the sweep
+        envelope, the mesh is refined around the plates of all the members of
+        the sweep, and shared between them through the mesh cache. With a
+        cell budget, the padding, core depth and refinements are reduced
+        until the estimated mesh fits the budget.
         """
 
+        plates = self.surfaces
+        if self.params.mesh.sweep_envelope:
+            plates = [self.envelope]
+
+        mesh_params = self.params.mesh
+        if mesh_params.cell_budget is not None:
+            mesh_params, estimate = fit_cell_budget(
+                mesh_params, self.survey, self.topography, plates
+            )
+            self._logger.info(
+                "fitting the mesh to %i cells: estimated %i cells...",
+                mesh_params.cell_budget,
+                estimate.n_cells,
+            )
+
+        cached = mesh_params.mesh_cache or mesh_params.sweep_envelope
+        key = None
+        if cached or self.meshes is not None:
+            key = mesh_fingerprint(mesh_params, self.survey, self.topography, plates)
+
+        if key is not None:
+            mesh = None
+            with active_workspace(self.params.geoh5, mode="r+"):
+                if self.meshes is not None and key in self.meshes:
+                    mesh = self.meshes[key].copy(
+                        parent=self.out_group, copy_children=False
+                    )
+                elif cached:
+                    mesh = MeshCache().fetch(key, self.out_group)
+
+            if isinstance(mesh, Octree):
+                self._logger.info("using the cached mesh...")
+                if self.meshes is not None:
+                    self.meshes.setdefault(key, mesh)
+                return mesh
+
         self._logger.info("making the mesh...")
-        octree_params = self.params.mesh.octree_params(
-            self.survey, self.simulation_parameters.topography_object, self.surfaces
+        octree_params = mesh_params.octree_params(
+            self.survey, self.simulation_parameters.topography_object, plates
         )
-        octree_driver = OctreeDriver(octree_params)
-        mesh = octree_driver.run()
+        mesh = self.build_octree(octree_params)
         mesh.parent = self.out_group
+        self.remove_refinement_objects(octree_params, plates)
+
+        if key is not None and self.meshes is not None:
+            self.meshes[key] = mesh
+
+        if key is not None and cached:
+            with active_workspace(self.params.geoh5, mode="r+"):
+                MeshCache().store(key, mesh)
 
         return mesh
 
+    @staticmethod
+    def build_octree(octree_params: OctreeParams) -> Octree:
+        """
+        Run the steps of the octree driver, recording the refinement of each
+        object in a span of the active trace.
+
+        :param octree_params: Parameters of the octree mesh.
+        """
+        octree_driver = OctreeDriver(octree_params)
+        with active_workspace(octree_params.geoh5, mode="r+"):
+            with span("base mesh"):
+                treemesh = OctreeDriver.base_treemesh(octree_params)
+                treemesh = OctreeDriver.refine_minimum_level(
+                    treemesh, octree_params.minimum_level
+                )
+
+            for refinement in octree_params.refinements or []:
+                if refinement is None:
+                    continue
+                with span(f"refine {refinement.refinement_object.name}"):
+                    treemesh = OctreeDriver.refine_objects(treemesh, [refinement])
+
+            with span("finalize mesh"):
+                treemesh.finalize()
+                mesh = treemesh_2_octree(
+                    octree_params.geoh5,
+                    treemesh,
+                    name=octree_params.ga_group_name,
+                    parent=octree_params.out_group,
+                )
+            octree_driver.update_monitoring_directory(mesh)
+
+        return mesh
+
+    def remove_refinement_objects(
+        self, octree_params: OctreeParams, plates: list[Surface]
+    ):
+        """
+        Remove the objects created to refine the mesh, such as the merged
+        plates, from the workspace.
+
+        :param octree_params: Parameters of the octree mesh.
+        :param plates: Plate surfaces given to the mesh.
+        """
+        inputs = {
+            entity.uid
+            for entity in [
+                self.survey,
+                self.simulation_parameters.topography_object,
+                *plates,
+            ]
+        }
+        with active_workspace(self.params.geoh5, mode="r+") as workspace:
+            for refinement in octree_params.refinements or []:
+                entity = getattr(refinement, "refinement_object", None)
+                if entity is not None and entity.uid not in inputs:
+                    workspace.remove_entity(entity)
+
     def make_model(self) -> FloatData:
         """Create background + plate and overburden model from parameters."""
 
@@ -226,7 +643,14 @@ class PlateSimulationDriver:
         )
 
         dikes = DikeSwarm(
-            [Anomaly(s, self.params.model.plate.plate) for s in self.surfaces],
+            [
+                Anomaly(
+                    s,
+                    self.params.model.plate.plate,
+                    samples=self.params.model.plate.volume_fraction_samples,
+                )
+                for s in self.surfaces
+            ],
             name="plates",
         )
 
@@ -234,16 +658,12 @@ class PlateSimulationDriver:
             surface=self.simulation_parameters.topography_object,
         )
 
-        scenario = Geology(
-            workspace=self.params.geoh5,
-            mesh=self.mesh,
-            background=self.params.model.background,
-            history=[dikes, overburden, erosion],
-        )
+        scenario = self.geology([dikes, overburden, erosion])
 
-        geology, event_map = scenario.build()
+        with stage("build geology"):
+            geology, event_map = scenario.build()
 
-        with fetch_active_workspace(self.params.geoh5, mode="r+"):
+        with active_workspace(self.params.geoh5, mode="r+"):
             value_map = {k: v[0] for k, v in event_map.items()}
             physical_property_map = {k: v[1] for k, v in event_map.items()}
 
@@ -251,31 +671,106 @@ class PlateSimulationDriver:
             if physical_property == "conductivity":
                 physical_property = "resistivity"
 
-            model = self.mesh.add_data(
-                {
-                    "geology": {
-                        "type": "referenced",
-                        "values": geology,
-                        "value_map": value_map,
+            with stage("write model"):
+                model = self.mesh.add_data(
+                    {
+                        "geology": {
+                            "type": "referenced",
+                            "values": geology,
+                            "value_map": value_map,
+                        }
                     }
-                }
-            )
-            if isinstance(model, ReferencedData):
-                model.add_data_map(physical_property, physical_property_map)
-
-        starting_model_values = geology.copy()
-        for k, v in physical_property_map.items():
-            starting_model_values[geology == k] = v
+                )
+                if isinstance(model, ReferencedData):
+                    model.add_data_map(physical_property, physical_property_map)
 
-        starting_model = self.mesh.add_data(
-            {"starting_model": {"values": starting_model_values}}
+        harmonic = physical_property == "resistivity"
+        starting_model_values = self.property_values(
+            scenario, geology, event_map, harmonic=harmonic
         )
+        if self.params.superposition or self.params.background_response:
+            background_scenario = scenario.with_history([overburden, erosion])
+            with stage("build background"):
+                background, background_map = background_scenario.build()
+            self._background = self.property_values(
+                background_scenario, background, background_map, harmonic=harmonic
+            )
+
+        with stage("write model"):
+            starting_model = self.mesh.add_data(
+                {"starting_model": {"values": starting_model_values}}
+            )
 
         if not isinstance(starting_model, FloatData):
             raise ValueError("Starting model could not be created.")
 
         return starting_model
 
+    def geology(self, history: list[Event | Series]) -> Geology:
+        """
+        Scenario of the simulation on its mesh.
+
+        The scenario shared on a mesh of identical geometry is reused with
+        the history, background and chunk size of the simulation, so that
+        only the events whose inputs changed are realized again.
+
+        :param history: Sequence of geological events.
+        """
+        key = mesh_key(self.mesh)
+        scenario = None if self.geologies is None else self.geologies.get(key)
+        if scenario is None:
+            scenario = Geology(
+                workspace=self.params.geoh5,
+                mesh=self.mesh,
+                background=self.params.model.background,
+                history=history,
+                chunk_size=self.params.model.chunk_size,
+                timer=stage,
+            )
+            if self.geologies is not None:
+                self.geologies[key] = scenario
+        else:
+            scenario.mesh = self.mesh
+            scenario.background = self.params.model.background
+            scenario.chunk_size = self.params.model.chunk_size
+            scenario.history = history
+
+        return scenario
+
+    @staticmethod
+    def property_values(
+        scenario: Geology,
+        geology: np.ndarray,
+        event_map: EventMap,
+        harmonic: bool = False,
+    ) -> np.ndarray:
+        """
+        Physical property values of a built scenario.
+
+        Cells partially occupied by an event hold the volume average of the
+        event and host values.
+
+        :param scenario: Geological scenario of the last build.
+        :param geology: Categorical model of event ids.
+        :param event_map: Names and physical property values of the events.
+        :param harmonic: Use the harmonic mean for volume averaging.
+        """
+        physical_property_map = {k: v[1] for k, v in event_map.items()}
+        lookup = np.full(max(physical_property_map) + 1, np.nan)
+        lookup[list(physical_property_map)] = list(physical_property_map.values())
+        values = lookup[geology]
+        for event_id, indices, fractions, hosts in scenario.fractions:
+            host_values = lookup[hosts]
+            blended = np.isfinite(host_values)
+            values[indices[blended]] = volume_average(
+                host_values[blended],
+                lookup[event_id],
+                fractions[blended],
+                harmonic=harmonic,
+            )
+
+        return values
+
     @staticmethod
     def start(ifile: str | Path | InputFile):
         """Run the plate simulation driver from an input file."""
@@ -301,10 +796,13 @@ class PlateSimulationDriver:
             )
             return None
 
-        with ifile.geoh5.open():  # type: ignore
-            params = PlateSimulationParams.build(ifile)
+        report = StageReport()
+        with tracing():
+            with report.activate(), stage("build parameters"):
+                with ifile.geoh5.open():  # type: ignore
+                    params = PlateSimulationParams.build(ifile)
 
-        return PlateSimulationDriver(params).run()
+            return PlateSimulationDriver(params, report=report).run()
 
 
 if __name__ == "__main__":
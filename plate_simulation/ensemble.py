@@ -0,0 +1,279 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import csv
+import json
+from argparse import ArgumentParser
+from copy import copy
+from pathlib import Path
+from typing import Any
+
+from geoh5py.groups import UIJsonGroup
+from geoh5py.objects import Octree
+from geoh5py.ui_json import InputFile
+from simpeg_drivers.params import InversionBaseParams
+
+from plate_simulation.driver import PlateSimulationDriver
+from plate_simulation.logger import get_logger
+from plate_simulation.mesh.params import MeshParams
+from plate_simulation.models.params import ModelParams, OverburdenParams, PlateParams
+from plate_simulation.models.series import Geology
+from plate_simulation.params import PlateSimulationParams
+from plate_simulation.sweep import apply_trial
+from plate_simulation.tracer import active_workspace
+
+
+SCENARIO_LABEL = "scenario"
+
+
+def parse_value(value: str) -> Any:
+    """
+    Value of a parameter table entry.
+
+    Numbers, booleans and lists are read as json, other entries are kept as
+    strings.
+
+    :param value: Entry of the parameter table.
+    """
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return value
+
+
+def read_scenarios(path: str | Path) -> list[dict[str, Any]]:
+    """
+    Parameter values of the scenarios of an ensemble.
+
+    The table is either a csv file with one column per parameter and one row
+    per scenario, empty entries keeping the shared value, or a json file
+    holding a list of scenarios or a sweep lookup of scenarios by name.
+
+    :param path: Path to the parameter table.
+
+    :return: Values of the varied parameters for each scenario, by name.
+    """
+    path = Path(path)
+    if path.suffix == ".csv":
+        with open(path, encoding="utf8", newline="") as file:
+            return [
+                {
+                    name: value if name == SCENARIO_LABEL else parse_value(value)
+                    for name, value in row.items()
+                    if value not in [None, ""]
+                }
+                for row in csv.DictReader(file)
+            ]
+
+    with open(path, encoding="utf8") as file:
+        table = json.load(file)
+
+    if isinstance(table, dict):
+        return [
+            {
+                SCENARIO_LABEL: label,
+                **{name: value for name, value in values.items() if name != "status"},
+            }
+            for label, values in table.items()
+        ]
+
+    return list(table)
+
+
+def apply_scenario(
+    params: PlateSimulationParams, scenario: dict[str, Any]
+) -> PlateSimulationParams:
+    """
+    Simulation parameters updated with the values of a scenario.
+
+    The output group is reset, so that each scenario stores its results in
+    its own group.
+
+    :param params: Parameters shared by the scenarios.
+    :param scenario: Values of the varied parameters, by name.
+    """
+    names = {SCENARIO_LABEL}
+    for model in [MeshParams, ModelParams, PlateParams, OverburdenParams]:
+        names |= set(model.model_fields)
+
+    unknown = set(scenario) - names
+    if unknown:
+        raise ValueError(f"Unknown scenario parameters: {sorted(unknown)}.")
+
+    mesh = MeshParams.model_validate(
+        {
+            **params.mesh.model_dump(),
+            **{k: v for k, v in scenario.items() if k in MeshParams.model_fields},
+        }
+    )
+    model = ModelParams.model_validate(apply_trial(params.model, scenario).model_dump())
+
+    return params.model_copy(update={"mesh": mesh, "model": model, "out_group": None})
+
+
+def copy_parameters(parameters: InversionBaseParams) -> InversionBaseParams:
+    """
+    Copy of parsed simulation parameters.
+
+    The entities of the workspace are shared, while the values and the data
+    of the input file are copied, so that setting the mesh or model of one
+    scenario leaves the others unchanged.
+
+    :param parameters: Parsed simulation parameters.
+    """
+    duplicate = copy(parameters)
+    input_file = parameters.input_file
+    if input_file is not None and input_file.ui_json is not None:
+        data = input_file.data
+        input_file = copy(input_file)
+        # pylint: disable=protected-access
+        input_file._ui_json = {
+            name: dict(form) if isinstance(form, dict) else form
+            for name, form in input_file.ui_json.items()
+        }
+        input_file._data = None if data is None else dict(data)
+        duplicate._input_file = input_file
+
+    return duplicate
+
+
+class Ensemble:
+    """
+    Run the plate simulations of many scenarios on one survey in a single
+    process.
+
+    The simulation options are parsed once, and the survey, topography and
+    the meshes of scenarios with identical mesh inputs are shared between
+    the scenarios, along with the geology built on each mesh, so that only
+    the events changed by a scenario are realized again. Each scenario stores its results in its own output group.
+
+    :param params: Parameters shared by the scenarios.
+    :param scenarios: Values of the varied parameters for each scenario, by
+        name. An optional 'scenario' entry labels the output group.
+    """
+
+    def __init__(self, params: PlateSimulationParams, scenarios: list[dict[str, Any]]):
+        self.params = params
+        self.scenarios = scenarios
+        self.meshes: dict[str, Octree] = {}
+        self.geologies: dict[str, Geology] = {}
+
+        self._simulation_parameters: InversionBaseParams | None = None
+        self._logger = get_logger("Plate Simulation Ensemble")
+
+    def label(self, index: int) -> str:
+        """
+        Label of a scenario.
+
+        :param index: Index of the scenario.
+        """
+        return str(self.scenarios[index].get(SCENARIO_LABEL, index))
+
+    def driver(self, index: int) -> PlateSimulationDriver:
+        """
+        Driver of a scenario, sharing the setup of the ensemble.
+
+        :param index: Index of the scenario.
+        """
+        scenario = self.scenarios[index]
+        params = apply_scenario(self.params, scenario)
+        simulation_parameters = None
+        if self._simulation_parameters is not None:
+            simulation_parameters = copy_parameters(self._simulation_parameters)
+        driver = PlateSimulationDriver(
+            params,
+            simulation_parameters=simulation_parameters,
+            meshes=self.meshes,
+            geologies=self.geologies,
+            trials=[
+                {k: v for k, v in values.items() if k != SCENARIO_LABEL}
+                for values in self.scenarios
+            ],
+        )
+        if self._simulation_parameters is None:
+            self._simulation_parameters = copy_parameters(driver.simulation_parameters)
+
+        with active_workspace(params.geoh5, mode="r+"):
+            driver.out_group.name = f"Plate Simulation: {self.label(index)}"
+            options = driver.out_group.options
+            for name, value in scenario.items():
+                if isinstance(options.get(name), dict):
+                    options[name]["value"] = value
+            driver.out_group.options = options
+
+        return driver
+
+    def run(self) -> list[UIJsonGroup | None]:
+        """
+        Simulate all the scenarios.
+
+        Failed scenarios are logged, and the remaining scenarios simulated.
+
+        :return: Output group of each scenario, or None if it failed.
+        """
+        results: list[UIJsonGroup | None] = []
+        with active_workspace(self.params.geoh5, mode="r+"):
+            for index in range(len(self.scenarios)):
+                self._logger.info(
+                    "simulating scenario '%s' (%i/%i)...",
+                    self.label(index),
+                    index + 1,
+                    len(self.scenarios),
+                )
+                try:
+                    driver = self.driver(index)
+                    driver.run()
+                    results.append(driver.out_group)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    self._logger.exception("scenario '%s' failed.", self.label(index))
+                    results.append(None)
+
+        failed = sum(result is None for result in results)
+        self._logger.info(
+            "done: %i of %i scenarios failed.", failed, len(self.scenarios)
+        )
+
+        return results
+
+    @classmethod
+    def start(
+        cls, ifile: str | Path | InputFile, table: str | Path
+    ) -> list[UIJsonGroup | None]:
+        """
+        Run the scenarios of a parameter table from an input file.
+
+        :param ifile: Input file of the parameters shared by the scenarios.
+        :param table: Path to the parameter table, read by
+            :func:`read_scenarios`.
+        """
+        if isinstance(ifile, str):
+            ifile = Path(ifile)
+
+        if isinstance(ifile, Path):
+            ifile = InputFile.read_ui_json(ifile)
+
+        if ifile.data is None:
+            raise ValueError("Input file has no data loaded.")
+
+        with ifile.geoh5.open():  # type: ignore
+            params = PlateSimulationParams.build(ifile)
+
+        return cls(params, read_scenarios(table)).run()
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description="Run the plate simulations of a table of scenarios."
+    )
+    parser.add_argument("ui_json", help="Input file of the shared parameters.")
+    parser.add_argument("table", help="Csv or json table of scenario parameters.")
+    args = parser.parse_args()
+    Ensemble.start(Path(args.ui_json), Path(args.table))
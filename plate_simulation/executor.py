@@ -0,0 +1,301 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from argparse import ArgumentParser
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from geoh5py.ui_json import InputFile
+from param_sweeps.driver import SweepDriver, SweepParams
+
+from plate_simulation.driver import PlateSimulationDriver
+from plate_simulation.logger import get_logger
+from plate_simulation.params import PlateSimulationParams
+from plate_simulation.sweep import LOOKUP_FILE
+
+
+THREAD_VARIABLES = [
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "NUMBA_NUM_THREADS",
+]
+
+
+@contextmanager
+def thread_limits(threads: int) -> Iterator[None]:
+    """
+    Limit the threads of the numerical libraries of the processes started
+    within the context.
+
+    :param threads: Number of threads per process.
+    """
+    previous = {name: os.environ.get(name) for name in THREAD_VARIABLES}
+    os.environ.update({name: str(threads) for name in THREAD_VARIABLES})
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def run_member(path: str, threads: int) -> None:
+    """
+    Simulate a member of a sweep from its input file.
+
+    :param path: Path to the input file of the member.
+    :param threads: Number of threads used by the simulation.
+    """
+    ifile = InputFile.read_ui_json(path)
+    with ifile.geoh5.open():  # type: ignore
+        params = PlateSimulationParams.build(ifile)
+
+    driver = PlateSimulationDriver(params)
+    driver.simulation_parameters.n_cpu = threads
+    driver.run()
+
+
+class SweepExecutor:
+    """
+    Run the members of a sweep on a pool of local processes.
+
+    Members are read from the sweep lookup file, and dispatched from a queue
+    to the workers as they become available. Each member writes to its own
+    workspace, and the status of the members is tracked in the lookup file,
+    so that an interrupted sweep resumes with the members not yet complete.
+
+    :param directory: Directory of the sweep, holding the lookup file and the
+        input files of the members.
+    :param processes: Number of worker processes, defaults to the number of
+        cores divided by the threads per worker.
+    :param threads: Number of threads used by each worker.
+    :param retries: Number of times a failed member is run again.
+    :param runner: Function simulating a member from the path to its input
+        file and the number of threads.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        processes: int | None = None,
+        threads: int = 1,
+        retries: int = 1,
+        runner: Callable[[str, int], Any] = run_member,
+    ):
+        self.directory = Path(directory)
+        self.threads = threads
+        self.processes = processes or max(1, (os.cpu_count() or 1) // threads)
+        self.retries = retries
+        self.runner = runner
+
+        self._logger = get_logger("Plate Simulation Sweep")
+
+    @property
+    def lookup_path(self) -> Path:
+        """Path to the sweep lookup file."""
+        return self.directory / LOOKUP_FILE
+
+    def read_lookup(self) -> dict[str, dict[str, Any]]:
+        """Parameter values and status of the members, by name."""
+        with open(self.lookup_path, encoding="utf8") as file:
+            return json.load(file)
+
+    def write_lookup(self, lookup: dict[str, dict[str, Any]]):
+        """
+        Save the parameter values and status of the members.
+
+        The lookup is first written to a temporary file, and moved in place
+        once complete.
+
+        :param lookup: Parameter values and status of the members, by name.
+        """
+        temporary = self.directory / f".{LOOKUP_FILE}-{uuid4().hex}"
+        with open(temporary, "w", encoding="utf8") as file:
+            json.dump(lookup, file, indent=4)
+
+        os.replace(temporary, self.lookup_path)
+
+    def input_path(self, name: str) -> Path:
+        """
+        Path to the input file of a member.
+
+        :param name: Name of the member.
+        """
+        return self.directory / f"{name}.ui.json"
+
+    def pending(self, lookup: dict[str, dict[str, Any]]) -> list[str]:
+        """
+        Members with an input file that are not complete.
+
+        :param lookup: Parameter values and status of the members, by name.
+        """
+        return [
+            name
+            for name, trial in lookup.items()
+            if trial.get("status") != "complete" and self.input_path(name).is_file()
+        ]
+
+    def run(self) -> dict[str, str]:
+        """
+        Simulate the pending members of the sweep.
+
+        A member failing more than the number of retries is marked as failed,
+        and the remaining members simulated. If a worker dies, the pool is
+        restarted and the members it was running are run again one at a time,
+        so that only the member whose worker died counts the failure.
+
+        :return: Status of each member, by name.
+        """
+        lookup = self.read_lookup()
+        queue = deque(self.pending(lookup))
+        attempts = dict.fromkeys(queue, 0)
+        isolated: set[str] = set()
+        running: dict[Future, str] = {}
+        executor: ProcessPoolExecutor | None = None
+        finished, failed, start = 0, 0, time.perf_counter()
+
+        self._logger.info(
+            "running %i members on %i processes of %i threads...",
+            len(queue),
+            self.processes,
+            self.threads,
+        )
+        with thread_limits(self.threads):
+            try:
+                while queue or running:
+                    if executor is None:
+                        executor = ProcessPoolExecutor(
+                            self.processes, mp_context=get_context("spawn")
+                        )
+
+                    limit = 1 if isolated else self.processes
+                    while queue and len(running) < limit:
+                        name = queue.popleft()
+                        lookup[name]["status"] = "processing"
+                        future = executor.submit(
+                            self.runner, str(self.input_path(name)), self.threads
+                        )
+                        running[future] = name
+                    self.write_lookup(lookup)
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    broken = any(
+                        isinstance(future.exception(), BrokenProcessPool)
+                        for future in done
+                    )
+                    if broken:
+                        done, _ = wait(running)
+
+                    alone = len(running) == 1
+                    for future in done:
+                        name = running.pop(future)
+                        error = future.exception()
+                        if isinstance(error, BrokenProcessPool) and not alone:
+                            isolated.add(name)
+                            lookup[name]["status"] = "pending"
+                            queue.appendleft(name)
+                            continue
+
+                        attempts[name] += 1
+                        if error is None:
+                            lookup[name]["status"] = "complete"
+                        elif attempts[name] <= self.retries:
+                            self._logger.warning(
+                                "member %s failed with '%s', retrying...", name, error
+                            )
+                            lookup[name]["status"] = "pending"
+                            if name in isolated:
+                                queue.appendleft(name)
+                            else:
+                                queue.append(name)
+                            continue
+                        else:
+                            self._logger.error(
+                                "member %s failed with '%s'.", name, error
+                            )
+                            lookup[name]["status"] = "failed"
+                            failed += 1
+
+                        isolated.discard(name)
+                        finished += 1
+                        elapsed = time.perf_counter() - start
+                        self._logger.info(
+                            "%i/%i members done, %i failed, about %.0f s remaining.",
+                            finished,
+                            len(attempts),
+                            failed,
+                            elapsed / finished * (len(attempts) - finished),
+                        )
+
+                    if broken:
+                        executor.shutdown(wait=False)
+                        executor = None
+            finally:
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
+                self.write_lookup(lookup)
+
+        return {name: lookup[name]["status"] for name in attempts}
+
+    @classmethod
+    def from_sweep_file(cls, path: str | Path, **kwargs) -> SweepExecutor:
+        """
+        Executor of the sweep defined by a sweep input file.
+
+        The lookup file and the input file and workspace of each member are
+        written next to the sweep workspace, as with param-sweeps.
+
+        :param path: Path to the sweep input file.
+        :param kwargs: Arguments of the executor.
+        """
+        ifile = InputFile.read_ui_json(path)
+        driver = SweepDriver(SweepParams.from_input_file(ifile))
+
+        return cls(driver.working_directory, **kwargs)
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description="Run the members of a sweep on a pool of local processes."
+    )
+    parser.add_argument(
+        "sweep", help="Sweep input file, or directory of a generated sweep."
+    )
+    parser.add_argument("--processes", type=int, help="Number of worker processes.")
+    parser.add_argument(
+        "--threads", type=int, default=1, help="Number of threads per worker."
+    )
+    parser.add_argument(
+        "--retries", type=int, default=1, help="Number of retries of failed members."
+    )
+    args = parser.parse_args()
+    options = {
+        "processes": args.processes,
+        "threads": args.threads,
+        "retries": args.retries,
+    }
+    if Path(args.sweep).is_dir():
+        SweepExecutor(args.sweep, **options).run()
+    else:
+        SweepExecutor.from_sweep_file(args.sweep, **options).run()
@@ -14,18 +14,28 @@ def get_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """
     Get a logger with a timestamped stream and speciified log level.
 
+    The stream is only added on the first call for a given name, so that
+    repeated calls neither duplicate the messages nor remove the handlers
+    added by the caller.
+
     :param name: Name of the logger.
     :param level: Log level
     """
     logger = logging.getLogger(name)
     logger.setLevel(level)
-    stream_handler = logging.StreamHandler()
-    stream_handler.setLevel(level)
-    formatter = logging.Formatter(
-        "%(asctime)s : %(name)s : %(levelname)s : %(message)s"
+    stream_handler = next(
+        (handler for handler in logger.handlers if handler.get_name() == name),
+        None,
     )
-    stream_handler.setFormatter(formatter)
-    logger.addHandler(stream_handler)
+    if stream_handler is None:
+        stream_handler = logging.StreamHandler()
+        stream_handler.set_name(name)
+        formatter = logging.Formatter(
+            "%(asctime)s : %(name)s : %(levelname)s : %(message)s"
+        )
+        stream_handler.setFormatter(formatter)
+        logger.addHandler(stream_handler)
+    stream_handler.setLevel(level)
     logger.propagate = False
 
     return logger
@@ -0,0 +1,142 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+from geoh5py import Workspace
+from geoh5py.groups import Group
+from geoh5py.objects import ObjectBase, Octree, Surface
+from octree_creation_app import __version__ as octree_version
+
+from plate_simulation.mesh.params import MeshParams
+from plate_simulation.models.cache import fingerprint
+
+
+CACHE_DIRECTORY_VARIABLE = "PLATE_SIMULATION_CACHE"
+
+
+def default_cache_directory() -> Path:
+    """
+    Directory of the mesh cache.
+
+    Set by the PLATE_SIMULATION_CACHE environment variable, and defaults to
+    '.cache/plate_simulation' in the user home directory.
+    """
+    if CACHE_DIRECTORY_VARIABLE in os.environ:
+        return Path(os.environ[CACHE_DIRECTORY_VARIABLE])
+
+    return Path.home() / ".cache" / "plate_simulation"
+
+
+def mesh_fingerprint(
+    params: MeshParams,
+    survey: ObjectBase,
+    topography: Surface,
+    plates: list[Surface],
+) -> str:
+    """
+    Hash of the inputs controlling the octree mesh of a simulation.
+
+    Entities are hashed by their geometry only, so that identical inputs
+    created in different workspaces share the same mesh.
+
+    :param params: Mesh parameters.
+    :param survey: Survey object used to define the mesh extent.
+    :param topography: Topography surface.
+    :param plates: Plate surfaces.
+    """
+    values: list[np.ndarray | str] = [
+        octree_version,
+        params.model_dump_json(
+            exclude={"mesh_cache", "sweep_envelope", "cell_budget", "thin_receivers"}
+        ),
+    ]
+    for entity in [survey, getattr(survey, "complement", None), topography, *plates]:
+        for name in ["vertices", "cells"]:
+            array = getattr(entity, name, None)
+            values.append("none" if array is None else np.asarray(array))
+
+    return fingerprint(*values)
+
+
+class MeshCache:
+    """
+    Store of octree meshes on disk, indexed by the hash of their inputs.
+
+    Each mesh is saved in its own geoh5 file.
+
+    :param directory: Directory of the cache, defaults to
+        :func:`default_cache_directory`.
+    """
+
+    def __init__(self, directory: str | Path | None = None):
+        self.directory = Path(directory or default_cache_directory()) / "meshes"
+
+    def __contains__(self, key: str) -> bool:
+        return self.path(key).exists()
+
+    def path(self, key: str) -> Path:
+        """
+        Path to the geoh5 file storing a mesh.
+
+        :param key: Hash of the inputs of the mesh.
+        """
+        return self.directory / f"{key}.geoh5"
+
+    def fetch(self, key: str, parent: Group | Workspace) -> Octree | None:
+        """
+        Copy a stored mesh into a workspace.
+
+        :param key: Hash of the inputs of the mesh.
+        :param parent: Group or workspace receiving the copy.
+
+        :return: Copied mesh, or None if the mesh is not stored.
+        """
+        if key not in self:
+            return None
+
+        with Workspace(self.path(key), mode="r") as workspace:
+            meshes = [
+                entity for entity in workspace.objects if isinstance(entity, Octree)
+            ]
+            if not meshes:
+                return None
+
+            mesh = meshes[0].copy(parent=parent, copy_children=False)
+
+        if not isinstance(mesh, Octree):
+            return None
+
+        return mesh
+
+    def store(self, key: str, mesh: Octree) -> Path:
+        """
+        Save a mesh under the hash of its inputs.
+
+        The mesh is first written to a temporary file, and moved in place
+        once complete, so that concurrent runs never read partial files.
+
+        :param key: Hash of the inputs of the mesh.
+        :param mesh: Mesh to be stored.
+
+        :return: Path to the stored file.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary = self.directory / f".{key}-{uuid4().hex}.geoh5"
+        with Workspace.create(temporary) as workspace:
+            mesh.copy(parent=workspace, copy_children=False)
+
+        os.replace(temporary, self.path(key))
+
+        return self.path(key)
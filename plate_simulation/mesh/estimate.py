@@ -0,0 +1,505 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import numpy as np
+from geoh5py.objects import ObjectBase, Surface
+from octree_creation_app.driver import OctreeDriver
+from pydantic import BaseModel
+from scipy.interpolate import LinearNDInterpolator
+from scipy.spatial import Delaunay, cKDTree
+
+from plate_simulation.mesh.params import MeshParams, survey_locations
+from plate_simulation.mesh.receivers import refinement_locations, survey_entities
+
+
+CELL_BYTES = 1024
+"""Approximate storage of the mesh, its operators and models per cell."""
+
+CHILDREN = np.indices((2, 2, 2)).reshape(3, -1).T
+
+
+class MeshEstimate(BaseModel):
+    """
+    Predicted size of an octree mesh.
+
+    :param n_cells: Number of cells.
+    :param n_active: Number of cells below topography.
+    :param n_receivers: Number of receivers of the survey.
+    :param cells_per_level: Number of cells of each size, from the base
+        cell size upward.
+    """
+
+    n_cells: int
+    n_active: int
+    n_receivers: int
+    cells_per_level: list[int]
+
+    def memory(self, components: int = 1) -> float:
+        """
+        Approximate memory used by a simulation on the mesh, in bytes.
+
+        Adds the storage of a dense sensitivity matrix over the active cells,
+        as held by potential field simulations, to that of the mesh.
+
+        :param components: Number of data components stored per receiver
+            in the sensitivity matrix. Use zero for simulations that do not
+            store a sensitivity.
+        """
+        sensitivity = 8.0 * self.n_active * self.n_receivers * components
+        return self.n_cells * CELL_BYTES + sensitivity
+
+
+class ShellRefinement:
+    """
+    Refinement around a cloud of points, by distance to the points.
+
+    :param locations: Points sampling the refined object.
+    :param reach: Distance refined around the points for each cell size,
+        from the base cell size upward, or None for sizes left unrefined.
+    """
+
+    def __init__(self, locations: np.ndarray, reach: list[float | None]):
+        self.tree = cKDTree(locations)
+        self.reach = reach
+        self._locations = np.vstack([locations, np.full(3, np.inf)])
+
+    def split(self, centers: np.ndarray, size: np.ndarray, level: int) -> np.ndarray:
+        """
+        Cells required to be divided by the refinement.
+
+        :param centers: Centers of the cells.
+        :param size: Size of the cells along each axis.
+        :param level: Level of the cells, zero being the base cell size.
+        """
+        radius = balanced_reach(self.reach, level, size[0] / 2**level)
+        if radius is None:
+            return np.zeros(len(centers), dtype=bool)
+
+        half = size / 2.0
+        bound = radius + np.linalg.norm(half)
+        near = self.tree.query(centers, distance_upper_bound=bound)[0] < bound
+        _, index = self.tree.query(
+            centers[near], k=min(8, self.tree.n), distance_upper_bound=bound
+        )
+        index = index.reshape(np.sum(near), -1)
+        gap = np.abs(self._locations[index] - centers[near, None, :]) - half
+        split = np.zeros(len(centers), dtype=bool)
+        split[near] = np.linalg.norm(np.maximum(gap, 0.0), axis=2).min(axis=1) <= radius
+
+        return split
+
+    @classmethod
+    def from_points(
+        cls, locations: np.ndarray, levels: list[int], cell_size: float
+    ) -> ShellRefinement:
+        """
+        Refinement by balls of increasing radius around points.
+
+        Mirrors :meth:`OctreeDriver.refine_tree_from_points`.
+
+        :param locations: Refined points.
+        :param levels: Number of cells requested at each level.
+        :param cell_size: Base cell size along the first axis.
+        """
+        radii = cell_size * np.cumsum(
+            np.asarray(levels) * 2.0 ** np.arange(len(levels))
+        )
+
+        return cls(
+            locations, [float(radius) if radius > 0 else None for radius in radii]
+        )
+
+    @classmethod
+    def from_surface(
+        cls,
+        vertices: np.ndarray,
+        cells: np.ndarray,
+        levels: list[int],
+        cell_size: float,
+    ) -> ShellRefinement:
+        """
+        Refinement by layers of cells along a triangulated surface.
+
+        Mirrors :meth:`OctreeDriver.refine_tree_from_triangulation`, with
+        layers added on both sides of the surface.
+
+        :param vertices: Vertices of the surface.
+        :param cells: Triangles of the surface.
+        :param levels: Number of cells requested at each level.
+        :param cell_size: Base cell size along the first axis.
+        """
+        reach: list[float | None] = []
+        offset = 0.0
+        for level, n_cells in enumerate(levels):
+            if n_cells == 0:
+                reach.append(reach[-1] if reach else None)
+                continue
+
+            offset += (n_cells - 1) * cell_size * 2**level
+            reach.append(offset)
+            offset += cell_size * 2**level
+
+        return cls(surface_samples(vertices, cells, cell_size / 2.0), reach)
+
+
+class HorizonRefinement:
+    """
+    Refinement by layers of cells below a surface.
+
+    Mirrors :meth:`OctreeDriver.refine_tree_from_surface`.
+
+    :param surface: Refined surface.
+    :param levels: Number of cells requested at each level.
+    :param max_distance: Horizontal distance to the vertices of the surface
+        beyond which cells are not refined.
+    :param cell_size: Base cell size along the vertical axis.
+    """
+
+    def __init__(
+        self,
+        surface: Surface,
+        levels: list[int],
+        max_distance: float,
+        cell_size: float,
+    ):
+        vertices = surface.vertices
+        triangulation = Delaunay(vertices[:, :2])
+        self.elevation = LinearNDInterpolator(triangulation, vertices[:, 2])
+        self.heights = vertices[:, 2]
+        self.tree = cKDTree(vertices[:, :2])
+        self.extent = np.vstack(
+            [vertices[:, :2].min(axis=0), vertices[:, :2].max(axis=0)]
+        )
+        self.max_distance = max_distance
+        self.slope = max_slope(triangulation, vertices[:, 2])
+
+        self.depths: list[tuple[float, float] | None] = []
+        depth = 0.0
+        for level, n_cells in enumerate(levels):
+            if n_cells == 0:
+                self.depths.append(self.depths[-1] if self.depths else None)
+                continue
+
+            top = depth + cell_size * 2**level
+            depth += n_cells * cell_size * 2**level
+            self.depths.append(
+                (top, depth)
+                if not self.depths or self.depths[-1] is None
+                else (self.depths[-1][0], depth)
+            )
+
+    def surface_elevation(self, locations: np.ndarray) -> np.ndarray:
+        """
+        Elevation of the surface, extended horizontally by its nearest vertex.
+
+        :param locations: Horizontal coordinates of the locations.
+        """
+        elevation = self.elevation(locations)
+        missing = np.isnan(elevation)
+        _, nearest = self.tree.query(locations[missing])
+        elevation[missing] = self.heights[nearest]
+
+        return elevation
+
+    def below(self, locations: np.ndarray) -> np.ndarray:
+        """
+        Locations below the surface.
+
+        :param locations: Locations to be tested.
+        """
+        return locations[:, 2] < self.surface_elevation(locations[:, :2])
+
+    def split(self, centers: np.ndarray, size: np.ndarray, level: int) -> np.ndarray:
+        """
+        Cells required to be divided by the refinement.
+
+        :param centers: Centers of the cells.
+        :param size: Size of the cells along each axis.
+        :param level: Level of the cells, zero being the base cell size.
+        """
+        base = size[2] / 2**level
+        spread = None
+        for finer in range(min(level, len(self.depths))):
+            if self.depths[finer] is None:
+                continue
+            extension = base * (2**level - 2 ** (finer + 1))
+            top, bottom = self.depths[finer]
+            spread = (
+                (top - extension, bottom + extension)
+                if spread is None
+                else (
+                    min(spread[0], top - extension),
+                    max(spread[1], bottom + extension),
+                )
+            )
+
+        if spread is None:
+            return np.zeros(len(centers), dtype=bool)
+
+        half = size / 2.0
+        gap = centers[:, :2] - np.clip(centers[:, :2], *self.extent)
+        distance, _ = self.tree.query(centers[:, :2])
+        elevation = self.surface_elevation(centers[:, :2])
+        relief = self.slope * np.linalg.norm(half[:2])
+
+        return (
+            np.all(np.abs(gap) < half[:2], axis=1)
+            & (distance - np.linalg.norm(half[:2]) < self.max_distance)
+            & (centers[:, 2] - half[2] <= elevation - spread[0] + relief)
+            & (centers[:, 2] + half[2] >= elevation - spread[1] - relief)
+        )
+
+
+def balanced_reach(
+    reach: list[float | None], level: int, cell_size: float
+) -> float | None:
+    """
+    Distance around an object within which cells of a level are divided.
+
+    Includes the transition imposed by the 2:1 balance of the octree.
+
+    :param reach: Distance refined for each level, from the base cell size
+        upward, or None for levels left unrefined.
+    :param level: Level of the cells.
+    :param cell_size: Base cell size.
+    """
+    radii = [
+        distance + cell_size * (2**level - 2 ** (finer + 1))
+        for finer, distance in enumerate(reach[:level])
+        if distance is not None
+    ]
+    return max(radii) if radii else None
+
+
+def max_slope(triangulation: Delaunay, elevation: np.ndarray) -> float:
+    """
+    Steepest gradient of a piecewise linear surface.
+
+    :param triangulation: Horizontal triangulation of the surface.
+    :param elevation: Elevation of the vertices.
+    """
+    corners = triangulation.points[triangulation.simplices]
+    heights = elevation[triangulation.simplices]
+    matrix = corners[:, 1:, :] - corners[:, :1, :]
+    values = heights[:, 1:] - heights[:, :1]
+    valid = np.abs(np.linalg.det(matrix)) > 0.0
+    if not np.any(valid):
+        return 0.0
+
+    gradients = np.linalg.solve(matrix[valid], values[valid][..., None])[..., 0]
+
+    return float(np.linalg.norm(gradients, axis=1).max())
+
+
+def surface_samples(
+    vertices: np.ndarray, cells: np.ndarray, spacing: float
+) -> np.ndarray:
+    """
+    Points sampling the triangles of a surface at regular intervals.
+
+    :param vertices: Vertices of the surface.
+    :param cells: Triangles of the surface.
+    :param spacing: Maximum distance between samples along the edges.
+    """
+    corners = vertices[cells]
+    edges = np.linalg.norm(corners - np.roll(corners, 1, axis=1), axis=2).max(axis=1)
+    divisions = np.maximum(np.ceil(edges / spacing), 1).astype(int)
+
+    samples = []
+    for count in np.unique(divisions):
+        i, j = np.meshgrid(np.arange(count + 1), np.arange(count + 1))
+        keep = i + j <= count
+        weights = np.c_[count - i[keep] - j[keep], i[keep], j[keep]] / count
+        samples.append(
+            np.einsum("sk,tkd->tsd", weights, corners[divisions == count]).reshape(
+                -1, 3
+            )
+        )
+
+    return np.vstack(samples)
+
+
+def estimate_mesh(
+    params: MeshParams,
+    survey: ObjectBase,
+    topography: Surface,
+    plates: list[Surface],
+) -> MeshEstimate:
+    """
+    Predict the size of the octree mesh built from parameters.
+
+    The refinements of the mesh are replayed on the cells of the tree, level
+    by level, and only the number of cells is kept. Cells are divided
+    wherever a refinement reaches them, including the transition imposed by
+    the 2:1 balance of the octree.
+
+    :param params: Mesh parameters.
+    :param survey: Survey object used to define the mesh extent.
+    :param topography: Topography surface.
+    :param plates: Plate surfaces.
+
+    :return: Estimated number of cells, active cells and receivers.
+    """
+    mesh = params.base_mesh(survey)
+    base = np.r_[mesh.h[0][0], mesh.h[1][0], mesh.h[2][0]]
+    shape = np.array([len(h) for h in mesh.h])
+    coarsest = int(np.log2(shape.min()))
+    forced = mesh.max_level - OctreeDriver.minimum_level(mesh, params.minimum_level)
+
+    horizon = HorizonRefinement(
+        topography,
+        params.topography_refinement,
+        params.topography_distance,
+        base[2],
+    )
+    refinements: list[ShellRefinement | HorizonRefinement] = [
+        ShellRefinement.from_points(
+            np.vstack(
+                [
+                    refinement_locations(entity, base[0])
+                    for entity in survey_entities(survey)
+                ]
+            ),
+            params.survey_refinement,
+            base[0],
+        ),
+        horizon,
+    ]
+    if plates:
+        vertices = np.vstack([plate.vertices for plate in plates])
+        offsets = np.cumsum([0] + [plate.n_vertices for plate in plates[:-1]])
+        cells = np.vstack(
+            [
+                plate.cells + offset
+                for plate, offset in zip(plates, offsets, strict=True)
+            ]
+        )
+        refinements.append(
+            ShellRefinement.from_surface(
+                vertices, cells, params.plate_refinement, base[0]
+            )
+        )
+
+    blocks = np.indices(shape // 2**coarsest).reshape(3, -1).T
+    cells_per_level = [0] * (coarsest + 1)
+    n_active = 0
+    for level in range(coarsest, -1, -1):
+        size = base * 2**level
+        centers = mesh.origin + (blocks + 0.5) * size
+        split = np.full(len(blocks), level > forced and level > 0)
+        for refinement in refinements:
+            if level == 0 or np.all(split):
+                break
+            split[~split] = refinement.split(centers[~split], size, level)
+
+        cells_per_level[level] = int(np.sum(~split))
+        n_active += int(np.sum(horizon.below(centers[~split])))
+        blocks = (2 * blocks[split][:, None, :] + CHILDREN).reshape(-1, 3)
+
+    return MeshEstimate(
+        n_cells=sum(cells_per_level),
+        n_active=n_active,
+        n_receivers=len(survey.vertices),
+        cells_per_level=cells_per_level,
+    )
+
+
+def coarsen_levels(levels: list[int]) -> list[int] | None:
+    """
+    Remove one cell from the coarsest refinement level.
+
+    :param levels: Number of cells requested at each level.
+
+    :return: Reduced levels, or None if a single cell is left.
+    """
+    if sum(levels) <= 1:
+        return None
+
+    reduced = list(levels)
+    coarsest = max(level for level, n_cells in enumerate(reduced) if n_cells > 0)
+    reduced[coarsest] -= 1
+    while len(reduced) > 1 and reduced[-1] == 0:
+        reduced.pop()
+
+    return reduced
+
+
+def fit_cell_budget(
+    params: MeshParams,
+    survey: ObjectBase,
+    topography: Surface,
+    plates: list[Surface],
+    budget: int | None = None,
+) -> tuple[MeshParams, MeshEstimate]:
+    """
+    Reduce the mesh parameters until the estimated mesh fits a cell budget.
+
+    The padding distance and core depth are halved first, for as long as
+    it removes cells, while still holding the survey refinement and the
+    plates. The coarsest level of the survey, topography or plate
+    refinements is then lowered one cell at a time, picking the refinement
+    that removes the most cells, or the fewest among those meeting the
+    budget.
+
+    :param params: Mesh parameters.
+    :param survey: Survey object used to define the mesh extent.
+    :param topography: Topography surface.
+    :param plates: Plate surfaces.
+    :param budget: Maximum number of cells, defaults to the cell budget of
+        the parameters.
+
+    :return: Reduced parameters, and the estimate of their mesh.
+    """
+    budget = budget or params.cell_budget
+    if budget is None:
+        raise ValueError("A cell budget is required to fit the mesh parameters.")
+
+    def estimate(values: MeshParams) -> MeshEstimate:
+        return estimate_mesh(values, survey, topography, plates)
+
+    current = estimate(params)
+    reach = params.u_cell_size * sum(
+        n_cells * 2**level for level, n_cells in enumerate(params.survey_refinement)
+    )
+    bottom = survey_locations(survey)[:, 2].min()
+    deepest = min((plate.vertices[:, 2].min() for plate in plates), default=bottom)
+    floors = {"padding_distance": reach, "depth_core": max(0.0, bottom - deepest)}
+    for name, floor in floors.items():
+        while current.n_cells > budget and getattr(params, name) > floor:
+            trial = params.model_copy(
+                update={name: max(floor, getattr(params, name) / 2.0)}
+            )
+            result = estimate(trial)
+            if result.n_cells >= current.n_cells:
+                break
+            params, current = trial, result
+
+    while current.n_cells > budget:
+        trials = []
+        for name in ["survey_refinement", "topography_refinement", "plate_refinement"]:
+            levels = coarsen_levels(getattr(params, name))
+            if levels is not None:
+                trial = params.model_copy(update={name: levels})
+                trials.append((estimate(trial), trial))
+
+        if not trials:
+            raise ValueError(
+                f"Could not fit the mesh within {budget} cells, the smallest "
+                f"mesh found has {current.n_cells} cells."
+            )
+
+        fits = [trial for trial in trials if trial[0].n_cells <= budget]
+        if fits:
+            current, params = max(fits, key=lambda trial: trial[0].n_cells)
+        else:
+            current, params = min(trials, key=lambda trial: trial[0].n_cells)
+
+    return params, current
@@ -9,13 +9,34 @@
 
 from pathlib import Path
 
+import numpy as np
+from discretize import TreeMesh
+from discretize.utils import mesh_builder_xyz
 from geoh5py.objects import ObjectBase, Surface
+from octree_creation_app.driver import OctreeDriver
 from octree_creation_app.params import OctreeParams
 from pydantic import BaseModel
 
+from plate_simulation.mesh.receivers import survey_entities, thin_survey
+from plate_simulation.utils import merge_surfaces
+
+
+def survey_locations(survey: ObjectBase) -> np.ndarray:
+    """
+    Locations of a survey, including those of its complement.
+
+    :param survey: Survey object used to define the mesh extent.
+    """
+    return np.vstack([entity.vertices for entity in survey_entities(survey)])
+
 
 class MeshParams(BaseModel):
-    """Core parameters for octree mesh creation."""
+    """
+    Core parameters for octree mesh creation.
+
+    Refinements are given as the number of cells requested at each level,
+    from the base cell size upward.
+    """
 
     u_cell_size: float
     v_cell_size: float
@@ -25,28 +46,68 @@ class MeshParams(BaseModel):
     max_distance: float
     minimum_level: int = 8
     diagonal_balance: bool = False
+    survey_refinement: list[int] = [4, 4, 4]
+    topography_refinement: list[int] = [0, 2]
+    topography_distance: float = 1000.0
+    plate_refinement: list[int] = [2, 1]
+    cell_budget: int | None = None
+    thin_receivers: bool = False
+    mesh_cache: bool = False
+    sweep_envelope: bool = False
+
+    def base_mesh(self, survey: ObjectBase) -> TreeMesh:
+        """
+        Unrefined tree mesh spanning the extent of the octree mesh.
+
+        Mirrors :meth:`OctreeDriver.base_treemesh`.
+
+        :param survey: Survey object used to define the mesh extent.
+        """
+        locations = survey_locations(survey)
+        mesh = mesh_builder_xyz(
+            locations,
+            [self.u_cell_size, self.v_cell_size, self.w_cell_size],
+            padding_distance=[[self.padding_distance] * 2] * 3,
+            mesh_type="tree",
+            depth_core=self.depth_core,
+            tree_diagonal_balance=self.diagonal_balance,
+        )
+        mesh.origin += OctreeDriver.tree_offset(mesh, locations)
+
+        return mesh
 
     def octree_params(
         self, survey: ObjectBase, topography: Surface, plates: list[Surface]
     ):
+        receivers = [survey]
+        if self.thin_receivers:
+            receivers = thin_survey(
+                survey,
+                self.base_mesh(survey).origin,
+                np.r_[self.u_cell_size, self.v_cell_size, self.w_cell_size],
+            )
+
         refinements = [
             {
-                "refinement_object": survey,
-                "levels": [4, 4, 4],
+                "refinement_object": entity,
+                "levels": self.survey_refinement,
                 "horizon": False,
-            },
+            }
+            for entity in receivers
+        ]
+        refinements.append(
             {
                 "refinement_object": topography,
-                "levels": [0, 2],
+                "levels": self.topography_refinement,
                 "horizon": True,
-                "distance": 1000.0,
-            },
-        ]
-        for plate in plates:
+                "distance": self.topography_distance,
+            }
+        )
+        if plates:
             refinements.append(
                 {
-                    "refinement_object": plate,
-                    "levels": [2, 1],
+                    "refinement_object": merge_surfaces(plates, name="Plates"),
+                    "levels": self.plate_refinement,
                     "horizon": False,
                 }
             )
@@ -0,0 +1,159 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from itertools import product
+
+import numpy as np
+from geoh5py.objects import Curve, ObjectBase, Points
+from geoh5py.objects.surveys.direct_current import BaseElectrode
+from geoh5py.shared.utils import fetch_active_workspace
+from octree_creation_app.utils import densify_curve
+
+
+OCTANTS = np.array(list(product([-1.0, 1.0], repeat=3)))
+
+
+def thin_receivers(
+    locations: np.ndarray,
+    origin: np.ndarray,
+    cell_size: np.ndarray,
+    batch_size: int = 256,
+    chunk_size: int = 2**20,
+) -> np.ndarray:
+    """
+    Receivers refining the same octree cells as the full set of receivers.
+
+    Cells of every level are aligned with the base cells, so each cell lies
+    either across or on one side of a base cell along every axis. The
+    distance from a receiver to a cell then only grows as the receiver moves
+    away from the cell along each axis, and the receivers of a base cell
+    closest to any other cell are found among those not dominated in one of
+    the eight octant directions. Any ball refinement around the kept
+    receivers intersects the same cells as around all the receivers.
+
+    :param locations: Receiver locations.
+    :param origin: Origin of the octree mesh.
+    :param cell_size: Base cell size along each axis.
+    :param batch_size: Maximum number of receivers of a base cell compared
+        with each other.
+    :param chunk_size: Number of receiver pairs compared at once.
+
+    :return: Sorted indices of the kept receivers.
+    """
+    voxels = np.floor((locations - origin) / cell_size).astype(np.int64)
+    _, group = np.unique(voxels, axis=0, return_inverse=True)
+    order = np.argsort(group.ravel(), kind="stable")
+
+    # Receivers of crowded base cells are compared by batches, keeping a
+    # superset of the receivers needed.
+    group = group.ravel()[order]
+    first = np.r_[0, np.flatnonzero(np.diff(group)) + 1]
+    rank = np.arange(len(order)) - np.repeat(first, np.diff(np.r_[first, len(order)]))
+    _, batch, counts = np.unique(
+        np.c_[group, rank // batch_size],
+        axis=0,
+        return_inverse=True,
+        return_counts=True,
+    )
+    sizes = counts[batch.ravel()]
+    keep = np.zeros(len(locations), dtype=bool)
+
+    for size in np.unique(counts):
+        members = order[sizes == size].reshape(-1, size)
+        if size == 1:
+            keep[members.ravel()] = True
+            continue
+
+        earlier = np.tri(size, k=-1, dtype=bool)
+        n_chunks = int(np.ceil(members.size * size / chunk_size))
+        for chunk in np.array_split(members, n_chunks):
+            coordinates = locations[chunk]
+            difference = coordinates[:, None, :, :] - coordinates[:, :, None, :]
+            lower, higher = difference < 0.0, difference > 0.0
+            for signs in OCTANTS:
+                strictly = np.where(signs > 0, lower, higher)
+                closer = ~np.any(np.where(signs > 0, higher, lower), axis=3)
+                dominated = np.any(
+                    closer & (np.any(strictly, axis=3) | earlier), axis=2
+                )
+                keep[chunk[~dominated]] = True
+
+    return np.flatnonzero(keep)
+
+
+def survey_entities(survey: ObjectBase) -> list[ObjectBase]:
+    """
+    Survey object followed by its complement, if any.
+
+    :param survey: Survey object.
+    """
+    if getattr(survey, "complement", None) is not None:
+        return [survey, survey.complement]
+
+    return [survey]
+
+
+def refinement_locations(entity: ObjectBase, cell_size: float) -> np.ndarray:
+    """
+    Locations refined around an object by the octree driver.
+
+    Mirrors :meth:`OctreeDriver.refine_tree_from_curve`, with curves other
+    than electrodes densified by the base cell size.
+
+    :param entity: Points or curve object.
+    :param cell_size: Base cell size along the first axis.
+    """
+    if isinstance(entity, Curve) and not isinstance(entity, BaseElectrode):
+        return densify_curve(entity, cell_size)
+
+    return entity.vertices
+
+
+def thin_survey(
+    survey: ObjectBase, origin: np.ndarray, cell_size: np.ndarray
+) -> list[ObjectBase]:
+    """
+    Points refining the same octree cells as the vertices of a survey and of
+    its complement.
+
+    Curves are thinned along their densified segments, and the complement
+    into separate points, as refining the complement itself would also
+    refine all the vertices of the survey. The points are created next to
+    the survey, and removed by the driver once the mesh is made.
+
+    :param survey: Survey object.
+    :param origin: Origin of the octree mesh.
+    :param cell_size: Base cell size along each axis.
+
+    :return: Points holding the kept receivers and the kept vertices of the
+        complement, or the survey itself if all vertices are needed.
+    """
+    entities = survey_entities(survey)
+    locations = [refinement_locations(entity, cell_size[0]) for entity in entities]
+    indices = [thin_receivers(values, origin, cell_size) for values in locations]
+    if all(
+        len(kept) == len(values)
+        for values, kept in zip(locations, indices, strict=True)
+    ):
+        return [survey]
+
+    with fetch_active_workspace(survey.workspace, mode="r+"):
+        points = [
+            Points.create(
+                survey.workspace,
+                vertices=values[kept],
+                name=f"{entity.name} thinned",
+                parent=survey.parent,
+            )
+            for entity, values, kept in zip(entities, locations, indices, strict=True)
+        ]
+
+    return points
@@ -0,0 +1,166 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from hashlib import blake2b
+from threading import Lock
+
+import numpy as np
+from geoh5py.objects import Octree, Surface
+
+
+def fingerprint(*values: np.ndarray | float | str | None) -> str:
+    """
+    Hash arrays and scalars into a short hexadecimal digest.
+
+    :param values: Arrays or scalars to be hashed.
+    """
+    digest = blake2b(digest_size=16)
+    for value in values:
+        array = np.ascontiguousarray(value)
+        digest.update(str(array.dtype).encode())
+        digest.update(str(array.shape).encode())
+        digest.update(array.tobytes())
+
+    return digest.hexdigest()
+
+
+def surface_key(surface: Surface) -> str:
+    """
+    Identify a surface by the hash of its triangulation.
+
+    Copies of a surface, such as the plates of the members of a sweep, share
+    the same key.
+
+    :param surface: Surface object.
+    """
+    return fingerprint(surface.vertices, surface.cells)
+
+
+_MESH_FINGERPRINTS: dict[Hashable, tuple[weakref.ref, str]] = {}
+
+
+def mesh_key(mesh: Octree) -> str:
+    """
+    Identify an octree mesh by the hash of its geometry.
+
+    The hash is memoized by mesh uid, as long as the octree cells of the mesh
+    are not replaced.
+
+    :param mesh: Octree mesh.
+    """
+    cells = mesh.octree_cells
+    reference, digest = _MESH_FINGERPRINTS.get(mesh.uid, (None, ""))
+    if reference is None or reference() is not cells:
+        digest = fingerprint(
+            cells,
+            np.r_[mesh.origin["x"], mesh.origin["y"], mesh.origin["z"]],
+            np.r_[mesh.u_cell_size, mesh.v_cell_size, mesh.w_cell_size],
+            mesh.rotation,
+        )
+        _MESH_FINGERPRINTS[mesh.uid] = (weakref.ref(cells), digest)
+
+    return digest
+
+
+class MaskCache:
+    """
+    Least-recently-used store of cell masks and fields computed on octree
+    meshes.
+
+    Stored arrays are flagged as read-only so that they can be shared
+    between events.
+
+    :param maxsize: Maximum number of arrays kept in memory.
+    """
+
+    def __init__(self, maxsize: int = 16):
+        self.maxsize = maxsize
+        self._store: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._lock = Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._store
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def clear(self):
+        """Remove all stored arrays."""
+        with self._lock:
+            self._store.clear()
+
+    def fetch(self, key: Hashable, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """
+        Return the array stored under key, computing it on a miss.
+
+        :param key: Hashable identifier of the array.
+        :param compute: Function returning the array if not stored.
+        """
+        with self._lock:
+            if key in self._store:
+                self._store.move_to_end(key)
+                return self._store[key]
+
+        values = compute()
+        values.flags.writeable = False
+
+        with self._lock:
+            self._store[key] = values
+            self._store.move_to_end(key)
+            while len(self._store) > self.maxsize:
+                self._store.popitem(last=False)
+
+        return values
+
+    def fill(
+        self,
+        key: Hashable,
+        size: int,
+        indices: np.ndarray,
+        compute: Callable[[np.ndarray], np.ndarray],
+    ) -> np.ndarray:
+        """
+        Return the entries of a partially computed array, computing the
+        missing ones.
+
+        Partial arrays hold -1 for entries not computed yet, and are only
+        returned as copies of the requested entries.
+
+        :param key: Hashable identifier of the array.
+        :param size: Size of the array.
+        :param indices: Indices of the requested entries.
+        :param compute: Function of the indices of the missing entries
+            returning their value, 0 or 1.
+        """
+        with self._lock:
+            values = self._store.get(key)
+            if values is None:
+                values = np.full(size, -1, dtype=np.int8)
+                self._store[key] = values
+            self._store.move_to_end(key)
+            while len(self._store) > self.maxsize:
+                self._store.popitem(last=False)
+
+            subset = values[indices]
+
+        missing = subset < 0
+        if np.any(missing):
+            subset[missing] = compute(indices[missing])
+            with self._lock:
+                values[indices[missing]] = subset[missing]
+
+        return subset
+
+
+MASK_CACHE = MaskCache()
@@ -8,15 +8,24 @@
 # ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from itertools import product
+from typing import Any
 
 import numpy as np
 from geoh5py.objects import Octree, Surface
-from geoh5py.shared.utils import find_unique_name
-from simpeg_drivers.utils.utils import active_from_xyz
+from geoh5py.shared.utils import find_unique_name, xy_rotation_matrix
+from scipy.spatial import Delaunay, cKDTree
 from trimesh import Trimesh
 from trimesh.proximity import ProximityQuery
 
 from plate_simulation.models import EventMap
+from plate_simulation.models.cache import (
+    MASK_CACHE,
+    fingerprint,
+    mesh_key,
+    surface_key,
+)
 
 
 # pylint: disable=too-few-public-methods
@@ -51,7 +60,45 @@ class Event(ABC):
 
         return event_id, event_map
 
+    @property
+    def extent(self) -> np.ndarray | None:
+        """
+        Axis-aligned extent of the geometry delimiting the event.
+
+        Returned as [[x_min, y_min, z_min], [x_max, y_max, z_max]], or None
+        if the event is not bounded by a geometry.
+        """
+        return None
+
+    @property
+    @abstractmethod
+    def fingerprint(self) -> str:
+        """
+        Hash of the inputs controlling the cells modified by the event.
+
+        Changes to the value or name of the event leave it unchanged.
+        """
+
     @abstractmethod
+    def mask(self, mesh: Octree, indices: np.ndarray | None = None) -> np.ndarray:
+        """
+        True for cells modified by the event.
+
+        :param mesh: Octree mesh on which the model is defined.
+        :param indices: Indices of the cells to be tested, all cells if None.
+        """
+
+    def fraction(self, mesh: Octree) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        Volume fraction of the cells occupied by the event.
+
+        :param mesh: Octree mesh on which the model is defined.
+
+        :return: Indices of the occupied cells and their volume fraction,
+            or None if the event is assigned by its mask only.
+        """
+        return None
+
     def realize(
         self, mesh: Octree, model: np.ndarray, event_map: EventMap
     ) -> tuple[np.ndarray, EventMap]:
@@ -65,6 +112,11 @@ class Event(ABC):
         :return: Updated model and list of events including itself.
         """
 
+        event_id, event_map = self._update_event_map(event_map)
+        model[self.mask(mesh)] = event_id
+
+        return model, event_map
+
 
 class Deposition(Event):
     """
@@ -79,18 +131,22 @@ class Deposition(Event):
         self.surface = Boundary(surface)
         super().__init__(value, name)
 
-    def realize(
-        self, mesh: Octree, model: np.ndarray, event_map: EventMap
-    ) -> tuple[np.ndarray, EventMap]:
+    @property
+    def extent(self) -> np.ndarray:
+        """Axis-aligned extent of the top surface."""
+        return self.surface.extent
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the top surface."""
+        return fingerprint("Deposition", surface_key(self.surface.surface))
+
+    def mask(self, mesh: Octree, indices: np.ndarray | None = None) -> np.ndarray:
         """
         Implementation of parent Event abstract method.
-        Fill the model below the surface with the layer's value.
+        Cells below the surface are filled with the layer's value.
         """
-
-        event_id, event_map = self._update_event_map(event_map)
-        model[self.surface.mask(mesh)] = event_id
-
-        return model, event_map
+        return self.surface.mask(mesh, indices=indices)
 
 
 class Overburden(Event):
@@ -114,19 +170,29 @@ class Overburden(Event):
         self.thickness = thickness
         super().__init__(value, name)
 
-    def realize(
-        self, mesh: Octree, model: np.ndarray, event_map: EventMap
-    ) -> tuple[np.ndarray, EventMap]:
+    @property
+    def extent(self) -> np.ndarray:
+        """Axis-aligned extent of the base of the overburden."""
+        return self.topography.extent - np.r_[0.0, 0.0, self.thickness]
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the topography and thickness."""
+        return fingerprint(
+            "Overburden",
+            surface_key(self.topography.surface),
+            float(self.thickness),
+        )
+
+    def mask(self, mesh: Octree, indices: np.ndarray | None = None) -> np.ndarray:
         """
         Implementation of parent Event abstract method.
-        Fill the model below the topography with the overburden value.
+        Cells above the shifted topography are filled with the overburden
+        value.
         """
-        event_id, event_map = self._update_event_map(event_map)
-        model[
-            ~self.topography.mask(mesh, offset=-1 * self.thickness, reference="center")
-        ] = event_id
-
-        return model, event_map
+        return ~self.topography.mask(
+            mesh, offset=-1 * self.thickness, reference="center", indices=indices
+        )
 
 
 class Erosion(Event):
@@ -143,18 +209,22 @@ class Erosion(Event):
         self.surface = Boundary(surface)
         super().__init__(value, name)
 
-    def realize(
-        self, mesh: Octree, model: np.ndarray, event_map: EventMap
-    ) -> tuple[np.ndarray, EventMap]:
+    @property
+    def extent(self) -> np.ndarray:
+        """Axis-aligned extent of the erosion surface."""
+        return self.surface.extent
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the erosion surface."""
+        return fingerprint("Erosion", surface_key(self.surface.surface))
+
+    def mask(self, mesh: Octree, indices: np.ndarray | None = None) -> np.ndarray:
         """
         Implementation of parent Event abstract method.
-        Fill the model above the surface with nan values.
+        Cells above the surface are eroded.
         """
-
-        event_id, event_map = self._update_event_map(event_map)
-        model[~self.surface.mask(mesh)] = event_id
-
-        return model, event_map
+        return ~self.surface.mask(mesh, indices=indices)
 
 
 class Anomaly(Event):
@@ -165,18 +235,56 @@ class Anomaly(Event):
         with the anomaly value.
     :param value: Model value assigned to the anomaly.
     :param name: Name of the event.
+    :param samples: Number of sub-samples per cell axis used to compute
+        the volume fraction of partially occupied cells. Cells are only
+        assigned by their centroid if None.
     """
 
-    def __init__(self, surface: Surface, value: float, name: str = "Anomaly"):
+    def __init__(
+        self,
+        surface: Surface,
+        value: float,
+        name: str = "Anomaly",
+        samples: int | None = None,
+    ):
         self.body = Body(surface)
+        self.samples = samples
         super().__init__(value, name)
 
+    @property
+    def extent(self) -> np.ndarray:
+        """Axis-aligned extent of the closed surface."""
+        return self.body.extent
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the closed surface and number of sub-samples."""
+        return fingerprint("Anomaly", surface_key(self.body.surface), self.samples or 0)
+
+    def mask(self, mesh: Octree, indices: np.ndarray | None = None) -> np.ndarray:
+        """
+        Implementation of parent Event abstract method.
+        Cells within the surface are filled with the anomaly value.
+        """
+        return self.body.mask(mesh, indices=indices)
+
+    def fraction(self, mesh: Octree) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        Implementation of parent Event method.
+        Cells are sub-sampled if a number of samples is provided.
+        """
+        if self.samples is None:
+            return None
+
+        return self.body.fraction(mesh, self.samples)
+
     def realize(
         self, mesh: Octree, model: np.ndarray, event_map: EventMap, coeval: bool = False
     ) -> tuple[np.ndarray, EventMap]:
         """
-        Implementation of parent Event abstract method.
-        Fill the model within the surface with the anomaly value.
+        Override of parent Event method.
+        Fill the model within the surface with the anomaly value, sharing
+        the last event id if coeval.
         """
 
         if coeval:
@@ -184,7 +292,7 @@ class Anomaly(Event):
         else:
             event_id, event_map = self._update_event_map(event_map)
 
-        model[self.body.mask(mesh)] = event_id
+        model[self.mask(mesh)] = event_id
 
         return model, event_map
 
@@ -199,6 +307,7 @@ class Boundary:
 
     def __init__(self, surface: Surface):
         self.surface = surface
+        self._depth: tuple[tuple[str, ...], np.ndarray] | None = None
 
     def vertical_shift(self, offset: float) -> np.ndarray:
         """
@@ -217,21 +326,82 @@ class Boundary:
         ]
         return self.surface.vertices + shift
 
+    @property
+    def extent(self) -> np.ndarray:
+        """Axis-aligned extent of the surface."""
+        if self.surface.vertices is None:
+            raise ValueError("Surface vertices are not defined.")
+
+        return np.vstack(
+            [self.surface.vertices.min(axis=0), self.surface.vertices.max(axis=0)]
+        )
+
+    def depth(self, mesh: Octree) -> np.ndarray:
+        """
+        Vertical distance from the surface down to the cell centers.
+
+        Positive for cells lying below the surface, and nan for cells outside
+        the convex hull of its vertices. The field is computed once per mesh
+        and shared through the MASK_CACHE, and kept by the boundary, so that
+        chunks of cells reuse it after the masks of other events replaced it
+        in the cache.
+
+        :param mesh: Octree mesh on which the depth is computed.
+        """
+        if self.surface.vertices is None:
+            raise ValueError("Surface vertices are not defined.")
+
+        key = ("depth", surface_key(self.surface), mesh_key(mesh))
+        if self._depth is None or self._depth[0] != key:
+            self._depth = (
+                key,
+                MASK_CACHE.fetch(
+                    key, lambda: depth_below_surface(mesh, self.surface.vertices)
+                ),
+            )
+
+        return self._depth[1]
+
     def mask(
-        self, mesh: Octree, offset: float = 0.0, reference: str = "center"
+        self,
+        mesh: Octree,
+        offset: float = 0.0,
+        reference: str = "center",
+        indices: np.ndarray | None = None,
     ) -> np.ndarray:
         """
         True for cells whose reference lie below the surface.
 
+        The mask is derived from the depth of the cells below the surface,
+        computed once per mesh, so that any offset, reference or subset of
+        cells is a single comparison. Outside the convex hull of the surface,
+        cells are compared with the nearest vertex in 3D, as done by
+        :func:`active_from_xyz`.
+
         :param mesh: Octree mesh on which the mask is computed.
         :param offset: Statically shift the surface on which the mask
             is computed.
         :param reference: Use "bottom", "center" or "top" of the cells
             in determining the mask.
-
+        :param indices: Indices of the cells to be tested, all cells if None.
         """
+        depth = self.depth(mesh)
+        if indices is not None:
+            depth = depth[indices]
+
+        shift = reference_shift(mesh, reference, indices)
+        mask = depth > shift - offset
+
+        outside = np.isnan(depth)
+        if np.any(outside):
+            cells = np.flatnonzero(outside) if indices is None else indices[outside]
+            vertices = self.vertical_shift(offset)
+            locations = cell_centers(mesh, cells)
+            locations[:, 2] += shift[outside]
+            _, nearest = cKDTree(vertices).query(locations)
+            mask[outside] = locations[:, 2] < vertices[nearest, 2]
 
-        return active_from_xyz(mesh, self.vertical_shift(offset), reference)
+        return mask
 
 
 class Body:
@@ -243,16 +413,548 @@ class Body:
 
     def __init__(self, surface: Surface):
         self.surface = surface
+        self._geometry: dict[str, Any] = {}
+
+    def _memoize(self, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Value derived from the surface, computed again only if the surface
+        changed, so that chunks of cells share the same classifiers.
+
+        :param name: Name of the value.
+        :param compute: Function returning the value.
+        """
+        key = surface_key(self.surface)
+        if self._geometry.get("key") != key:
+            self._geometry = {"key": key}
+        if name not in self._geometry:
+            self._geometry[name] = compute()
+
+        return self._geometry[name]
+
+    @property
+    def extent(self) -> np.ndarray:
+        """Axis-aligned extent of the closed surface."""
+        if self.surface.vertices is None:
+            raise ValueError("Surface vertices are not defined.")
+
+        return np.vstack(
+            [self.surface.vertices.min(axis=0), self.surface.vertices.max(axis=0)]
+        )
+
+    @property
+    def half_spaces(self) -> np.ndarray | None:
+        """
+        Face planes of the body if the surface is a closed convex polyhedron.
+
+        Planes are stored as rows of [n_x, n_y, n_z, d] with outward unit
+        normals n, such that a point x lies within the body if n.x < d for
+        every plane. Returns None if the surface is open or not convex.
+        """
+        return self._memoize("half_spaces", self._half_spaces)
+
+    def _half_spaces(self) -> np.ndarray | None:
+        """Compute the face planes of a closed convex surface."""
+        if self.surface.vertices is None or self.surface.cells is None:
+            return None
+
+        vertices = self.surface.vertices
+        cells = self.surface.cells
+
+        edges = np.sort(cells[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+        _, counts = np.unique(edges, axis=0, return_counts=True)
+        if np.any(counts != 2):
+            return None
+
+        triangles = vertices[cells]
+        normals = np.cross(
+            triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
+        )
+        lengths = np.linalg.norm(normals, axis=1)
+        if np.any(lengths == 0):
+            return None
+
+        normals /= lengths[:, None]
+        offsets = np.sum(normals * triangles[:, 0], axis=1)
+
+        scale = np.ptp(vertices, axis=0).max()
+        tolerance = 1e-8 * scale
+        center = normals @ vertices.mean(axis=0) - offsets
+        if np.any(np.abs(center) < tolerance):
+            return None
+
+        normals[center > 0] *= -1
+        offsets[center > 0] *= -1
 
-    def mask(self, mesh: Octree) -> np.ndarray:
+        if np.any(vertices @ normals.T - offsets > tolerance):
+            return None
+
+        planes = np.c_[normals, offsets / scale]
+        _, unique = np.unique(
+            np.round(planes, decimals=8) + 0.0, axis=0, return_index=True
+        )
+
+        return np.c_[normals[unique], offsets[unique]]
+
+    def mask(self, mesh: Octree, indices: np.ndarray | None = None) -> np.ndarray:
         """
         True for cells that lie within the closed surface.
 
+        Only the cells within the extent of the surface are tested.
+        Convex polyhedra, such as plates, are resolved with a test against
+        their face planes. Other closed surfaces use the signed distance to
+        the triangulation. Tested cells are recorded in the MASK_CACHE, so
+        that each cell is only tested once per mesh.
+
         :param mesh: Octree mesh on which the mask is computed.
+        :param indices: Indices of the cells to be tested, all cells if None.
+        """
+        if indices is None:
+            indices = np.arange(mesh.n_cells)
+
+        key = ("body", surface_key(self.surface), mesh_key(mesh))
+        state = MASK_CACHE.fill(
+            key,
+            mesh.n_cells,
+            indices,
+            lambda cells: self._mask(mesh, cells),
+        )
+
+        return state > 0
+
+    def _mask(self, mesh: Octree, indices: np.ndarray | None = None) -> np.ndarray:
+        """
+        Compute the mask of cells within the closed surface.
+
+        Octree blocks lying entirely inside or outside the surface are
+        resolved at once, and only the cells of the blocks crossing the
+        surface are tested individually.
+        """
+        if indices is None:
+            indices = np.arange(mesh.n_cells)
+
+        mask = np.zeros(indices.size, dtype=bool)
+        candidates = within_extent(cell_centers(mesh, indices), self.extent)
+        if candidates.size == 0:
+            return mask
+
+        mask[candidates] = classify_octree(
+            mesh,
+            self._memoize("classifier", self._block_classifier),
+            lambda cells: self.contains(cell_centers(mesh, cells)),
+            indices[candidates],
+        )
+
+        return mask
+
+    def _block_classifier(self) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Classify octree blocks against the closed surface.
+
+        Blocks of convex polyhedra are inside if all their corners are
+        within every face plane, and outside if all their corners are
+        beyond any of them. Blocks of other closed surfaces are compared
+        with the signed distance to their center.
+
+        :return: Function of the block corners returning 1 for blocks
+            inside, 0 for blocks outside, and -1 for blocks crossing the
+            surface.
+        """
+        extent = self.extent
+        tolerance = 1e-8 * np.ptp(extent, axis=0).max()
+        half_spaces = self.half_spaces
+
+        if half_spaces is not None:
+
+            def classifier(corners: np.ndarray) -> np.ndarray:
+                distances = corners @ half_spaces[:, :3].T - half_spaces[:, 3]
+                state = np.full(corners.shape[0], -1)
+                state[np.any(np.all(distances > tolerance, axis=1), axis=1)] = 0
+                state[np.all(distances < -tolerance, axis=(1, 2))] = 1
+
+                return state
+
+            return classifier
+
+        query = self._proximity()
+
+        def classifier(corners: np.ndarray) -> np.ndarray:
+            state = np.zeros(corners.shape[0], dtype=int)
+            overlap = np.all(
+                (corners.min(axis=1) <= extent[1]) & (corners.max(axis=1) >= extent[0]),
+                axis=1,
+            )
+            centers = corners[overlap].mean(axis=1)
+            radius = np.linalg.norm(corners[overlap] - centers[:, None, :], axis=2)
+            radius = radius.max(axis=1) + tolerance
+            distances = query.signed_distance(centers)
+            state[overlap] = np.where(
+                distances > radius, 1, np.where(distances < -radius, 0, -1)
+            )
+
+            return state
+
+        return classifier
+
+    def contains(self, locations: np.ndarray) -> np.ndarray:
+        """
+        True for locations lying within the closed surface.
+
+        :param locations: Array of xyz locations.
         """
-        triangulation = Trimesh(
-            vertices=self.surface.vertices, faces=self.surface.cells
+        half_spaces = self.half_spaces
+        if half_spaces is not None:
+            return inside_half_spaces(locations, half_spaces)
+
+        return self._proximity().signed_distance(locations) > 0
+
+    def _proximity(self) -> ProximityQuery:
+        """Signed distance queries to the triangulation of the surface."""
+        return self._memoize(
+            "proximity",
+            lambda: ProximityQuery(
+                Trimesh(vertices=self.surface.vertices, faces=self.surface.cells)
+            ),
         )
-        proximity_query = ProximityQuery(triangulation)
-        dist = proximity_query.signed_distance(mesh.centroids)
-        return dist > 0
+
+    def fraction(
+        self, mesh: Octree, samples: int = 4, chunk_size: int = 2**20
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Volume fraction of the cells occupied by the closed surface.
+
+        Cells overlapping the extent of the surface are sub-sampled on a
+        regular grid of samples**3 points tested for inclusion.
+
+        :param mesh: Octree mesh on which the fraction is computed.
+        :param samples: Number of sub-samples per cell axis.
+        :param chunk_size: Maximum number of cells scanned, or sub-samples
+            tested, at once.
+
+        :return: Indices of the occupied cells and their volume fraction.
+        """
+        rotation = xy_rotation_matrix(np.deg2rad(mesh.rotation))
+        extent = self.extent
+        candidates = []
+        for start in range(0, mesh.n_cells, chunk_size):
+            cells = np.arange(start, min(start + chunk_size, mesh.n_cells))
+            centers = cell_centers(mesh, cells)
+            reach = cell_half_sizes(mesh, cells) @ np.abs(rotation.T)
+            overlap = np.all(
+                (centers - reach <= extent[1]) & (centers + reach >= extent[0]),
+                axis=1,
+            )
+            candidates.append(cells[overlap])
+
+        candidates = np.hstack(candidates).astype(int)
+        centers = cell_centers(mesh, candidates)
+        half_sizes = cell_half_sizes(mesh, candidates)
+
+        grid = (np.arange(samples) + 0.5) / samples * 2.0 - 1.0
+        offsets = np.stack(np.meshgrid(grid, grid, grid, indexing="ij"), axis=-1)
+        offsets = offsets.reshape(-1, 3)
+        fractions = np.zeros(candidates.size)
+        step = max(1, chunk_size // samples**3)
+        for start in range(0, candidates.size, step):
+            chunk = slice(start, start + step)
+            locations = (
+                centers[chunk, None, :]
+                + (offsets[None, :, :] * half_sizes[chunk, None, :]) @ rotation.T
+            ).reshape(-1, 3)
+            inside = self.contains(locations)
+            fractions[chunk] = inside.reshape(-1, offsets.shape[0]).mean(axis=1)
+
+        occupied = fractions > 0
+
+        return candidates[occupied], fractions[occupied]
+
+
+class Bodies:
+    """
+    Collection of closed surfaces located in a single pass over the mesh.
+
+    :param bodies: Sequence of Body objects.
+    """
+
+    def __init__(self, bodies: Sequence[Body]):
+        self.bodies = bodies
+
+    @property
+    def extents(self) -> np.ndarray:
+        """Axis-aligned extents of the bodies, of shape (n_bodies, 2, 3)."""
+        return np.stack([body.extent for body in self.bodies])
+
+    def locate(
+        self,
+        mesh: Octree,
+        indices: np.ndarray | None = None,
+        chunk_size: int = 2**16,
+    ) -> np.ndarray:
+        """
+        Index of the body containing each cell.
+
+        Cells within the extent enclosing all bodies are matched to the
+        bodies whose extent contain them, and only classified against those.
+
+        :param mesh: Octree mesh on which the bodies are located.
+        :param indices: Indices of the cells to be located, all cells if None.
+        :param chunk_size: Number of cells matched to the bodies at once.
+
+        :return: Index of the containing body, the last one for cells
+            shared by overlapping bodies, or -1 for cells outside all bodies.
+        """
+        if indices is None:
+            indices = np.arange(mesh.n_cells)
+
+        located = np.full(indices.size, -1, dtype=np.int32)
+        if len(self.bodies) == 0:
+            return located
+
+        extents = self.extents
+        candidates = within_extent(
+            cell_centers(mesh, indices),
+            np.vstack([extents[:, 0].min(axis=0), extents[:, 1].max(axis=0)]),
+        )
+        for start in range(0, candidates.size, chunk_size):
+            cells = candidates[start : start + chunk_size]
+            locations = cell_centers(mesh, indices[cells])
+            boxes = np.all(
+                (locations[:, None, :] >= extents[None, :, 0])
+                & (locations[:, None, :] <= extents[None, :, 1]),
+                axis=2,
+            )
+            for index, body in enumerate(self.bodies):
+                ind = np.where(boxes[:, index])[0]
+                if ind.size > 0:
+                    inside = body.mask(mesh, indices=indices[cells[ind]])
+                    located[cells[ind[inside]]] = index
+
+        return located
+
+
+def cell_centers(mesh: Octree, indices: np.ndarray | None = None) -> np.ndarray:
+    """
+    Centers of the mesh cells in world coordinates.
+
+    Computed from the octree cells of the requested subset only, so that
+    the centroids of the whole mesh need not be held in memory.
+
+    :param mesh: Octree mesh.
+    :param indices: Indices of the cells, all cells if None.
+    """
+    cells = mesh.octree_cells if indices is None else mesh.octree_cells[indices]
+    xyz = np.c_[
+        (cells["I"] + cells["NCells"] / 2.0) * mesh.u_cell_size,
+        (cells["J"] + cells["NCells"] / 2.0) * mesh.v_cell_size,
+        (cells["K"] + cells["NCells"] / 2.0) * mesh.w_cell_size,
+    ]
+    centers = np.dot(xy_rotation_matrix(np.deg2rad(mesh.rotation)), xyz.T).T
+    for ind, axis in enumerate(["x", "y", "z"]):
+        centers[:, ind] += mesh.origin[axis]
+
+    return centers
+
+
+def cell_half_sizes(mesh: Octree, indices: np.ndarray | None = None) -> np.ndarray:
+    """
+    Half sizes of the mesh cells along the u, v and w axes.
+
+    :param mesh: Octree mesh.
+    :param indices: Indices of the cells, all cells if None.
+    """
+    n_cells = mesh.octree_cells["NCells"]
+    if indices is not None:
+        n_cells = n_cells[indices]
+
+    return (
+        n_cells[:, None]
+        * np.abs(np.r_[mesh.u_cell_size, mesh.v_cell_size, mesh.w_cell_size])
+        / 2
+    )
+
+
+def reference_shift(
+    mesh: Octree, reference: str = "center", indices: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Vertical shift from the center to the reference of the mesh cells.
+
+    :param mesh: Octree mesh.
+    :param reference: Use "bottom", "center" or "top" of the cells.
+    :param indices: Indices of the cells, all cells if None.
+    """
+    half_heights = cell_half_sizes(mesh, indices)[:, 2]
+
+    if reference == "top":
+        return half_heights
+    if reference == "bottom":
+        return -1 * half_heights
+    if reference == "center":
+        return np.zeros_like(half_heights, dtype=float)
+
+    raise ValueError("'reference' must be one of 'center', 'top', or 'bottom'")
+
+
+def depth_below_surface(
+    mesh: Octree, vertices: np.ndarray, indices: np.ndarray | None = None
+) -> np.ndarray:
+    """
+    Vertical distance from a surface down to the cell centers.
+
+    The surface elevation is linearly interpolated from its vertices, and
+    left undefined outside their convex hull. Cells stacked in the same
+    octree column share a single interpolation.
+
+    :param mesh: Octree mesh.
+    :param vertices: Array of xyz vertices of the surface.
+    :param indices: Indices of the cells, all cells if None.
+
+    :return: Depth of the cells, nan outside the convex hull of the vertices.
+    """
+    if indices is None:
+        indices = np.arange(mesh.n_cells)
+
+    cells = mesh.octree_cells[indices]
+    centroids = cell_centers(mesh, indices)
+    columns = (2 * cells["I"].astype(np.int64) + cells["NCells"]) * (
+        2 * mesh.v_count + 1
+    ) + (2 * cells["J"] + cells["NCells"])
+    _, first, inverse = np.unique(columns, return_index=True, return_inverse=True)
+
+    elevations = interpolate_elevations(vertices, centroids[first, :2])
+
+    return elevations[inverse] - centroids[:, 2]
+
+
+def interpolate_elevations(vertices: np.ndarray, locations: np.ndarray) -> np.ndarray:
+    """
+    Linear interpolation of the elevation of vertices over their Delaunay
+    triangulation.
+
+    The barycentric coordinates are only computed for the triangles
+    containing the locations.
+
+    :param vertices: Array of xyz vertices.
+    :param locations: Array of xy locations.
+
+    :return: Elevations at the locations, nan outside the convex hull of
+        the vertices.
+    """
+    triangulation = Delaunay(vertices[:, :2])
+    simplices = triangulation.find_simplex(locations)
+    inside = simplices >= 0
+
+    corners = vertices[triangulation.simplices[simplices[inside]]]
+    edges = corners[:, 1:, :2] - corners[:, :1, :2]
+    offsets = locations[inside] - corners[:, 0, :2]
+    area = edges[:, 0, 0] * edges[:, 1, 1] - edges[:, 0, 1] * edges[:, 1, 0]
+    first = (offsets[:, 0] * edges[:, 1, 1] - offsets[:, 1] * edges[:, 1, 0]) / area
+    second = (edges[:, 0, 0] * offsets[:, 1] - edges[:, 0, 1] * offsets[:, 0]) / area
+
+    elevations = np.full(locations.shape[0], np.nan)
+    elevations[inside] = (
+        (1.0 - first - second) * corners[:, 0, 2]
+        + first * corners[:, 1, 2]
+        + second * corners[:, 2, 2]
+    )
+
+    return elevations
+
+
+def classify_octree(
+    mesh: Octree,
+    classify_blocks: Callable[[np.ndarray], np.ndarray],
+    classify_cells: Callable[[np.ndarray], np.ndarray],
+    indices: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    True for cells within a feature, resolved from the coarse octree levels
+    down.
+
+    Cells are grouped in aligned blocks the size of the largest cell. Blocks
+    lying entirely inside or outside the feature resolve all their cells at
+    once, while the others are split in eight until they reach the size of
+    the cells, which are then classified individually.
+
+    :param mesh: Octree mesh.
+    :param classify_blocks: Function of the xyz corners of blocks, of shape
+        (n_blocks, 8, 3), returning 1 for blocks inside, 0 for blocks
+        outside, and -1 for blocks crossing the feature.
+    :param classify_cells: Function of cell indices returning True for cells
+        within the feature.
+    :param indices: Indices of the cells to be classified, all cells if None.
+    """
+    if indices is None:
+        indices = np.arange(mesh.n_cells)
+
+    inside = np.zeros(indices.size, dtype=bool)
+    if indices.size == 0:
+        return inside
+
+    cells = mesh.octree_cells[indices]
+    ijk = np.c_[cells["I"], cells["J"], cells["K"]].astype(np.int64)
+    sizes = np.r_[mesh.u_cell_size, mesh.v_cell_size, mesh.w_cell_size]
+    counts = np.r_[mesh.u_count, mesh.v_count, mesh.w_count]
+    rotation = xy_rotation_matrix(np.deg2rad(mesh.rotation))
+    origin = np.r_[mesh.origin["x"], mesh.origin["y"], mesh.origin["z"]]
+    corners = np.array(list(product([0, 1], repeat=3)))
+
+    pending = np.arange(indices.size)
+    leaves = []
+    block = int(cells["NCells"].max())
+    while pending.size > 0:
+        keys = np.ravel_multi_index(
+            (ijk[pending] // block).T, tuple(counts // block + 1)
+        )
+        keys, inverse = np.unique(keys, return_inverse=True)
+        blocks = np.c_[np.unravel_index(keys, tuple(counts // block + 1))]
+        locations = ((blocks[:, None, :] + corners) * block * sizes) @ rotation.T
+        state = classify_blocks(locations + origin)[inverse]
+
+        inside[pending[state == 1]] = True
+        pending = pending[state == -1]
+        resolved = cells["NCells"][pending] >= block
+        leaves.append(pending[resolved])
+        pending = pending[~resolved]
+        block //= 2
+
+    leaves = np.hstack(leaves)
+    if leaves.size > 0:
+        inside[leaves] = classify_cells(indices[leaves])
+
+    return inside
+
+
+def within_extent(locations: np.ndarray, extent: np.ndarray) -> np.ndarray:
+    """
+    Indices of the locations lying within an axis-aligned extent.
+
+    :param locations: Array of xyz locations.
+    :param extent: Extent as [[x_min, y_min, z_min], [x_max, y_max, z_max]].
+    """
+    indices = np.arange(locations.shape[0])
+    for axis in range(extent.shape[1]):
+        values = locations[indices, axis]
+        indices = indices[(values >= extent[0, axis]) & (values <= extent[1, axis])]
+
+    return indices
+
+
+def inside_half_spaces(locations: np.ndarray, half_spaces: np.ndarray) -> np.ndarray:
+    """
+    True for locations lying strictly within the intersection of half-spaces.
+
+    Each plane is only tested against the locations that passed the
+    previous ones.
+
+    :param locations: Array of xyz locations.
+    :param half_spaces: Planes stored as rows of [n_x, n_y, n_z, d] with
+        outward normals n.
+    """
+    indices = np.arange(locations.shape[0])
+    for plane in half_spaces:
+        indices = indices[locations[indices] @ plane[:3] < plane[3]]
+
+    inside = np.zeros(locations.shape[0], dtype=bool)
+    inside[indices] = True
+
+    return inside
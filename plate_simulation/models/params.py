@@ -49,6 +49,9 @@ class PlateParams(BaseModel):
     :param reference_type: Type of reference for plate elevation.  Can be 'mean'
         'min', or 'max'.  Resulting elevation will be relative to the mean,
         minimum, or maximum of the reference surface.
+    :param volume_fraction_samples: Number of sub-samples per cell axis used to
+        blend the plate property in partially occupied cells.  Cells are
+        assigned by their centroid if None.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -68,6 +71,7 @@ class PlateParams(BaseModel):
     elevation: float
     reference_surface: str = "topography"
     reference_type: str = "mean"
+    volume_fraction_samples: int | None = None
 
     @field_validator("reference_surface", "reference_type", mode="before")
     @classmethod
@@ -152,6 +156,8 @@ class ModelParams(BaseModel):
     :param background: Value given to the background.
     :param overburden: Overburden layer parameters.
     :param plate: Plate parameters.
+    :param chunk_size: Number of cells resolved at once when building the
+        model, all cells if None.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -160,3 +166,4 @@ class ModelParams(BaseModel):
     background: float
     overburden: OverburdenParams
     plate: PlateParams
+    chunk_size: int | None = None
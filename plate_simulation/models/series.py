@@ -10,16 +10,25 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
 from geoh5py import Workspace
 from geoh5py.objects import Octree
-from geoh5py.shared.utils import fetch_active_workspace
+from geoh5py.shared.utils import fetch_active_workspace, find_unique_name
 
 from plate_simulation.models import EventMap
-from plate_simulation.models.events import Anomaly, Erosion, Event, Overburden
+from plate_simulation.models.cache import fingerprint, mesh_key
+from plate_simulation.models.events import (
+    Anomaly,
+    Bodies,
+    Erosion,
+    Event,
+    Overburden,
+)
 
 
 if TYPE_CHECKING:
@@ -55,6 +64,22 @@ class Series(ABC):
 
         return model, event_map
 
+    def units(self) -> list[tuple[str, float, Event | DikeSwarm]]:
+        """
+        Flatten the history into units realized with a single event id.
+
+        :return: Name, value and realizable event of each unit in order of
+            realization.
+        """
+        units: list[tuple[str, float, Event | DikeSwarm]] = []
+        for event in self.history:
+            if isinstance(event, Series):
+                units += event.units()
+            else:
+                units.append((event.name, event.value, event))
+
+        return units
+
     @property
     @abstractmethod
     def history(self):
@@ -118,11 +143,54 @@ class DikeSwarm(Series):
 
         event_id = max(event_map) + 1
         event_map[event_id] = (self.name, self.history[0].value)
-        for event in self.history:
-            model, event_map = event.realize(mesh, model, event_map, coeval=True)
+        model[self.mask(mesh)] = event_id
 
         return model, event_map
 
+    def units(self) -> list[tuple[str, float, Event | DikeSwarm]]:
+        """All intrusions of the swarm share a single event id."""
+        return [(self.name, self.history[0].value, self)]
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the intrusions of the swarm."""
+        return fingerprint(*[event.fingerprint for event in self.history])
+
+    def mask(self, mesh: Octree, indices: np.ndarray | None = None) -> np.ndarray:
+        """
+        True for cells within any of the intrusions.
+
+        All intrusions are located in a single pass over the mesh.
+
+        :param mesh: Octree mesh on which the model is defined.
+        :param indices: Indices of the cells to be tested, all cells if None.
+        """
+        bodies = Bodies([event.body for event in self.history])
+        return bodies.locate(mesh, indices=indices) >= 0
+
+    def fraction(self, mesh: Octree) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        Volume fraction of the cells occupied by the intrusions.
+
+        :param mesh: Octree mesh on which the model is defined.
+
+        :return: Indices of the occupied cells and their volume fraction,
+            or None if no intrusion is realized with volume fractions.
+        """
+        fractions = [
+            fraction
+            for fraction in (event.fraction(mesh) for event in self.history)
+            if fraction is not None
+        ]
+        if not fractions:
+            return None
+
+        indices = np.hstack([fraction[0] for fraction in fractions])
+        values = np.hstack([fraction[1] for fraction in fractions])
+        cells, inverse = np.unique(indices, return_inverse=True)
+
+        return cells, np.minimum(np.bincount(inverse, weights=values), 1.0)
+
     @property
     def history(self) -> Sequence[Anomaly]:
         """Sequence of geological events."""
@@ -147,21 +215,52 @@ class Geology(Series):
     """
     Ensures that a history is valid.
 
+    Events are realized from the last to the first, each one only tested
+    on the cells left undecided by the events that follow it. The cells
+    tested for each event are kept along with the event fingerprint, so
+    that re-building the scenario after changing some of the events only
+    realizes those.
+
     :param history: Sequence of geological events to be validated.
+    :param chunk_size: Number of cells resolved at once, all cells if None.
+        Bounds the memory used by the event masks on large meshes, while
+        the depth below boundaries and the classifiers of bodies are
+        computed once and shared by the chunks.
+    :param model_path: Optional .npy file backing the categorical model
+        with a memory map.
+    :param timer: Context manager timing the steps named after it, such as
+        the volume fractions and masks of each event.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         workspace: Workspace,
         *,
         mesh: Octree,
         background: float,
         history: Sequence[Event | Series],
+        chunk_size: int | None = None,
+        model_path: str | Path | None = None,
+        timer: Callable[[str], AbstractContextManager] | None = None,
     ):
         super().__init__(history)
         self.workspace = workspace
         self.mesh = mesh
         self.background = background
+        self.chunk_size = chunk_size
+        self.model_path = model_path
+        self.timer = timer or (lambda _: nullcontext())
+        self._realizations: dict[
+            str, tuple[np.ndarray, tuple[np.ndarray, np.ndarray] | None]
+        ] = {}
+        self._model: (
+            tuple[
+                list[tuple[int, str]],
+                np.ndarray,
+                list[tuple[int, np.ndarray, np.ndarray, np.ndarray]],
+            ]
+            | None
+        ) = None
 
     def __iter__(self):
         return iter(self.history)
@@ -196,17 +295,180 @@ class Geology(Series):
         """
         Realize the geological events in the scenario.
 
-        :return: Model and event map.
+        Events whose fingerprint is unchanged since the last build reuse
+        the cells already tested, and the model itself is reused if none of
+        the realizations changed.
+
+        :return: Categorical model of unsigned integer event ids and event map.
+            The model is a read-only memory map if a model path is provided,
+            overwritten by the next build, and a copy otherwise.
         """
         with fetch_active_workspace(self.workspace, mode="r+"):
             if self.mesh.n_cells is None:
                 raise ValueError("Mesh must have n_cells.")
+
             event_map = {1: ("Background", self.background)}
-            geology, event_map = super().realize(
-                self.mesh, np.ones(self.mesh.n_cells), event_map
+            steps = []
+            events = {}
+            realizations = {}
+            for name, value, event in self.units():
+                event_id = max(event_map) + 1
+                names = [elem[0] for elem in event_map.values()]
+                event_map[event_id] = (find_unique_name(name, names), value)
+                key = fingerprint(event.fingerprint, mesh_key(self.mesh))
+                if key not in realizations:
+                    realization = self._realizations.get(key)
+                    if realization is None:
+                        with self.timer(f"fraction {event.name}"):
+                            realization = (
+                                np.full(self.mesh.n_cells, -1, dtype=np.int8),
+                                event.fraction(self.mesh),
+                            )
+                    realizations[key] = realization
+                events[key] = event
+                steps.append((event_id, key))
+
+            self._realizations = realizations
+
+            if self._model is None or self._model[0] != steps:
+                self._model = (steps, *self._compose(steps, events))
+
+        model = self._model[1]
+        if isinstance(model, np.memmap):
+            model = model.view()
+            model.flags.writeable = False
+        else:
+            model = model.copy()
+
+        return model, event_map
+
+    @property
+    def fractions(self) -> list[tuple[int, np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Partially occupied cells of the last build.
+
+        :return: For each event realized with volume fractions, the event
+            id, indices of the cells, volume fractions of the event and ids
+            of the host events. Cells overwritten by later events are
+            excluded.
+        """
+        if self._model is None:
+            return []
+
+        return self._model[2]
+
+    def with_history(self, history: Sequence[Event | Series]) -> Geology:
+        """
+        Scenario of other events on the same mesh and background.
+
+        Events shared with this scenario reuse the cells already tested and
+        their volume fractions.
+
+        :param history: Sequence of geological events.
+
+        :return: New scenario, leaving this one unchanged.
+        """
+        scenario = Geology(
+            self.workspace,
+            mesh=self.mesh,
+            background=self.background,
+            history=history,
+            chunk_size=self.chunk_size,
+            timer=self.timer,
+        )
+        scenario._realizations = dict(self._realizations)
+
+        return scenario
+
+    def _compose(
+        self, steps: list[tuple[int, str]], events: dict[str, Event | DikeSwarm]
+    ) -> tuple[np.ndarray, list[tuple[int, np.ndarray, np.ndarray, np.ndarray]]]:
+        """
+        Resolve the event realized last in each cell of the mesh.
+
+        Cells are resolved by chunks of cells if a chunk size is provided.
+        Partially occupied cells are kept if no later event realizes them,
+        along with the event that would be realized without them.
+
+        :param steps: Event ids and realization keys in order of realization.
+        :param events: Events indexed by realization keys.
+
+        :return: Categorical model and partially occupied cells.
+        """
+        n_ids = max(event_id for event_id, _ in steps) if steps else 1
+        dtype = np.uint8 if n_ids <= np.iinfo(np.uint8).max else np.uint16
+        n_cells = self.mesh.n_cells
+        if self.model_path is None:
+            geology = np.empty(n_cells, dtype=dtype)
+        else:
+            geology = np.lib.format.open_memmap(
+                self.model_path, mode="w+", dtype=dtype, shape=(n_cells,)
             )
 
-        return geology, event_map
+        chunk_size = self.chunk_size or max(n_cells, 1)
+        for start in range(0, n_cells, chunk_size):
+            indices = np.arange(start, min(start + chunk_size, n_cells))
+            geology[indices] = self._resolve(steps, events, indices, dtype)
+
+        if isinstance(geology, np.memmap):
+            geology.flush()
+
+        fractions = []
+        for step, (event_id, key) in enumerate(steps):
+            fraction = self._realizations[key][1]
+            if fraction is None:
+                continue
+
+            indices, values = fraction
+            keep = geology[indices] <= event_id
+            indices, values = indices[keep], values[keep]
+            hosts = self._resolve(steps[:step], events, indices, dtype)
+            fractions.append((event_id, indices, values, hosts))
+
+        return geology, fractions
+
+    def _resolve(
+        self,
+        steps: list[tuple[int, str]],
+        events: dict[str, Event | DikeSwarm],
+        indices: np.ndarray,
+        dtype: type[np.unsignedinteger],
+    ) -> np.ndarray:
+        """
+        Event ids realized last in a subset of cells.
+
+        Events are tested from the last to the first on the cells that
+        remain undecided, and cells tested previously for an event are
+        read from its realization.
+
+        :param steps: Event ids and realization keys in order of realization.
+        :param events: Events indexed by realization keys.
+        :param indices: Indices of the cells to be resolved.
+        :param dtype: Unsigned integer type of the event ids.
+
+        :return: Event ids of the cells, the background where no event is
+            realized.
+        """
+        geology = np.ones(indices.size, dtype=dtype)
+        remaining = np.arange(indices.size)
+        for event_id, key in reversed(steps):
+            if remaining.size == 0:
+                break
+
+            state = self._realizations[key][0]
+            tested = state[indices[remaining]]
+            untested = tested < 0
+            if np.any(untested):
+                ind = indices[remaining[untested]]
+                with self.timer(f"mask {events[key].name}"):
+                    tested[untested] = events[key].mask(self.mesh, indices=ind)
+                state[ind] = tested[untested]
+
+            inside = tested.astype(bool)
+            geology[remaining[inside]] = event_id
+            remaining = remaining[~inside]
+
+        return geology
 
     def _validate_history(self, events: Sequence[Event | Series]):
         """Throw exception if the history isn't valid."""
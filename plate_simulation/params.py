@@ -59,6 +59,17 @@ class PlateSimulationParams(BaseData):
     simulation: Simpeg group containing simulation options and a survey.  Any
         mesh or starting model selections will be replaced by the objects
         created by the driver.
+    sensitivity_cache: Store the sensitivity of linear simulations, and reuse
+        it for simulations on identical meshes and surveys.
+    superposition: Simulate linear responses as the response of the model
+        without plates, reused for identical meshes and surveys, plus the
+        response of the plate cells.
+    result_cache: Store the result of the simulation, and copy it instead of
+        simulating identical inputs again.
+    background_response: Simulate the electromagnetic response of the model
+        without plates, reused for identical backgrounds, overburden, meshes
+        and surveys, and store the secondary response of the plates next to
+        the simulated data.
     """
 
     name: ClassVar[str] = "plate_simulation"
@@ -70,6 +81,10 @@ class PlateSimulationParams(BaseData):
     mesh: MeshParams
     model: ModelParams
     simulation: SimPEGGroup
+    sensitivity_cache: bool = False
+    superposition: bool = False
+    result_cache: bool = False
+    background_response: bool = False
 
     def simulation_parameters(self) -> InversionBaseParams:
         """
@@ -0,0 +1,163 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+import psutil
+
+from plate_simulation.tracer import span
+
+
+_ACTIVE_REPORT: ContextVar[StageReport | None] = ContextVar(
+    "active_report", default=None
+)
+
+
+class StageReport:
+    """
+    Wall time and peak resident memory of the stages of a run.
+
+    Stages are identified by their name and the names of the stages they are
+    nested in, and repeated stages are accumulated. Nesting is tracked per
+    thread, so that stages opened concurrently by other threads are recorded
+    from the top level. The resident memory is sampled by a background thread
+    while stages are open, and counts toward every open stage.
+
+    :param interval: Time between samples of the resident memory, in seconds.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.stages: dict[str, dict[str, Any]] = {}
+        self._process = psutil.Process()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._peaks: dict[int, int] = {}
+        self._count = 0
+        self._stop: threading.Event | None = None
+        self._start = time.perf_counter()
+
+    def rss(self) -> int:
+        """Resident memory of the process, in bytes."""
+        return self._process.memory_info().rss
+
+    def sample(self):
+        """Update the peak resident memory of the open stages."""
+        rss = self.rss()
+        with self._lock:
+            self._peaks = {key: max(peak, rss) for key, peak in self._peaks.items()}
+
+    def _monitor(self, stop: threading.Event):
+        while not stop.wait(self.interval):
+            self.sample()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time a stage, and sample its peak resident memory.
+
+        :param name: Name of the stage.
+        """
+        rss = self.rss()
+        path = getattr(self._local, "path", ())
+        self._local.path = (*path, name)
+        key = "/".join(self._local.path)
+        with self._lock:
+            self._count += 1
+            index = self._count
+            self._peaks[index] = rss
+            if self._stop is None:
+                self._stop = threading.Event()
+                threading.Thread(
+                    target=self._monitor, args=(self._stop,), daemon=True
+                ).start()
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self._local.path = path
+            self.sample()
+            with self._lock:
+                peak = self._peaks.pop(index)
+                record = self.stages.setdefault(
+                    key, {"calls": 0, "duration": 0.0, "peak_rss": 0}
+                )
+                record["calls"] += 1
+                record["duration"] += duration
+                record["peak_rss"] = max(record["peak_rss"], peak)
+                if not self._peaks and self._stop is not None:
+                    self._stop.set()
+                    self._stop = None
+
+    @contextmanager
+    def activate(self) -> Iterator[StageReport]:
+        """Record the stages opened with :func:`stage` in this report."""
+        token = _ACTIVE_REPORT.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_REPORT.reset(token)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Summary of the run.
+
+        :return: Elapsed time in seconds, peak resident memory in bytes and
+            records of the stages in order of completion.
+        """
+        with self._lock:
+            stages = [{"stage": key, **record} for key, record in self.stages.items()]
+
+        return {
+            "duration": time.perf_counter() - self._start,
+            "peak_rss": max([stage["peak_rss"] for stage in stages], default=0),
+            "stages": stages,
+        }
+
+    def write(self, path: str | Path) -> Path:
+        """
+        Write the summary of the run to a json file.
+
+        :param path: Path to the json file.
+
+        :return: Path to the written file.
+        """
+        path = Path(path)
+        with open(path, "w", encoding="utf8") as file:
+            json.dump(self.to_dict(), file, indent=4)
+
+        return path
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Time a stage in the active report, and record its span in the active
+    trace, if any.
+
+    :param name: Name of the stage.
+    """
+    report = _ACTIVE_REPORT.get()
+    with span(name):
+        if report is None:
+            yield
+        else:
+            with report.stage(name):
+                yield
@@ -0,0 +1,148 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+from simpeg.potential_fields.base import BasePFSimulation
+
+from plate_simulation.mesh.cache import default_cache_directory
+from plate_simulation.models.cache import fingerprint
+
+
+LINEAR_SIMULATIONS = ["gravity", "magnetic vector"]
+
+
+def sensitivity_fingerprint(simulation: BasePFSimulation) -> str:
+    """
+    Hash of the inputs controlling the sensitivity of a linear simulation.
+
+    The sensitivity only depends on the mesh, active cells, receivers and
+    inducing field, so that simulations of different models share it.
+
+    :param simulation: Integral simulation of potential fields.
+    """
+    values: list[np.ndarray | str] = [
+        type(simulation).__name__,
+        str(np.dtype(simulation.sensitivity_dtype)),
+        str(getattr(simulation, "model_type", "scalar")),
+        simulation.mesh.cell_centers,
+        simulation.mesh.h_gridded,
+        np.asarray(simulation.ind_active),
+    ]
+    source = simulation.survey.source_field
+    for name in ["amplitude", "inclination", "declination"]:
+        value = getattr(source, name, None)
+        values.append("none" if value is None else np.asarray(value, dtype=float))
+
+    for receiver in source.receiver_list:
+        values += [np.asarray(receiver.locations), ",".join(receiver.components)]
+
+    return fingerprint(*values)
+
+
+class ArrayCache:
+    """
+    Store of arrays on disk, indexed by the hash of their inputs.
+
+    Each array is saved in its own numpy file, and memory mapped when
+    reused.
+
+    :param directory: Directory of the cache, defaults to
+        :func:`default_cache_directory`.
+    """
+
+    folder = "arrays"
+
+    def __init__(self, directory: str | Path | None = None):
+        self.directory = Path(directory or default_cache_directory()) / self.folder
+
+    def __contains__(self, key: str) -> bool:
+        return self.path(key).exists()
+
+    def path(self, key: str) -> Path:
+        """
+        Path to the numpy file storing an array.
+
+        :param key: Hash of the inputs of the array.
+        """
+        return self.directory / f"{key}.npy"
+
+    def fetch(self, key: str) -> np.ndarray | None:
+        """
+        Read-only array mapped from the cache.
+
+        :param key: Hash of the inputs of the array.
+
+        :return: Stored array, or None if not stored.
+        """
+        if key not in self:
+            return None
+
+        return np.load(self.path(key), mmap_mode="r")
+
+    def store(self, key: str, values: np.ndarray) -> Path:
+        """
+        Save an array under the hash of its inputs.
+
+        The array is first written to a temporary file, and moved in place
+        once complete, so that concurrent runs never read partial files.
+
+        :param key: Hash of the inputs of the array.
+        :param values: Array to be stored.
+
+        :return: Path to the stored file.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary = self.directory / f".{key}-{uuid4().hex}.npy"
+        np.save(temporary, values)
+        os.replace(temporary, self.path(key))
+
+        return self.path(key)
+
+
+class SensitivityCache(ArrayCache):
+    """
+    Store of the sensitivity matrices of linear simulations on disk, indexed
+    by the hash of their inputs.
+
+    :param directory: Directory of the cache, defaults to
+        :func:`default_cache_directory`.
+    """
+
+    folder = "sensitivities"
+
+    def attach(self, simulation: BasePFSimulation) -> bool:
+        """
+        Give a simulation the sensitivity of identical inputs, computing and
+        storing it on a miss.
+
+        The simulation then evaluates its fields as the product of the
+        sensitivity with the model.
+
+        :param simulation: Integral simulation of potential fields.
+
+        :return: True if the sensitivity was read from the cache.
+        """
+        key = sensitivity_fingerprint(simulation)
+        sensitivity = self.fetch(key)
+        simulation.store_sensitivities = "ram"
+        cached = sensitivity is not None
+
+        if sensitivity is None:
+            sensitivity = np.asarray(simulation.G)
+            self.store(key, sensitivity)
+
+        simulation._G = sensitivity  # pylint: disable=protected-access
+
+        return cached
@@ -0,0 +1,142 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import numpy as np
+from simpeg import maps
+from simpeg.potential_fields import gravity, magnetics
+from simpeg.potential_fields.base import BasePFSimulation
+
+from plate_simulation.models.cache import fingerprint
+from plate_simulation.sensitivity import ArrayCache, sensitivity_fingerprint
+
+
+class ResponseCache(ArrayCache):
+    """
+    Store of the responses of reference models on disk, indexed by the hash
+    of the simulation inputs and model.
+
+    :param directory: Directory of the cache, defaults to
+        :func:`default_cache_directory`.
+    """
+
+    folder = "responses"
+
+
+class Superposition:
+    """
+    Fields of a linear simulation as the response of a reference model, plus
+    the response of the cells departing from it.
+
+    The response of the reference model is computed once for identical
+    simulations and reference models, and the contribution of the anomalous
+    cells is integrated over these cells only, so that its cost scales with
+    the number of anomalous cells rather than the size of the mesh.
+
+    :param simulation: Integral simulation of gravity or magnetic data.
+    :param reference: Reference model, in the model space of the simulation.
+    :param cache: Store of reference responses, defaults to a
+        :class:`ResponseCache` in the default cache directory.
+    """
+
+    def __init__(
+        self,
+        simulation: BasePFSimulation,
+        reference: np.ndarray,
+        cache: ArrayCache | None = None,
+    ):
+        if not self.supports(simulation):
+            raise ValueError(
+                f"Superposition is not supported for '{type(simulation).__name__}'."
+            )
+
+        self.simulation = simulation
+        self.reference = np.asarray(reference, dtype=float)
+        self.cache = cache or ResponseCache()
+        self._response: np.ndarray | None = None
+
+    @staticmethod
+    def supports(simulation) -> bool:
+        """
+        Whether the fields of a simulation are linear in its model.
+
+        :param simulation: Simulation object.
+        """
+        if isinstance(simulation, magnetics.Simulation3DIntegral):
+            return not simulation.is_amplitude_data
+
+        return isinstance(simulation, gravity.Simulation3DIntegral)
+
+    @property
+    def n_blocks(self) -> int:
+        """Number of model values per cell."""
+        return 3 if getattr(self.simulation, "model_type", None) == "vector" else 1
+
+    @property
+    def response(self) -> np.ndarray:
+        """Response of the reference model."""
+        if self._response is None:
+            key = fingerprint(sensitivity_fingerprint(self.simulation), self.reference)
+            response = self.cache.fetch(key)
+            if response is None:
+                response = np.asarray(
+                    type(self.simulation).fields(self.simulation, self.reference)
+                )
+                self.cache.store(key, response)
+
+            self._response = np.asarray(response)
+
+        return self._response
+
+    def anomaly(self, cells: np.ndarray) -> BasePFSimulation:
+        """
+        Simulation restricted to some of the active cells.
+
+        :param cells: Mask over the active cells of the simulation.
+        """
+        active = np.zeros(self.simulation.mesh.n_cells, dtype=bool)
+        active[np.flatnonzero(self.simulation.ind_active)[cells]] = True
+        mapping = maps.IdentityMap(nP=int(cells.sum()) * self.n_blocks)
+        kwargs = {
+            "survey": self.simulation.survey,
+            "ind_active": active,
+            "store_sensitivities": "forward_only",
+            "engine": self.simulation.engine,
+            "sensitivity_dtype": self.simulation.sensitivity_dtype,
+        }
+        if isinstance(self.simulation, magnetics.Simulation3DIntegral):
+            return magnetics.Simulation3DIntegral(
+                self.simulation.mesh,
+                chiMap=mapping,
+                model_type=self.simulation.model_type,
+                **kwargs,
+            )
+
+        return gravity.Simulation3DIntegral(
+            self.simulation.mesh, rhoMap=mapping, **kwargs
+        )
+
+    def fields(self, model: np.ndarray) -> np.ndarray:
+        """
+        Fields of a model, from the contrast of its cells with the reference.
+
+        :param model: Model, in the model space of the simulation.
+        """
+        contrast = (np.asarray(model) - self.reference).reshape(self.n_blocks, -1)
+        cells = np.any(contrast != 0.0, axis=0)
+        if not np.any(cells):
+            return self.response.copy()
+
+        anomaly = self.anomaly(cells)
+        return self.response + np.asarray(anomaly.fields(contrast[:, cells].ravel()))
+
+    def attach(self):
+        """Evaluate the fields of the simulation by superposition."""
+        self.simulation.fields = self.fields
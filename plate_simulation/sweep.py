@@ -0,0 +1,141 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from geoh5py.objects import Points, Surface
+
+from plate_simulation.models.params import ModelParams, OverburdenParams, PlateParams
+from plate_simulation.models.plates import Plate
+from plate_simulation.utils import replication_offsets
+
+
+LOOKUP_FILE = "lookup.json"
+
+
+def sweep_trials(directory: str | Path) -> list[dict[str, Any]]:
+    """
+    Parameter values of the members of a sweep.
+
+    Read from the lookup file written by param-sweeps next to the workspaces
+    of the members.
+
+    :param directory: Directory of the sweep.
+
+    :return: Values of the swept parameters for each member, or an empty
+        list if the directory does not hold a sweep.
+    """
+    path = Path(directory) / LOOKUP_FILE
+    if not path.is_file():
+        return []
+
+    with open(path, encoding="utf8") as file:
+        lookup = json.load(file)
+
+    return [
+        {name: value for name, value in trial.items() if name != "status"}
+        for trial in lookup.values()
+    ]
+
+
+def apply_trial(params: ModelParams, trial: dict[str, Any]) -> ModelParams:
+    """
+    Model parameters updated with the values of a sweep member.
+
+    :param params: Model parameters shared by the members.
+    :param trial: Values of the swept parameters, by name.
+    """
+    plate = PlateParams.model_validate(
+        {
+            **params.plate.model_dump(),
+            **{k: v for k, v in trial.items() if k in PlateParams.model_fields},
+        }
+    )
+    overburden = OverburdenParams.model_validate(
+        {
+            **params.overburden.model_dump(),
+            **{k: v for k, v in trial.items() if k in OverburdenParams.model_fields},
+        }
+    )
+    values = {
+        k: v
+        for k, v in trial.items()
+        if k in ModelParams.model_fields and k not in ["plate", "overburden"]
+    }
+
+    return params.model_copy(
+        update={**values, "plate": plate, "overburden": overburden}
+    )
+
+
+def plate_geometry(
+    params: ModelParams, survey: Points, topography: Surface
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vertices and triangles of the plates of a model, including replicates.
+
+    :param params: Model parameters.
+    :param survey: Survey object the plates are located from.
+    :param topography: Topography surface the plates are located from.
+
+    :return: Vertices of shape (number * 8, 3) and triangles of shape
+        (number * 12, 3).
+    """
+    offset = (
+        params.overburden.thickness
+        if params.plate.reference_surface == "overburden"
+        else 0.0
+    )
+    center = params.plate.center(survey, topography, depth_offset=-1 * offset)
+    plate = Plate(params.plate, *center)
+    offsets = replication_offsets(
+        params.plate.number, params.plate.spacing, params.plate.dip_direction
+    )
+    vertices = plate.vertices[None, :, :] + offsets[:, None, :]
+    cells = plate.triangles[None, :, :] + 8 * np.arange(len(offsets))[:, None, None]
+
+    return vertices.reshape(-1, 3), cells.reshape(-1, 3)
+
+
+def plate_envelope(
+    params: ModelParams,
+    survey: Points,
+    topography: Surface,
+    trials: list[dict[str, Any]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Union of the plates of all the members of a sweep.
+
+    Plates shared by several members are only included once, and plates are
+    sorted so that every member of the sweep gets an identical envelope.
+
+    :param params: Model parameters shared by the members.
+    :param survey: Survey object the plates are located from.
+    :param topography: Topography surface the plates are located from.
+    :param trials: Values of the swept parameters for each member. The
+        plates of the model parameters are used if empty.
+
+    :return: Vertices and triangles of the envelope.
+    """
+    plates = {}
+    for model in [apply_trial(params, trial) for trial in trials] or [params]:
+        vertices, _ = plate_geometry(model, survey, topography)
+        for block in vertices.reshape(-1, 8, 3):
+            plates[block.tobytes()] = block
+
+    blocks = np.stack([plates[key] for key in sorted(plates)])
+    cells = Plate(params.plate).triangles[None, :, :]
+    cells = cells + 8 * np.arange(len(blocks))[:, None, None]
+
+    return blocks.reshape(-1, 3), cells.reshape(-1, 3)
@@ -0,0 +1,222 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from geoh5py import Workspace
+from geoh5py.shared.exceptions import Geoh5FileClosedError
+from geoh5py.shared.utils import fetch_active_workspace
+
+
+TRACE_DIRECTORY_VARIABLE = "PLATE_SIMULATION_TRACE"
+
+_TRACER: Tracer | None = None
+
+
+def workspace_name(workspace: Workspace) -> str:
+    """
+    Name of the file of a workspace, or of the workspace if in memory.
+
+    :param workspace: Workspace object.
+    """
+    if isinstance(workspace.h5file, str | Path):
+        return Path(workspace.h5file).name
+
+    return workspace.name
+
+
+class Tracer:
+    """
+    Record of nested spans, written as Chrome trace events.
+
+    Spans are recorded with the id of the process and thread they ran in,
+    and timestamped from the epoch, so that the traces of parallel workers
+    line up when opened together.
+
+    :param path: Path to the json file of the trace.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.events: list[dict[str, Any]] = []
+        self._threads: dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._offset = time.time() * 1e6 - time.perf_counter() * 1e6
+
+    def now(self) -> float:
+        """Time since the epoch, in microseconds."""
+        return time.perf_counter() * 1e6 + self._offset
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[None]:
+        """
+        Record a span.
+
+        :param name: Name of the span.
+        :param args: Values shown with the span.
+        """
+        start = self.now()
+        try:
+            yield
+        finally:
+            event = {
+                "name": name,
+                "cat": "plate_simulation",
+                "ph": "X",
+                "ts": start,
+                "dur": self.now() - start,
+                "pid": os.getpid(),
+                "tid": threading.get_native_id(),
+            }
+            if args:
+                event["args"] = {key: str(value) for key, value in args.items()}
+            with self._lock:
+                self.events.append(event)
+                self._threads.setdefault(
+                    threading.get_native_id(), threading.current_thread().name
+                )
+
+    def write(self) -> Path:
+        """
+        Write the trace events to a json file.
+
+        :return: Path to the written file.
+        """
+        with self._lock:
+            metadata = [
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "args": {"name": f"plate_simulation {os.getpid()}"},
+                }
+            ]
+            metadata += [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "tid": tid,
+                    "args": {"name": thread},
+                }
+                for tid, thread in self._threads.items()
+            ]
+            events = metadata + self.events
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf8") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+        return self.path
+
+
+def trace_directory() -> Path | None:
+    """
+    Directory of the traces.
+
+    Set by the PLATE_SIMULATION_TRACE environment variable, tracing is
+    disabled otherwise.
+    """
+    if os.environ.get(TRACE_DIRECTORY_VARIABLE):
+        return Path(os.environ[TRACE_DIRECTORY_VARIABLE])
+
+    return None
+
+
+@contextmanager
+def tracing(directory: str | Path | None = None) -> Iterator[Tracer | None]:
+    """
+    Trace the spans of a run to its own file.
+
+    Spans opened with :func:`span` are recorded, and calls within an active
+    trace are recorded in it.
+
+    :param directory: Directory of the trace files, defaults to
+        :func:`trace_directory`. Tracing is disabled if no directory is set.
+    """
+    global _TRACER  # pylint: disable=global-statement
+
+    directory = directory or trace_directory()
+    if _TRACER is not None or directory is None:
+        yield _TRACER
+        return
+
+    name = (
+        f"trace_{time.strftime('%Y%m%d-%H%M%S')}_{os.getpid()}_{uuid4().hex[:8]}.json"
+    )
+    tracer = Tracer(Path(directory) / name)
+    _TRACER = tracer
+    try:
+        with tracer.span("plate simulation"):
+            yield tracer
+    finally:
+        _TRACER = None
+        tracer.write()
+
+
+@contextmanager
+def span(name: str, **args: Any) -> Iterator[None]:
+    """
+    Record a span in the active trace, if any.
+
+    :param name: Name of the span.
+    :param args: Values shown with the span.
+    """
+    tracer = _TRACER
+    if tracer is None:
+        yield
+        return
+
+    with tracer.span(name, **args):
+        yield
+
+
+@contextmanager
+def active_workspace(
+    workspace: Workspace | None, mode: str = "r"
+) -> Iterator[Workspace | None]:
+    """
+    Open a workspace as :func:`fetch_active_workspace`, and record its
+    opening and closing in spans of the active trace.
+
+    Workspaces already open in the requested mode are used as is, and
+    recorded in no span.
+
+    :param workspace: Workspace object.
+    :param mode: Mode of the h5 file.
+    """
+    try:
+        geoh5 = None if workspace is None else workspace.geoh5
+    except Geoh5FileClosedError:
+        geoh5 = None
+
+    if workspace is None or (geoh5 is not None and mode in geoh5.mode):
+        with fetch_active_workspace(workspace, mode=mode):
+            yield workspace
+        return
+
+    name = workspace_name(workspace)
+    context = fetch_active_workspace(workspace, mode=mode)
+    with span(f"open {name}"):
+        context.__enter__()  # pylint: disable=unnecessary-dunder-call
+    try:
+        yield workspace
+    finally:
+        with span(f"close {name}"):
+            context.__exit__(None, None, None)
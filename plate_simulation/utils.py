@@ -9,6 +9,7 @@
 
 import numpy as np
 from geoh5py.objects import Surface
+from geoh5py.shared.utils import fetch_active_workspace
 
 
 def azimuth_to_unit_vector(azimuth: float) -> np.ndarray:
@@ -44,11 +45,81 @@ def replicate(
     :param azimuth: Azimuth of the axis along with plates are replicated.
     """
 
-    offsets = (np.arange(number) * spacing) - ((number - 1) * spacing / 2)
+    offsets = replication_offsets(number, spacing, azimuth)
     surfaces = [surface.copy() for i in range(number - 1)] + [surface]
 
     for i in range(number):
-        surfaces[i].vertices += azimuth_to_unit_vector(azimuth) * offsets[i]
+        surfaces[i].vertices += offsets[i]
         surfaces[i].name = f"{surface.name} offset {i + 1}"
 
     return surfaces
+
+
+def merge_surfaces(surfaces: list[Surface], name: str) -> Surface:
+    """
+    Combine surfaces into a single multi-part surface.
+
+    The merged surface is created next to the first surface, and is the
+    first surface itself if there is only one. The driver removes it once
+    the mesh is made.
+
+    :param surfaces: geoh5py.Surface objects to be merged.
+    :param name: Name of the merged surface.
+    """
+    if len(surfaces) == 1:
+        return surfaces[0]
+
+    vertices, cells = [], []
+    n_vertices = 0
+    for surface in surfaces:
+        if surface.vertices is None or surface.cells is None:
+            raise ValueError(f"Surface '{surface.name}' has no vertices or cells.")
+
+        vertices.append(surface.vertices)
+        cells.append(surface.cells + n_vertices)
+        n_vertices += len(surface.vertices)
+
+    with fetch_active_workspace(surfaces[0].workspace, mode="r+") as workspace:
+        return Surface.create(
+            workspace,
+            vertices=np.vstack(vertices),
+            cells=np.vstack(cells),
+            name=name,
+            parent=surfaces[0].parent,
+        )
+
+
+def replication_offsets(number: int, spacing: float, azimuth: float) -> np.ndarray:
+    """
+    Offsets of n plates replicated along an azimuth centered at origin.
+
+    :param number: Number of plates.
+    :param spacing: Spacing between plates.
+    :param azimuth: Azimuth of the axis along with plates are replicated.
+
+    :return: Array of xyz offsets of shape (number, 3).
+    """
+    distances = (np.arange(number) * spacing) - ((number - 1) * spacing / 2)
+
+    return distances[:, None] * azimuth_to_unit_vector(azimuth)
+
+
+def volume_average(
+    host: np.ndarray,
+    inclusion: float,
+    fraction: np.ndarray,
+    harmonic: bool = False,
+) -> np.ndarray:
+    """
+    Volume weighted average of a host and inclusion physical property.
+
+    :param host: Physical property of the host.
+    :param inclusion: Physical property of the inclusion.
+    :param fraction: Volume fraction occupied by the inclusion.
+    :param harmonic: Average the reciprocal of the property, as for
+        resistivity models averaged in conductivity.
+    """
+    if harmonic:
+        return 1.0 / ((1.0 - fraction) / host + fraction / inclusion)
+
+    return (1.0 - fraction) * host + fraction * inclusion
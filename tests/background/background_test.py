@@ -0,0 +1,128 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+import numpy as np
+from geoh5py import Workspace
+from geoh5py.groups import ContainerGroup
+from geoh5py.objects import Points
+
+from plate_simulation import driver as driver_module
+from plate_simulation.background import (
+    SECONDARY_SUFFIX,
+    add_secondary_data,
+    background_fingerprint,
+    find_object,
+)
+from plate_simulation.driver import PlateSimulationDriver
+from plate_simulation.mesh.cache import CACHE_DIRECTORY_VARIABLE
+from tests.ensemble import get_params
+from tests.models import get_topo_mesh
+
+
+def test_background_fingerprint(tmp_path):
+    with Workspace.create(tmp_path / "test.geoh5") as ws:
+        params = get_params(ws)
+        simulation = params.simulation_parameters()
+        survey, topography = simulation.data_object, simulation.topography_object
+        _, mesh = get_topo_mesh(ws)
+        key = background_fingerprint(params, survey, topography, mesh)
+
+        model = params.model
+        plate = model.plate.model_copy(update={"plate": 2.0, "dip": 45.0})
+        assert (
+            background_fingerprint(
+                params.model_copy(
+                    update={"model": model.model_copy(update={"plate": plate})}
+                ),
+                survey,
+                topography,
+                mesh,
+            )
+            == key
+        )
+
+        overburden = model.overburden.model_copy(update={"thickness": 10.0})
+        assert (
+            background_fingerprint(
+                params.model_copy(
+                    update={
+                        "model": model.model_copy(update={"overburden": overburden})
+                    }
+                ),
+                survey,
+                topography,
+                mesh,
+            )
+            != key
+        )
+
+        shifted = mesh.copy(origin=np.r_[1.0, 0.0, 0.0])
+        assert background_fingerprint(params, survey, topography, shifted) != key
+
+
+def test_add_secondary_data(tmp_path):
+    with Workspace.create(tmp_path / "test.geoh5") as ws:
+        vertices = np.random.randn(10, 3)
+        group = ContainerGroup.create(ws, name="background")
+        background = Points.create(ws, vertices=vertices, name="survey", parent=group)
+        background.add_data(
+            {
+                "bz": {"values": np.ones(10)},
+                "bx": {"values": np.ones(10)},
+                "by": {"values": np.ones(5)},
+            }
+        )
+        total = Points.create(ws, vertices=vertices, name="survey")
+        data = total.add_data(
+            {
+                "bz": {"values": np.arange(10.0)},
+                "bx": {"values": np.arange(10.0)},
+                "by": {"values": np.arange(10.0)},
+                "bt": {"values": np.arange(10.0)},
+            }
+        )
+        total.add_data_to_group(data[:2], "b")
+
+        assert find_object(ws.root, "survey") is background
+        assert find_object(group, "bz") is None
+
+        secondary = add_secondary_data(total, background)
+
+        assert [child.name for child in secondary] == [
+            f"bz{SECONDARY_SUFFIX}",
+            f"bx{SECONDARY_SUFFIX}",
+        ]
+        assert np.allclose(secondary[0].values, np.arange(10.0) - 1.0)
+        group = total.get_property_group(f"b{SECONDARY_SUFFIX}")[0]
+        assert group is not None
+        assert group.properties == [child.uid for child in secondary]
+
+
+def test_background_response(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIRECTORY_VARIABLE, str(tmp_path / "cache"))
+    monkeypatch.setattr(driver_module, "EM_SIMULATIONS", ["gravity"])
+
+    def simulate(params, plate, background_response=False):
+        params.model.plate.plate = plate
+        driver = PlateSimulationDriver(
+            params.model_copy(update={"background_response": background_response})
+        )
+        return driver.run().inversion_data.entity
+
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        params = get_params(ws)
+        background = simulate(params, 0.0).get_data("Iteration_0_gz")[0].values
+        expected = simulate(params, 0.5).get_data("Iteration_0_gz")[0].values
+        survey = simulate(params, 0.5, background_response=True)
+
+        total = survey.get_data("Iteration_0_gz")[0].values
+        secondary = survey.get_data(f"Iteration_0_gz{SECONDARY_SUFFIX}")[0].values
+        assert np.allclose(total, expected)
+        assert np.abs(secondary).max() > 0.0
+        assert np.allclose(secondary, expected - background)
@@ -0,0 +1,17 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from plate_simulation.cache import result_fingerprint
+
+
+def get_fingerprint(params) -> str:
+    simulation = params.simulation_parameters()
+    return result_fingerprint(
+        params, simulation.data_object, simulation.topography_object
+    )
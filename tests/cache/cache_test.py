@@ -0,0 +1,176 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+import shutil
+
+import numpy as np
+from geoh5py import Workspace
+from geoh5py.groups import ContainerGroup, UIJsonGroup
+from geoh5py.objects import Points
+
+from plate_simulation.cache import ResultCache, option_values, result_fingerprint
+from plate_simulation.driver import PlateSimulationDriver
+from plate_simulation.mesh.cache import CACHE_DIRECTORY_VARIABLE
+from tests.cache import get_fingerprint
+from tests.ensemble import get_params
+
+
+def test_option_values():
+    options = {
+        "geoh5": "first.geoh5",
+        "inversion_type": "gravity",
+        "gz_channel_bool": True,
+        "z_from_topo": {"value": True, "label": "Elevation"},
+        "starting_model": {"value": 1.0},
+        "u_cell_size": {"value": 10.0, "optional": True, "enabled": False},
+    }
+    assert option_values(options) == {
+        "inversion_type": "gravity",
+        "gz_channel_bool": True,
+        "z_from_topo": True,
+        "u_cell_size": None,
+    }
+
+
+def test_result_fingerprint(tmp_path):
+    with Workspace.create(tmp_path / "first.geoh5") as ws:
+        params = get_params(ws)
+        key = get_fingerprint(params)
+
+        assert get_fingerprint(params) == key
+        assert (
+            get_fingerprint(
+                params.model_copy(
+                    update={
+                        "mesh": params.mesh.model_copy(update={"mesh_cache": True}),
+                        "sensitivity_cache": True,
+                    }
+                )
+            )
+            == key
+        )
+        assert (
+            get_fingerprint(
+                params.model_copy(
+                    update={"mesh": params.mesh.model_copy(update={"u_cell_size": 5.0})}
+                )
+            )
+            != key
+        )
+        assert (
+            get_fingerprint(params.model_copy(update={"background_response": True}))
+            != key
+        )
+        overburden = params.model.overburden.model_copy(update={"thickness": 10.0})
+        assert (
+            get_fingerprint(
+                params.model_copy(
+                    update={
+                        "model": params.model.model_copy(
+                            update={"overburden": overburden}
+                        )
+                    }
+                )
+            )
+            != key
+        )
+        plate = params.model.plate.model_copy(update={"plate": 2.0})
+        assert (
+            get_fingerprint(
+                params.model_copy(
+                    update={"model": params.model.model_copy(update={"plate": plate})}
+                )
+            )
+            != key
+        )
+
+        options = params.simulation.options
+        options["z_from_topo"]["value"] = not options["z_from_topo"]["value"]
+        params.simulation.options = options
+        assert get_fingerprint(params) != key
+
+    shutil.copy(tmp_path / "first.geoh5", tmp_path / "second.geoh5")
+    with Workspace(tmp_path / "second.geoh5") as ws:
+        params = get_params(ws)
+        assert get_fingerprint(params) == key
+
+
+def test_result_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIRECTORY_VARIABLE, str(tmp_path / "cache"))
+    cache = ResultCache()
+
+    with Workspace.create(tmp_path / "first.geoh5") as ws:
+        group = ContainerGroup.create(ws, name="result")
+        survey = Points.create(ws, vertices=np.random.randn(10, 3), parent=group)
+        survey.add_data({"gz": {"values": np.arange(10.0)}})
+        assert not cache.fetch("key", group)
+
+        cache.store("key", group)
+        assert "key" in cache
+        assert not list(cache.directory.glob(".*"))
+
+    with Workspace.create(tmp_path / "second.geoh5") as ws:
+        group = ContainerGroup.create(ws)
+        assert cache.fetch("key", group)
+
+        copy = group.children[0]
+        assert isinstance(copy, Points)
+        assert np.allclose(copy.vertices, survey.vertices)
+        assert np.allclose(copy.get_data("gz")[0].values, np.arange(10.0))
+
+
+def test_cached_result(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIRECTORY_VARIABLE, str(tmp_path / "cache"))
+
+    with Workspace.create(tmp_path / "test.geoh5") as ws:
+        params = get_params(ws).model_copy(update={"result_cache": True})
+        result = ContainerGroup.create(ws)
+        ContainerGroup.create(ws, name="stored result", parent=result)
+        ResultCache().store(get_fingerprint(params), result)
+
+        driver = PlateSimulationDriver(params)
+        assert driver.run() is None
+        assert isinstance(driver.out_group, UIJsonGroup)
+        assert "stored result" in [child.name for child in driver.out_group.children]
+
+
+def test_cached_result_envelope(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIRECTORY_VARIABLE, str(tmp_path / "cache"))
+
+    with Workspace.create(tmp_path / "test.geoh5") as ws:
+        params = get_params(ws)
+        params = params.model_copy(
+            update={
+                "mesh": params.mesh.model_copy(update={"sweep_envelope": True}),
+                "result_cache": True,
+            }
+        )
+        keys = []
+        for easting in [100.0, 300.0]:
+            driver = PlateSimulationDriver(
+                params, trials=[{"easting": 0.0}, {"easting": easting}]
+            )
+            keys.append(
+                result_fingerprint(
+                    params, driver.survey, driver.topography, driver.envelope_geometry
+                )
+            )
+
+        assert keys[1] != keys[0]
+        assert get_fingerprint(params) != keys[0]
+
+        result = ContainerGroup.create(ws)
+        driver.envelope.parent = result
+        ResultCache().store(keys[0], result)
+        driver = PlateSimulationDriver(
+            params, trials=[{"easting": 0.0}, {"easting": 100.0}]
+        )
+        assert driver.run() is None
+        names = [child.name for child in driver.out_group.children]
+        assert names.count(f"{params.model.plate.name} envelope") == 1
@@ -0,0 +1,49 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from copy import deepcopy
+
+from geoh5py import Workspace
+from geoh5py.groups import SimPEGGroup
+from simpeg_drivers.constants import default_ui_json
+
+from plate_simulation.mesh.params import MeshParams
+from plate_simulation.params import PlateSimulationParams
+from tests.runtest import get_survey, get_topography
+from tests.sweep import get_model_params
+
+
+def get_params(workspace: Workspace) -> PlateSimulationParams:
+    topography = get_topography(workspace)
+    survey = get_survey(workspace, 10, 10)
+    options = deepcopy(default_ui_json)
+    options["title"] = "gravity forward"
+    options["inversion_type"] = "gravity"
+    options["forward_only"] = True
+    options["geoh5"] = str(workspace.h5file)
+    options["topography_object"]["value"] = str(topography.uid)
+    options["data_object"]["value"] = str(survey.uid)
+    simulation = SimPEGGroup.create(workspace)
+    simulation.options = options
+
+    return PlateSimulationParams(
+        title="test",
+        run_command="run",
+        geoh5=workspace,
+        mesh=MeshParams(
+            u_cell_size=10.0,
+            v_cell_size=10.0,
+            w_cell_size=10.0,
+            padding_distance=1500.0,
+            depth_core=600.0,
+            max_distance=200.0,
+        ),
+        model=get_model_params(),
+        simulation=simulation,
+    )
@@ -0,0 +1,176 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+import json
+import logging
+import sys
+from copy import deepcopy
+
+import numpy as np
+import pytest
+from geoh5py import Workspace
+from geoh5py.groups import SimPEGGroup
+from simpeg_drivers.constants import default_ui_json
+from simpeg_drivers.driver import InversionDriver
+
+from plate_simulation.driver import PlateSimulationDriver
+from plate_simulation.ensemble import Ensemble, apply_scenario, read_scenarios
+from plate_simulation.mesh.cache import CACHE_DIRECTORY_VARIABLE
+from plate_simulation.mesh.params import MeshParams
+from plate_simulation.models.events import Erosion, Overburden
+from plate_simulation.params import PlateSimulationParams
+from tests.ensemble import get_params
+from tests.runtest import get_survey, get_topography
+from tests.sweep import get_model_params
+
+
+def test_read_scenarios(tmp_path):
+    with open(tmp_path / "table.csv", "w", encoding="utf8") as file:
+        file.write("scenario,plate,easting,survey_refinement,reference_type\n")
+        file.write('1,1.0,,"[2, 2]",max\n')
+        file.write("second,0.5,10.0,,\n")
+
+    assert read_scenarios(tmp_path / "table.csv") == [
+        {
+            "scenario": "1",
+            "plate": 1.0,
+            "survey_refinement": [2, 2],
+            "reference_type": "max",
+        },
+        {"scenario": "second", "plate": 0.5, "easting": 10.0},
+    ]
+
+    with open(tmp_path / "lookup.json", "w", encoding="utf8") as file:
+        json.dump({"member": {"plate": 1.0, "status": "pending"}}, file)
+
+    assert read_scenarios(tmp_path / "lookup.json") == [
+        {"scenario": "member", "plate": 1.0}
+    ]
+
+
+def test_apply_scenario(tmp_path):
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        params = get_params(ws)
+        scenario = apply_scenario(
+            params,
+            {"scenario": "a", "plate": "2.0", "background": 1.0, "u_cell_size": 5.0},
+        )
+
+        assert scenario.model.plate.plate == 2.0
+        assert scenario.model.background == 1.0
+        assert scenario.mesh.u_cell_size == 5.0
+        assert scenario.model.overburden == params.model.overburden
+        assert scenario.out_group is None
+
+        with pytest.raises(ValueError, match="Unknown scenario parameters"):
+            apply_scenario(params, {"cell_size": 5.0})
+
+
+def test_ensemble_shares_setup(tmp_path):
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        params = get_params(ws)
+        ensemble = Ensemble(
+            params,
+            [
+                {"scenario": "low", "plate": 0.5},
+                {"scenario": "high", "plate": 1.0},
+                {"scenario": "deep", "elevation": -300.0},
+            ],
+        )
+        drivers = [ensemble.driver(index) for index in range(3)]
+        meshes = [driver.mesh for driver in drivers]
+
+        parameters = [driver.simulation_parameters for driver in drivers]
+        assert all(
+            values.data_object is parameters[0].data_object
+            and values.topography_object is parameters[0].topography_object
+            for values in parameters
+        )
+        assert parameters[1] is not parameters[0]
+        parameters[1].mesh = meshes[1]
+        assert parameters[0].mesh is None
+        assert parameters[0].input_file.data["mesh"] is None
+        assert parameters[2].input_file.data["mesh"] is None
+        assert len(ensemble.meshes) == 2
+        assert meshes[1].uid != meshes[0].uid
+        assert meshes[1].parent.uid == drivers[1].out_group.uid
+        assert np.all(meshes[1].octree_cells == meshes[0].octree_cells)
+        assert drivers[1].out_group.name == "Plate Simulation: high"
+        assert drivers[1].out_group.options["plate"]["value"] == 1.0
+        assert np.nanmax(drivers[1].model.values) == 1.0
+
+
+def test_ensemble_shares_geology(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIRECTORY_VARIABLE, str(tmp_path / "cache"))
+    calls = []
+    for event in [Overburden, Erosion]:
+
+        def mask(self, mesh, indices=None, original=event.mask):
+            calls.append(type(self).__name__)
+            return original(self, mesh, indices=indices)
+
+        monkeypatch.setattr(event, "mask", mask)
+
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        params = get_params(ws)
+        mesh_params = params.mesh.model_copy(update={"sweep_envelope": True})
+        params = params.model_copy(update={"mesh": mesh_params})
+        scenarios = [{"easting": 0.0}, {"easting": 100.0}]
+        ensemble = Ensemble(params, scenarios)
+        drivers = [ensemble.driver(index) for index in range(2)]
+
+        assert np.nanmax(drivers[0].model.values) == 0.5
+        assert set(calls) == {"Overburden", "Erosion"}
+
+        calls.clear()
+        model = drivers[1].model.values
+        assert not calls
+        assert len(ensemble.geologies) == 1
+
+        expected = PlateSimulationDriver(
+            apply_scenario(params, scenarios[1]), trials=scenarios
+        ).model.values
+        np.testing.assert_array_equal(model, expected)
+        assert not np.array_equal(model, drivers[0].model.values)
+
+
+def test_ensemble_failures_restore_output(tmp_path, monkeypatch):
+    class Log:
+        def __init__(self, terminal):
+            self.terminal = terminal
+            self.log = open(tmp_path / "SimPEG.log", "w", encoding="utf8")
+
+        def write(self, message):
+            self.log.write(message)
+
+    def failing_run(self):  # pylint: disable=unused-argument
+        sys.stdout = Log(sys.stdout)
+        raise RuntimeError("simulation failed")
+
+    monkeypatch.setattr(InversionDriver, "run", failing_run)
+    logger = logging.getLogger("Plate Simulation")
+    handler = logging.NullHandler()
+    logger.addHandler(handler)
+    stdout = sys.stdout
+    try:
+        with Workspace(tmp_path / "test.geoh5") as ws:
+            ensemble = Ensemble(
+                get_params(ws),
+                [{"scenario": "low", "plate": 0.5}, {"scenario": "high"}],
+            )
+            results = ensemble.run()
+
+        assert results == [None, None]
+        assert sys.stdout is stdout
+        assert handler in logger.handlers
+        assert (
+            sum(item.get_name() == "Plate Simulation" for item in logger.handlers) == 1
+        )
+    finally:
+        logger.removeHandler(handler)
@@ -0,0 +1,90 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+import os
+import time
+from pathlib import Path
+
+from plate_simulation.executor import THREAD_VARIABLES, SweepExecutor
+from tests.sweep import write_lookup
+
+
+def record_run(path: str, threads: int):
+    """Record the runs of a member, failing as its name requests."""
+    member = Path(path)
+    attempt = len(list(member.parent.glob(f"{member.name}.attempt*")))
+    (member.parent / f"{member.name}.attempt{attempt}").touch()
+    if "broken" in member.name or ("flaky" in member.name and attempt == 0):
+        raise RuntimeError("simulation failed")
+
+    with open(f"{path}.done", "w", encoding="utf8") as file:
+        file.write(f"{threads} {os.environ[THREAD_VARIABLES[0]]}")
+
+
+def test_sweep_executor(tmp_path):
+    write_lookup(tmp_path, [{"plate": float(value)} for value in range(5)])
+    lookup = dict(
+        zip(
+            ["good", "flaky", "broken", "complete", "missing"],
+            SweepExecutor(tmp_path).read_lookup().values(),
+            strict=True,
+        )
+    )
+    lookup["complete"]["status"] = "complete"
+    executor = SweepExecutor(
+        tmp_path, processes=2, threads=2, retries=1, runner=record_run
+    )
+    executor.write_lookup(lookup)
+    for name in ["good", "flaky", "broken", "complete"]:
+        executor.input_path(name).touch()
+
+    status = executor.run()
+
+    assert status == {"good": "complete", "flaky": "complete", "broken": "failed"}
+    assert executor.read_lookup()["complete"]["status"] == "complete"
+    assert executor.read_lookup()["missing"]["status"] == "pending"
+    assert len(list(tmp_path.glob("broken.ui.json.attempt*"))) == 2
+    assert len(list(tmp_path.glob("flaky.ui.json.attempt*"))) == 2
+    with open(tmp_path / "good.ui.json.done", encoding="utf8") as file:
+        assert file.read() == "2 2"
+    assert all(name not in os.environ for name in THREAD_VARIABLES)
+
+    assert executor.run() == {"broken": "failed"}
+
+
+def crash_run(path: str, threads: int):
+    """Kill the worker running a member named 'crash', and record the runs."""
+    member = Path(path)
+    if "crash" in member.name:
+        time.sleep(0.5)
+        os._exit(1)  # pylint: disable=protected-access
+
+    record_run(path, threads)
+    time.sleep(1.0)
+
+
+def test_sweep_executor_worker_killed(tmp_path):
+    names = ["crash", "first", "second"]
+    write_lookup(tmp_path, [{"plate": float(value)} for value in range(3)])
+    lookup = dict(
+        zip(names, SweepExecutor(tmp_path).read_lookup().values(), strict=True)
+    )
+    executor = SweepExecutor(tmp_path, processes=3, retries=0, runner=crash_run)
+    executor.write_lookup(lookup)
+    for name in names:
+        executor.input_path(name).touch()
+
+    status = executor.run()
+
+    assert status == {
+        "crash": "failed",
+        "first": "complete",
+        "second": "complete",
+    }
+    assert all((tmp_path / f"{name}.ui.json.done").is_file() for name in names[1:])
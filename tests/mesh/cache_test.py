@@ -0,0 +1,85 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+import numpy as np
+from geoh5py import Workspace
+from geoh5py.groups import ContainerGroup
+from geoh5py.objects import Surface
+
+from plate_simulation.mesh.cache import (
+    CACHE_DIRECTORY_VARIABLE,
+    MeshCache,
+    default_cache_directory,
+    mesh_fingerprint,
+)
+from plate_simulation.mesh.params import MeshParams
+from tests.models import get_topo_mesh
+
+
+def test_mesh_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIRECTORY_VARIABLE, str(tmp_path / "cache"))
+    assert default_cache_directory() == tmp_path / "cache"
+
+    params = MeshParams(
+        u_cell_size=0.5,
+        v_cell_size=0.5,
+        w_cell_size=0.5,
+        padding_distance=10.0,
+        depth_core=5.0,
+        max_distance=5.0,
+    )
+    cache = MeshCache()
+
+    with Workspace(tmp_path / "first.geoh5") as ws:
+        topography, octree = get_topo_mesh(ws)
+        key = mesh_fingerprint(params, topography, topography, [])
+        assert key not in cache
+
+        cache.store(key, octree)
+        assert key in cache
+        assert not list(cache.directory.glob(".*"))
+
+        moved = mesh_fingerprint(
+            params,
+            topography,
+            topography,
+            [topography.copy(vertices=topography.vertices + 1.0)],
+        )
+        assert moved != key
+        assert (
+            mesh_fingerprint(
+                params.model_copy(update={"max_distance": 10.0}),
+                topography,
+                topography,
+                [],
+            )
+            != key
+        )
+        assert (
+            mesh_fingerprint(
+                params.model_copy(update={"mesh_cache": True}),
+                topography,
+                topography,
+                [],
+            )
+            == key
+        )
+
+    with Workspace.create(tmp_path / "second.geoh5") as ws:
+        copy = Surface.create(ws, vertices=topography.vertices, cells=topography.cells)
+        assert mesh_fingerprint(params, copy, copy, []) == key
+
+        group = ContainerGroup.create(ws)
+        mesh = cache.fetch(key, group)
+
+        assert mesh is not None
+        assert mesh.parent is group
+        assert np.all(mesh.octree_cells == octree.octree_cells)
+        assert np.allclose(mesh.centroids, octree.centroids)
+        assert cache.fetch(moved, group) is None
@@ -0,0 +1,125 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+import numpy as np
+import pytest
+from geoh5py import Workspace
+from geoh5py.objects import AirborneTEMReceivers, AirborneTEMTransmitters
+from octree_creation_app.driver import OctreeDriver
+
+from plate_simulation.mesh.estimate import (
+    CELL_BYTES,
+    coarsen_levels,
+    estimate_mesh,
+    fit_cell_budget,
+)
+from plate_simulation.mesh.params import MeshParams
+from plate_simulation.models.params import PlateParams
+from plate_simulation.models.plates import Plate
+from plate_simulation.utils import replicate
+from tests.runtest import get_survey, get_topography
+
+
+def get_inputs(workspace):
+    topography = get_topography(workspace)
+    survey = get_survey(workspace, 10, 10)
+    params = PlateParams(
+        name="plate",
+        plate=1.0,
+        elevation=-250.0,
+        width=20.0,
+        strike_length=100.0,
+        dip_length=100.0,
+        dip=60.0,
+        dip_direction=30.0,
+    )
+    surface = Plate(params, 0.0, 0.0, -250.0).create_surface(workspace)
+    plates = replicate(surface, 3, 40.0, 30.0)
+    mesh_params = MeshParams(
+        u_cell_size=10.0,
+        v_cell_size=10.0,
+        w_cell_size=10.0,
+        padding_distance=1500.0,
+        depth_core=600.0,
+        max_distance=200.0,
+    )
+
+    return mesh_params, survey, topography, plates
+
+
+def test_estimate_mesh(tmp_path):
+    with Workspace.create(tmp_path / "test.geoh5") as ws:
+        mesh_params, survey, topography, plates = get_inputs(ws)
+        estimate = estimate_mesh(mesh_params, survey, topography, plates)
+        octree_params = mesh_params.octree_params(survey, topography, plates)
+        mesh = OctreeDriver.treemesh_from_params(octree_params)
+
+        assert estimate.n_cells == pytest.approx(mesh.n_cells, rel=0.1)
+        assert estimate.n_cells == sum(estimate.cells_per_level)
+        assert 0 < estimate.n_active < estimate.n_cells
+        assert estimate.n_receivers == survey.n_vertices
+        assert estimate.memory(components=0) == estimate.n_cells * CELL_BYTES
+        assert estimate.memory(components=3) > estimate.memory()
+
+        coarse = mesh_params.model_copy(update={"survey_refinement": [4, 4]})
+        assert estimate_mesh(coarse, survey, topography, plates).n_cells < (
+            estimate.n_cells
+        )
+
+
+def test_estimate_mesh_complement(tmp_path):
+    with Workspace.create(tmp_path / "test.geoh5") as ws:
+        mesh_params, survey, topography, plates = get_inputs(ws)
+        lines = np.repeat(np.arange(10), 10)
+        receivers = AirborneTEMReceivers.create(
+            ws, vertices=survey.vertices + np.r_[0.0, 0.0, 30.0], parts=lines
+        )
+        receivers.transmitters = AirborneTEMTransmitters.create(
+            ws, vertices=survey.vertices + np.r_[60.0, 0.0, 60.0], parts=lines
+        )
+        estimate = estimate_mesh(mesh_params, receivers, topography, plates)
+        octree_params = mesh_params.octree_params(receivers, topography, plates)
+        mesh = OctreeDriver.treemesh_from_params(octree_params)
+
+        assert estimate.n_cells == pytest.approx(mesh.n_cells, rel=0.1)
+        assert estimate_mesh(mesh_params, survey, topography, plates).n_cells < (
+            estimate.n_cells
+        )
+
+
+def test_coarsen_levels():
+    assert coarsen_levels([4, 4, 4]) == [4, 4, 3]
+    assert coarsen_levels([2, 1]) == [2]
+    assert coarsen_levels([0, 2]) == [0, 1]
+    assert coarsen_levels([0, 1]) is None
+
+
+def test_fit_cell_budget(tmp_path):
+    with Workspace.create(tmp_path / "test.geoh5") as ws:
+        mesh_params, survey, topography, plates = get_inputs(ws)
+        estimate = estimate_mesh(mesh_params, survey, topography, plates)
+
+        fitted, _ = fit_cell_budget(
+            mesh_params, survey, topography, plates, budget=estimate.n_cells
+        )
+        assert fitted == mesh_params
+
+        budget = estimate.n_cells // 2
+        fitted, fitted_estimate = fit_cell_budget(
+            mesh_params, survey, topography, plates, budget=budget
+        )
+        assert fitted_estimate.n_cells <= budget
+        assert fitted_estimate == estimate_mesh(fitted, survey, topography, plates)
+        assert fitted.padding_distance <= mesh_params.padding_distance
+        assert fitted.depth_core >= survey.vertices[:, 2].min() - np.min(
+            [plate.vertices[:, 2].min() for plate in plates]
+        )
+
+        with pytest.raises(ValueError, match="Could not fit the mesh"):
+            fit_cell_budget(mesh_params, survey, topography, plates, budget=10)
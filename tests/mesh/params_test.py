@@ -0,0 +1,65 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from geoh5py import Workspace
+
+from plate_simulation.driver import PlateSimulationDriver
+from plate_simulation.mesh.params import MeshParams
+from plate_simulation.models.params import PlateParams
+from plate_simulation.models.plates import Plate
+from plate_simulation.utils import replicate
+from tests.ensemble import get_params
+from tests.runtest import get_survey, get_topography
+
+
+def test_merged_plate_refinement(tmp_path):
+    with Workspace.create(tmp_path / "test.geoh5") as ws:
+        topography = get_topography(ws)
+        survey = get_survey(ws, 10, 10)
+        params = PlateParams(
+            name="plate",
+            plate=1.0,
+            elevation=-250.0,
+            width=20.0,
+            strike_length=100.0,
+            dip_length=100.0,
+        )
+        surface = Plate(params, 0.0, 0.0, -250.0).create_surface(ws)
+        plates = replicate(surface, 30, 40.0, 90.0)
+        mesh_params = MeshParams(
+            u_cell_size=10.0,
+            v_cell_size=10.0,
+            w_cell_size=10.0,
+            padding_distance=1500.0,
+            depth_core=600.0,
+            max_distance=200.0,
+        )
+        octree_params = mesh_params.octree_params(survey, topography, plates)
+
+        refinements = [
+            refinement
+            for refinement in octree_params.refinements
+            if refinement is not None
+        ]
+        assert len(refinements) == 3
+        assert refinements[-1].refinement_object.n_vertices == 30 * 8
+
+
+def test_merged_plates_removed(tmp_path):
+    with Workspace.create(tmp_path / "test.geoh5") as ws:
+        params = get_params(ws)
+        params.model.plate.number = 3
+        params.model.plate.spacing = 150.0
+        driver = PlateSimulationDriver(params)
+        mesh = driver.mesh
+
+        assert mesh.parent.uid == driver.out_group.uid
+        assert len(driver.surfaces) == 3
+        assert all(ws.get_entity(surface.uid)[0] for surface in driver.surfaces)
+        assert not ws.get_entity("Plates")[0]
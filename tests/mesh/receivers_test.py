@@ -0,0 +1,161 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+import numpy as np
+from geoh5py import Workspace
+from geoh5py.objects import AirborneTEMReceivers, AirborneTEMTransmitters, Points
+from octree_creation_app.driver import OctreeDriver
+
+from plate_simulation.driver import PlateSimulationDriver
+from plate_simulation.mesh.params import MeshParams
+from plate_simulation.mesh.receivers import thin_receivers
+from plate_simulation.models.params import PlateParams
+from plate_simulation.models.plates import Plate
+from tests.ensemble import get_params
+from tests.runtest import get_topography
+
+
+def test_thin_receivers():
+    rng = np.random.default_rng(0)
+    locations = rng.uniform(0.0, 10.0, (200, 3))
+    locations = np.vstack([locations, locations[:10]])
+
+    kept = thin_receivers(locations, np.zeros(3), np.full(3, 10.0))
+    batched = thin_receivers(locations, np.zeros(3), np.full(3, 10.0), batch_size=64)
+
+    assert len(kept) < 200
+    assert set(kept) <= set(batched)
+    assert np.all(kept < 200)
+    for signs in [np.r_[1.0, 1.0, 1.0], np.r_[-1.0, 1.0, -1.0]]:
+        closest = np.argmin(locations @ signs)
+        assert closest in kept
+
+
+def test_thinned_survey_mesh(tmp_path):
+    with Workspace.create(tmp_path / "test.geoh5") as ws:
+        x, y = np.meshgrid(
+            np.arange(-250.0, 250.0, 1.0), np.arange(-200.0, 201.0, 100.0)
+        )
+        survey = Points.create(
+            ws,
+            vertices=np.c_[x.ravel(), y.ravel(), np.full(x.size, 30.0)],
+            name="survey",
+        )
+        topography = get_topography(ws)
+        params = PlateParams(
+            name="plate",
+            plate=1.0,
+            elevation=-250.0,
+            width=20.0,
+            strike_length=100.0,
+            dip_length=100.0,
+        )
+        plate = Plate(params, 0.0, 0.0, -250.0).create_surface(ws)
+        mesh_params = MeshParams(
+            u_cell_size=10.0,
+            v_cell_size=10.0,
+            w_cell_size=10.0,
+            padding_distance=500.0,
+            depth_core=300.0,
+            max_distance=200.0,
+        )
+        thinned = mesh_params.model_copy(update={"thin_receivers": True})
+
+        meshes = []
+        for values in [mesh_params, thinned]:
+            octree_params = values.octree_params(survey, topography, [plate])
+            meshes.append(OctreeDriver.treemesh_from_params(octree_params))
+
+        receivers = octree_params.refinements[0].refinement_object
+        assert receivers.n_vertices < survey.n_vertices / 4
+        np.testing.assert_array_equal(meshes[0].cell_centers, meshes[1].cell_centers)
+
+
+def test_thinned_survey_complement(tmp_path):
+    with Workspace.create(tmp_path / "test.geoh5") as ws:
+        x, y = np.meshgrid(
+            np.arange(-250.0, 250.0, 1.0), np.arange(-200.0, 201.0, 100.0)
+        )
+        vertices = np.c_[x.ravel(), y.ravel(), np.full(x.size, 30.0)]
+        lines = np.repeat(np.arange(y.shape[0]), y.shape[1])
+        survey = AirborneTEMReceivers.create(
+            ws, vertices=vertices, parts=lines, name="survey"
+        )
+        transmitters = AirborneTEMTransmitters.create(
+            ws,
+            vertices=vertices + np.r_[0.0, 0.0, 150.0],
+            parts=lines,
+            name="transmitters",
+        )
+        survey.transmitters = transmitters
+        topography = get_topography(ws)
+        params = PlateParams(
+            name="plate",
+            plate=1.0,
+            elevation=-250.0,
+            width=20.0,
+            strike_length=100.0,
+            dip_length=100.0,
+        )
+        plate = Plate(params, 0.0, 0.0, -250.0).create_surface(ws)
+        mesh_params = MeshParams(
+            u_cell_size=10.0,
+            v_cell_size=10.0,
+            w_cell_size=10.0,
+            padding_distance=500.0,
+            depth_core=300.0,
+            max_distance=200.0,
+        )
+        thinned = mesh_params.model_copy(update={"thin_receivers": True})
+
+        meshes = []
+        for values in [mesh_params, thinned]:
+            octree_params = values.octree_params(survey, topography, [plate])
+            meshes.append(OctreeDriver.treemesh_from_params(octree_params))
+
+        receivers, complement = [
+            refinement.refinement_object for refinement in octree_params.refinements[:2]
+        ]
+        assert receivers.n_vertices < survey.n_vertices / 4
+        assert complement.n_vertices < transmitters.n_vertices / 4
+        assert not hasattr(complement, "complement")
+        assert meshes[0].n_cells == meshes[1].n_cells
+        np.testing.assert_array_equal(meshes[0].cell_centers, meshes[1].cell_centers)
+
+
+def test_thinned_survey_removed(tmp_path):
+    with Workspace.create(tmp_path / "test.geoh5") as ws:
+        params = get_params(ws)
+        mesh_params = params.mesh.model_copy(
+            update={
+                "u_cell_size": 200.0,
+                "v_cell_size": 200.0,
+                "w_cell_size": 200.0,
+                "thin_receivers": True,
+            }
+        )
+        params = params.model_copy(update={"mesh": mesh_params})
+        driver = PlateSimulationDriver(params)
+        survey = driver.survey
+        assert (
+            len(
+                thin_receivers(
+                    survey.vertices,
+                    params.mesh.base_mesh(survey).origin,
+                    np.full(3, 200.0),
+                )
+            )
+            < survey.n_vertices
+        )
+
+        mesh = driver.mesh
+
+        assert mesh.parent.uid == driver.out_group.uid
+        assert ws.get_entity(survey.uid)[0] is not None
+        assert not ws.get_entity(f"{survey.name} thinned")[0]
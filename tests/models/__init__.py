@@ -13,7 +13,7 @@ from octree_creation_app.driver import OctreeDriver
 from octree_creation_app.params import OctreeParams
 
 
-def get_topo_mesh(workspace):
+def get_octree_params(workspace):
     vertices = np.array(
         [
             [0.0, 0.0, 0.0],
@@ -47,6 +47,11 @@ def get_topo_mesh(workspace):
     }
     params = OctreeParams(**kwargs)
     params.write_ui_json(workspace.h5file.parent / "octree.ui.json")
+    return topography, params
+
+
+def get_topo_mesh(workspace):
+    topography, params = get_octree_params(workspace)
     driver = OctreeDriver(params)
     octree = driver.run()
     return topography, octree
@@ -0,0 +1,113 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+import numpy as np
+from geoh5py import Workspace
+
+from plate_simulation.models.cache import MASK_CACHE, MaskCache, mesh_key
+from plate_simulation.models.events import Body, Boundary
+from plate_simulation.models.params import PlateParams
+from plate_simulation.models.plates import Plate
+
+from . import get_topo_mesh
+
+
+def test_mask_cache_lru():
+    cache = MaskCache(maxsize=2)
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return np.full(3, value, dtype=bool)
+
+    cache.fetch("a", lambda: compute(True))
+    cache.fetch("b", lambda: compute(False))
+    cache.fetch("a", lambda: compute(True))
+    cache.fetch("c", lambda: compute(True))
+
+    assert calls == [True, False, True]
+    assert "a" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+    assert not cache.fetch("a", lambda: compute(True)).flags.writeable
+
+
+def test_boundary_mask_cached(tmp_path):
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        topography, octree = get_topo_mesh(ws)
+        MASK_CACHE.clear()
+
+        depth = Boundary(topography).depth(octree)
+        assert len(MASK_CACHE) == 1
+        Boundary(topography).mask(octree, offset=-1.0)
+        Boundary(topography).mask(octree, offset=-2.0, reference="top")
+        assert Boundary(topography).depth(octree) is depth
+        assert len(MASK_CACHE) == 1
+
+        key = mesh_key(octree)
+        octree.octree_cells = octree.octree_cells.copy()
+        assert mesh_key(octree) == key
+        assert Boundary(topography.copy()).depth(octree.copy()) is depth
+
+        topography.vertices = topography.vertices + np.r_[0.0, 0.0, 1.0]
+        assert Boundary(topography).depth(octree) is not depth
+        assert len(MASK_CACHE) == 2
+
+
+def test_mask_cache_fill():
+    cache = MaskCache(maxsize=2)
+    calls = []
+
+    def compute(indices):
+        calls.append(indices.tolist())
+        return indices % 2
+
+    assert cache.fill("a", 6, np.r_[0, 1, 2], compute).tolist() == [0, 1, 0]
+    assert cache.fill("a", 6, np.r_[1, 2, 3, 4], compute).tolist() == [1, 0, 1, 0]
+    assert calls == [[0, 1, 2], [3, 4]]
+
+
+def test_subset_masks_cached(tmp_path):
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        topography, octree = get_topo_mesh(ws)
+        MASK_CACHE.clear()
+
+        boundary = Boundary(topography)
+        indices = np.arange(0, octree.n_cells, 3)
+        mask = boundary.mask(octree, offset=-1.0, indices=indices)
+        assert len(MASK_CACHE) == 1
+        assert np.all(mask == boundary.mask(octree, offset=-1.0)[indices])
+        assert len(MASK_CACHE) == 1
+
+        params = PlateParams(
+            name="my plate",
+            plate=10.0,
+            elevation=-2.0,
+            width=1.0,
+            strike_length=4.0,
+            dip_length=3.0,
+            dip=60.0,
+            dip_direction=30.0,
+        )
+        body = Body(Plate(params, 5.0, 5.0, -2.0).create_surface(ws))
+        tested = []
+        compute = body._mask  # pylint: disable=protected-access
+
+        def counted(mesh, cells):
+            tested.append(cells.size)
+            return compute(mesh, cells)
+
+        body._mask = counted  # pylint: disable=protected-access
+        subset = body.mask(octree, indices=indices)
+        assert len(MASK_CACHE) == 2
+        full = body.mask(octree)
+        assert np.any(subset)
+        assert np.all(full[indices] == subset)
+        assert np.all(full == body.contains(octree.centroids))
+        assert tested == [indices.size, octree.n_cells - indices.size]
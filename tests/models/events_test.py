@@ -10,8 +10,23 @@
 import numpy as np
 from geoh5py import Workspace
 from geoh5py.objects import Surface
+from scipy.spatial import Delaunay
+from simpeg_drivers.utils.utils import active_from_xyz
+from trimesh import Trimesh
+from trimesh.creation import annulus
+from trimesh.proximity import ProximityQuery
 
-from plate_simulation.models.events import Anomaly, Deposition, Erosion, Overburden
+from plate_simulation.models.cache import MASK_CACHE
+from plate_simulation.models.events import (
+    Anomaly,
+    Body,
+    Boundary,
+    Deposition,
+    Erosion,
+    Overburden,
+    cell_half_sizes,
+    classify_octree,
+)
 from plate_simulation.models.params import PlateParams
 from plate_simulation.models.plates import Plate
 
@@ -106,3 +121,156 @@ def test_anomaly(tmp_path):
             & (octree.centroids[:, 2] < -1.0)
         )
         assert all(data.values[ind] == 10.0)
+
+
+def test_body_half_spaces(tmp_path):
+    with Workspace(tmp_path / "test.geoh5") as workspace:
+        _, octree = get_topo_mesh(workspace)
+        params = PlateParams(
+            name="my plate",
+            plate=10.0,
+            elevation=-3.0,
+            width=2.0,
+            strike_length=8.0,
+            dip_length=6.0,
+            dip=35.0,
+            dip_direction=120.0,
+        )
+        plate = Plate(params, center_x=5.0, center_y=5.0, center_z=-3.0)
+        body = Body(plate.create_surface(workspace))
+
+        assert body.half_spaces is not None
+        assert body.half_spaces.shape == (6, 4)
+
+        triangulation = Trimesh(
+            vertices=body.surface.vertices, faces=body.surface.cells
+        )
+        dist = ProximityQuery(triangulation).signed_distance(octree.centroids)
+        assert np.any(dist > 0)
+        assert np.all(body.mask(octree) == (dist > 0))
+
+        open_surface = Surface.create(
+            workspace,
+            vertices=plate.vertices,
+            cells=plate.triangles[:-2],
+        )
+        assert Body(open_surface).half_spaces is None
+
+
+def test_boundary_mask(tmp_path):
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        _, octree = get_topo_mesh(ws)
+        x, y = np.meshgrid(np.linspace(-15.0, 25.0, 21), np.linspace(-15.0, 25.0, 21))
+        z = np.sin(x / 3.0) + np.cos(y / 2.0) - 2.0
+        topography = Surface.create(
+            ws,
+            vertices=np.c_[x.flatten(), y.flatten(), z.flatten()],
+            cells=Delaunay(np.c_[x.flatten(), y.flatten()]).simplices,
+        )
+        boundary = Boundary(topography)
+
+        for offset in [0.0, -3.0]:
+            for reference in ["bottom", "center", "top"]:
+                mask = boundary.mask(octree, offset=offset, reference=reference)
+                expected = active_from_xyz(
+                    octree, boundary.vertical_shift(offset), reference
+                )
+                assert np.any(mask)
+                assert np.all(mask == expected)
+
+        overburden = Overburden(topography=topography, thickness=3.0, value=2.0)
+        assert np.allclose(overburden.extent[:, 2], [z.min() - 3.0, z.max() - 3.0])
+
+        model, _ = overburden.realize(
+            mesh=octree,
+            model=np.ones(octree.n_cells),
+            event_map={1: ("Background", 1.0)},
+        )
+        assert np.all((model == 2) == (boundary.depth(octree) < 3.0))
+
+
+def test_boundary_mask_outside_hull(tmp_path):
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        _, octree = get_topo_mesh(ws)
+        x, y = np.meshgrid(np.linspace(0.0, 10.0, 11), np.linspace(0.0, 10.0, 11))
+        z = 0.5 * x - 0.3 * y + np.sin(x * y / 10.0)
+        topography = Surface.create(
+            ws,
+            vertices=np.c_[x.flatten(), y.flatten(), z.flatten()],
+            cells=Delaunay(np.c_[x.flatten(), y.flatten()]).simplices,
+        )
+        boundary = Boundary(topography)
+        depth = boundary.depth(octree)
+        assert np.any(np.isnan(depth))
+
+        for offset in [0.0, -3.0]:
+            for reference in ["bottom", "center", "top"]:
+                mask = boundary.mask(octree, offset=offset, reference=reference)
+                expected = active_from_xyz(
+                    octree, boundary.vertical_shift(offset), reference
+                )
+                assert np.all(mask == expected)
+
+                indices = np.flatnonzero(np.isnan(depth))[::3]
+                subset = boundary.mask(
+                    octree, offset=offset, reference=reference, indices=indices
+                )
+                assert np.all(subset == expected[indices])
+
+
+def test_classify_octree(tmp_path):
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        topography, octree = get_topo_mesh(ws)
+        ring = annulus(r_min=1.0, r_max=3.0, height=2.0)
+        body = Body(
+            Surface.create(
+                ws,
+                vertices=ring.vertices + np.r_[5.0, 5.0, -2.0],
+                cells=ring.faces,
+            )
+        )
+        assert body.half_spaces is None
+
+        tested = []
+
+        def contains(cells):
+            tested.append(cells.size)
+            return body.contains(octree.centroids[cells])
+
+        mask = classify_octree(octree, body._block_classifier(), contains)  # pylint: disable=protected-access
+        assert np.any(mask)
+        assert np.all(mask == body.contains(octree.centroids))
+        assert np.all(body.mask(octree) == mask)
+        assert sum(tested) < octree.n_cells / 4
+
+        boundary = Boundary(topography)
+        for offset in [0.0, -1.0]:
+            mask = boundary.mask(octree, offset=offset, reference="top")
+            expected = active_from_xyz(octree, boundary.vertical_shift(offset), "top")
+            assert np.all(mask == expected)
+            MASK_CACHE.clear()
+
+
+def test_body_fraction(tmp_path):
+    with Workspace(tmp_path / "test.geoh5") as workspace:
+        _, octree = get_topo_mesh(workspace)
+        params = PlateParams(
+            name="my plate",
+            plate=10.0,
+            elevation=-2.0,
+            width=0.75,
+            strike_length=4.0,
+            dip_length=3.0,
+            dip=60.0,
+            dip_direction=30.0,
+        )
+        plate = Plate(params, center_x=5.0, center_y=5.0, center_z=-2.0)
+        body = Body(plate.create_surface(workspace))
+
+        indices, fractions = body.fraction(octree, samples=8)
+        volumes = np.prod(cell_half_sizes(octree)[indices] * 2.0, axis=1)
+
+        assert np.all((fractions > 0) & (fractions <= 1))
+        assert np.any(fractions < 1)
+        assert np.isclose(np.sum(fractions * volumes), 0.75 * 4.0 * 3.0, rtol=0.02)
+        assert np.all(np.isin(np.where(body.mask(octree))[0], indices))
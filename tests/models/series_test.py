@@ -14,8 +14,24 @@ import pytest
 from geoh5py import Workspace
 from geoh5py.objects import Surface
 
-from plate_simulation.models.events import Deposition, Erosion, Overburden
-from plate_simulation.models.series import Geology, GeologyViolationError, Lithology
+from plate_simulation.models import events
+from plate_simulation.models.cache import MASK_CACHE
+from plate_simulation.models.events import (
+    Anomaly,
+    Bodies,
+    Body,
+    Deposition,
+    Erosion,
+    Overburden,
+)
+from plate_simulation.models.params import PlateParams
+from plate_simulation.models.plates import Plate
+from plate_simulation.models.series import (
+    DikeSwarm,
+    Geology,
+    GeologyViolationError,
+    Lithology,
+)
 
 from . import get_topo_mesh
 
@@ -121,11 +137,13 @@ def test_scenario(tmp_path):
             background=100.0,
             history=[lithology, overburden, erosion],
         )
-        model, event_map = scenario.build()
-        assert model is not None
+        geology, event_map = scenario.build()
+        assert geology.dtype == np.uint8
 
+        lookup = np.full(max(event_map) + 1, np.nan)
         for event_id, props in event_map.items():
-            model[model == event_id] = props[1]
+            lookup[event_id] = props[1]
+        model = lookup[geology]
 
         ind = octree.centroids[:, 2] > 0.0
         assert all(np.isnan(model[ind]))
@@ -139,3 +157,283 @@ def test_scenario(tmp_path):
         assert all(model[ind] == 2.0)
         ind = octree.centroids[:, 2] < -10.0
         np.testing.assert_allclose(model[ind], 3.0)
+
+
+def test_incremental_build(tmp_path):
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        topography, octree = get_topo_mesh(ws)
+        layer = Surface.create(
+            ws,
+            name="layer",
+            vertices=topography.vertices - np.r_[0.0, 0.0, 5.0],
+            cells=topography.cells,
+        )
+        erosion = Erosion(surface=topography)
+        scenario = Geology(
+            workspace=ws,
+            mesh=octree,
+            background=100.0,
+            history=[
+                Deposition(surface=layer, value=1.0),
+                Overburden(topography=topography, thickness=1.0, value=10.0),
+                erosion,
+            ],
+        )
+        model, _ = scenario.build()
+        realizations = dict(scenario._realizations)  # pylint: disable=protected-access
+
+        scenario.history = [
+            Deposition(surface=layer, value=2.0),
+            Overburden(topography=topography, thickness=2.0, value=10.0),
+            erosion,
+        ]
+        updated, event_map = scenario.build()
+
+        assert event_map[2] == ("Deposition", 2.0)
+        reused = [
+            key
+            for key, mask in scenario._realizations.items()  # pylint: disable=protected-access
+            if realizations.get(key) is mask
+        ]
+        assert len(reused) == 2
+        ind = (octree.centroids[:, 2] < -1.0) & (octree.centroids[:, 2] > -2.0)
+        assert np.all(model[ind] == 1)
+        assert np.all(updated[ind] == 3)
+
+
+def test_rebuild_reuses_fractions(tmp_path, monkeypatch):
+    calls = []
+    fraction = Erosion.fraction
+
+    def counted(self, mesh):
+        calls.append(self.name)
+        return fraction(self, mesh)
+
+    monkeypatch.setattr(Erosion, "fraction", counted)
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        topography, octree = get_topo_mesh(ws)
+        scenario = Geology(
+            workspace=ws,
+            mesh=octree,
+            background=100.0,
+            history=[Erosion(surface=topography)],
+        )
+        scenario.build()
+        scenario.build()
+
+    assert calls == ["Erosion"]
+
+
+def test_scenario_with_history(tmp_path, monkeypatch):
+    calls = []
+    fraction = Erosion.fraction
+
+    def counted(self, mesh):
+        calls.append(self.name)
+        return fraction(self, mesh)
+
+    monkeypatch.setattr(Erosion, "fraction", counted)
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        topography, octree = get_topo_mesh(ws)
+        params = PlateParams(
+            name="plate",
+            plate=10.0,
+            elevation=-1.0,
+            width=4.0,
+            strike_length=6.0,
+            dip_length=4.0,
+            dip=90.0,
+            dip_direction=0.0,
+        )
+        plate = Plate(params, center_x=5.0, center_y=5.0, center_z=-1.0)
+        history = [
+            Anomaly(plate.create_surface(ws), value=10.0),
+            Overburden(topography=topography, thickness=0.5, value=5.0),
+            Erosion(surface=topography),
+        ]
+        scenario = Geology(workspace=ws, mesh=octree, background=1.0, history=history)
+        model, _ = scenario.build()
+
+        background = scenario.with_history(history[1:])
+        values, event_map = background.build()
+        expected, _ = Geology(
+            workspace=ws, mesh=octree, background=1.0, history=history[1:]
+        ).build()
+
+        assert scenario.history == history
+        assert np.all(scenario.build()[0] == model)
+        assert np.all(values == expected)
+        assert len(event_map) == 3
+        assert calls == ["Erosion", "Erosion"]
+
+
+def test_reverse_order_build(tmp_path):
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        topography, octree = get_topo_mesh(ws)
+        params = PlateParams(
+            name="plate",
+            plate=10.0,
+            elevation=-1.0,
+            width=4.0,
+            strike_length=6.0,
+            dip_length=4.0,
+            dip=90.0,
+            dip_direction=0.0,
+        )
+        plate = Plate(params, center_x=5.0, center_y=5.0, center_z=-1.0)
+        history = [
+            Anomaly(plate.create_surface(ws), value=10.0),
+            Overburden(topography=topography, thickness=0.5, value=5.0),
+            Erosion(surface=topography),
+        ]
+        scenario = Geology(workspace=ws, mesh=octree, background=1.0, history=history)
+        model, event_map = scenario.build()
+        expected, _ = Geology(
+            workspace=ws, mesh=octree, background=1.0, history=history
+        ).realize(octree, np.ones(octree.n_cells), {1: ("Background", 1.0)})
+
+        assert np.all(model == expected)
+        assert np.any(model == 2)
+        assert len(event_map) == 4
+
+        tested = [
+            state >= 0
+            for state, _ in scenario._realizations.values()  # pylint: disable=protected-access
+        ]
+        assert np.all(tested[2])
+        assert np.all(tested[1] == (expected != 4))
+        assert np.all(tested[0] == (expected <= 2))
+        assert np.all(model[octree.centroids[:, 2] > 0.0] == 4)
+
+
+def test_chunked_build(tmp_path):
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        topography, octree = get_topo_mesh(ws)
+        params = PlateParams(
+            name="plate",
+            plate=10.0,
+            elevation=-2.0,
+            width=1.2,
+            strike_length=6.0,
+            dip_length=3.0,
+            dip=60.0,
+            dip_direction=45.0,
+        )
+        plate = Plate(params, center_x=5.0, center_y=5.0, center_z=-2.0)
+        history = [
+            Anomaly(plate.create_surface(ws), value=10.0, samples=2),
+            Overburden(topography=topography, thickness=1.0, value=5.0),
+            Erosion(surface=topography),
+        ]
+        scenario = Geology(workspace=ws, mesh=octree, background=1.0, history=history)
+        expected, _ = scenario.build()
+
+        chunked = Geology(
+            workspace=ws,
+            mesh=octree,
+            background=1.0,
+            history=history,
+            chunk_size=1000,
+            model_path=tmp_path / "geology.npy",
+        )
+        model, _ = chunked.build()
+
+        assert isinstance(model, np.memmap)
+        assert not model.flags.writeable
+        assert np.all(model == expected)
+        assert np.all(np.load(tmp_path / "geology.npy") == expected)
+        assert scenario.fractions[0][1].size > 0
+        for (_, *values), (_, *reference) in zip(
+            chunked.fractions, scenario.fractions, strict=True
+        ):
+            assert all(
+                np.all(value == ref)
+                for value, ref in zip(values, reference, strict=True)
+            )
+
+
+def test_dike_swarm(tmp_path):
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        _, octree = get_topo_mesh(ws)
+        anomalies = []
+        for ind, center in enumerate([2.0, 5.0, 6.0]):
+            params = PlateParams(
+                name=f"dike {ind}",
+                plate=10.0,
+                elevation=-2.0,
+                width=1.5,
+                strike_length=6.0,
+                dip_length=3.0,
+                dip=70.0,
+                dip_direction=90.0,
+            )
+            plate = Plate(params, center_x=center, center_y=5.0, center_z=-2.0)
+            anomalies.append(Anomaly(plate.create_surface(ws), value=10.0))
+
+        swarm = DikeSwarm(anomalies, name="dikes")
+        located = Bodies([anomaly.body for anomaly in anomalies]).locate(octree)
+        masks = [anomaly.mask(octree) for anomaly in anomalies]
+
+        assert np.all((located >= 0) == np.any(masks, axis=0))
+        assert np.all(masks[0][located == 0])
+        assert np.any(masks[1] & masks[2])
+        assert np.all(located[masks[2]] == 2)
+
+        model, event_map = swarm.realize(
+            octree, np.ones(octree.n_cells), {1: ("Background", 1.0)}
+        )
+        assert event_map[2] == ("dikes", 10.0)
+        assert np.all((model == 2) == (located >= 0))
+
+
+def test_chunked_build_shares_geometry(tmp_path, monkeypatch):
+    calls = {"triangulation": 0, "half_spaces": 0}
+    delaunay = events.Delaunay
+    half_spaces = Body._half_spaces  # pylint: disable=protected-access
+
+    def triangulate(*args, **kwargs):
+        calls["triangulation"] += 1
+        return delaunay(*args, **kwargs)
+
+    def planes(self):
+        calls["half_spaces"] += 1
+        return half_spaces(self)
+
+    monkeypatch.setattr(events, "Delaunay", triangulate)
+    monkeypatch.setattr(Body, "_half_spaces", planes)
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        topography, octree = get_topo_mesh(ws)
+        params = PlateParams(
+            name="plate",
+            plate=10.0,
+            elevation=-2.0,
+            width=1.2,
+            strike_length=6.0,
+            dip_length=3.0,
+            dip=60.0,
+            dip_direction=45.0,
+        )
+        # More plates than masks held by the cache, so that the depth below
+        # the topography would be evicted between chunks.
+        plates = [
+            Plate(params, center_x=easting, center_y=5.0, center_z=-2.0)
+            for easting in np.linspace(2.0, 8.0, MASK_CACHE.maxsize + 4)
+        ]
+        MASK_CACHE.clear()
+        scenario = Geology(
+            workspace=ws,
+            mesh=octree,
+            background=1.0,
+            history=[
+                DikeSwarm(
+                    [Anomaly(plate.create_surface(ws), value=10.0) for plate in plates]
+                ),
+                Overburden(topography=topography, thickness=1.0, value=5.0),
+                Erosion(surface=topography),
+            ],
+            chunk_size=500,
+        )
+        scenario.build()
+
+    assert octree.n_cells > 4 * 500
+    assert calls == {"triangulation": 1, "half_spaces": len(plates)}
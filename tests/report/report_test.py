@@ -0,0 +1,116 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+import json
+import threading
+
+import numpy as np
+from geoh5py import Workspace
+from geoh5py.groups import ContainerGroup
+
+from plate_simulation.cache import ResultCache
+from plate_simulation.driver import PlateSimulationDriver
+from plate_simulation.mesh.cache import CACHE_DIRECTORY_VARIABLE
+from plate_simulation.models.events import Erosion, Overburden
+from plate_simulation.models.series import Geology
+from plate_simulation.report import StageReport, stage
+from tests.cache import get_fingerprint
+from tests.ensemble import get_params
+from tests.models import get_topo_mesh
+
+
+def test_stage_report(tmp_path):
+    report = StageReport()
+    with stage("ignored"):
+        pass
+
+    with report.activate():
+        with stage("outer"):
+            for _ in range(3):
+                with stage("inner"):
+                    values = np.ones(2**22)
+            del values
+
+    assert list(report.stages) == ["outer/inner", "outer"]
+    assert report.stages["outer/inner"]["calls"] == 3
+    assert (
+        report.stages["outer"]["duration"] >= report.stages["outer/inner"]["duration"]
+    )
+    assert (
+        report.stages["outer"]["peak_rss"] >= report.stages["outer/inner"]["peak_rss"]
+    )
+
+    summary = json.loads(report.write(tmp_path / "report.json").read_text())
+    assert [record["stage"] for record in summary["stages"]] == list(report.stages)
+    assert summary["peak_rss"] == report.stages["outer"]["peak_rss"]
+
+
+def test_stage_report_threads():
+    report = StageReport()
+    barrier = threading.Barrier(2)
+
+    def run(name):
+        with report.stage(name):
+            barrier.wait()
+            with report.stage("inner"):
+                barrier.wait()
+
+    with report.stage("main"):
+        threads = [threading.Thread(target=run, args=(name,)) for name in "ab"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sorted(report.stages) == ["a", "a/inner", "b", "b/inner", "main"]
+    assert all(record["calls"] == 1 for record in report.stages.values())
+
+
+def test_geology_stages(tmp_path):
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        topography, octree = get_topo_mesh(ws)
+        scenario = Geology(
+            workspace=ws,
+            mesh=octree,
+            background=100.0,
+            history=[
+                Overburden(topography=topography, thickness=1.0, value=10.0),
+                Erosion(surface=topography),
+            ],
+            chunk_size=octree.n_cells // 4,
+            timer=stage,
+        )
+        report = StageReport()
+        with report.activate():
+            scenario.build()
+
+    assert report.stages["mask Erosion"]["calls"] == 4
+    assert "mask Overburden" in report.stages
+
+
+def test_driver_report(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIRECTORY_VARIABLE, str(tmp_path / "cache"))
+
+    with Workspace.create(tmp_path / "test.geoh5") as ws:
+        params = get_params(ws).model_copy(update={"result_cache": True})
+        ResultCache().store(get_fingerprint(params), ContainerGroup.create(ws))
+
+        driver = PlateSimulationDriver(params)
+        driver.run()
+
+        report = driver.out_group.metadata["report"]
+        assert [record["stage"] for record in report["stages"]] == [
+            "simulation parameters",
+            "fetch result",
+            "write ui.json",
+        ]
+
+    assert driver.report_path == tmp_path / (f"test_{driver.out_group.uid}.report.json")
+    with open(driver.report_path, encoding="utf8") as file:
+        assert json.load(file)["stages"] == report["stages"]
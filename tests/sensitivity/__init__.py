@@ -0,0 +1,52 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+import numpy as np
+from discretize import TensorMesh
+from simpeg import maps
+from simpeg.potential_fields import gravity, magnetics
+
+
+def get_simulations(inclination: float = 90.0):
+    mesh = TensorMesh([[(10.0, 6)]] * 3, "CCN")
+    active = mesh.cell_centers[:, 2] < 0.0
+    n_active = int(active.sum())
+    locations = np.c_[np.linspace(-20.0, 20.0, 5), np.zeros(5), np.full(5, 35.0)]
+
+    survey = gravity.survey.Survey(
+        gravity.sources.SourceField(
+            [gravity.receivers.Point(locations, components=["gz"])]
+        )
+    )
+    density = gravity.Simulation3DIntegral(
+        mesh,
+        survey=survey,
+        rhoMap=maps.IdentityMap(nP=n_active),
+        ind_active=active,
+        store_sensitivities="forward_only",
+    )
+
+    survey = magnetics.survey.Survey(
+        magnetics.sources.UniformBackgroundField(
+            [magnetics.receivers.Point(locations, components=["tmi"])],
+            amplitude=50000.0,
+            inclination=inclination,
+            declination=0.0,
+        )
+    )
+    susceptibility = magnetics.Simulation3DIntegral(
+        mesh,
+        survey=survey,
+        chiMap=maps.IdentityMap(nP=3 * n_active),
+        ind_active=active,
+        model_type="vector",
+        store_sensitivities="forward_only",
+    )
+
+    return density, susceptibility
@@ -0,0 +1,74 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+import numpy as np
+from discretize import TensorMesh
+from geoh5py import Workspace
+from simpeg import maps
+from simpeg.potential_fields import gravity, magnetics
+
+from plate_simulation.driver import PlateSimulationDriver
+from plate_simulation.mesh.cache import CACHE_DIRECTORY_VARIABLE
+from plate_simulation.sensitivity import SensitivityCache, sensitivity_fingerprint
+from tests.ensemble import get_params
+from tests.sensitivity import get_simulations
+
+
+def test_sensitivity_fingerprint():
+    density, susceptibility = get_simulations()
+    assert sensitivity_fingerprint(density) == sensitivity_fingerprint(
+        get_simulations()[0]
+    )
+    assert sensitivity_fingerprint(susceptibility) != sensitivity_fingerprint(
+        get_simulations(inclination=60.0)[1]
+    )
+
+
+def test_sensitivity_cache(tmp_path):
+    cache = SensitivityCache(tmp_path)
+    rng = np.random.default_rng(0)
+
+    for index, simulation in enumerate(get_simulations()):
+        model = rng.uniform(size=simulation.nC * (2 * index + 1))
+        expected = simulation.fields(model)
+
+        assert not cache.attach(simulation)
+        assert np.allclose(simulation.fields(model), expected)
+
+        twin = get_simulations()[index]
+        assert cache.attach(twin)
+        assert isinstance(twin.G, np.memmap)
+        assert np.allclose(twin.fields(model), expected)
+        assert np.allclose(twin.fields(2.0 * model), 2.0 * expected)
+
+    assert len(list(cache.directory.glob("*.npy"))) == 2
+
+
+def test_driver_reuses_sensitivity(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIRECTORY_VARIABLE, str(tmp_path / "cache"))
+
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        params = get_params(ws).model_copy(update={"sensitivity_cache": True})
+        first = PlateSimulationDriver(params).run()
+        expected = first.inversion_data.entity.get_data("Iteration_0_gz")[0].values
+        assert len(list(SensitivityCache().directory.glob("*.npy"))) == 1
+
+        def compute(self):
+            raise AssertionError("sensitivity computed again")
+
+        monkeypatch.setattr(
+            gravity.Simulation3DIntegral, "_sensitivity_matrix", compute
+        )
+        monkeypatch.setattr(gravity.Simulation3DIntegral, "linear_operator", compute)
+        second = PlateSimulationDriver(params).run()
+
+        simulation = second.data_misfit.objfcts[0].simulation
+        assert isinstance(simulation.G, np.memmap)
+        values = second.inversion_data.entity.get_data("Iteration_0_gz")[0].values
+        assert np.allclose(values, expected)
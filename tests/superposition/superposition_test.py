@@ -0,0 +1,126 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from copy import deepcopy
+
+import numpy as np
+import pytest
+from geoh5py import Workspace
+from simpeg import maps
+from simpeg.potential_fields import magnetics
+from simpeg_drivers.potential_fields.magnetic_vector.constants import (
+    default_ui_json,
+)
+
+from plate_simulation.driver import PlateSimulationDriver
+from plate_simulation.mesh.cache import CACHE_DIRECTORY_VARIABLE
+from plate_simulation.params import PlateSimulationParams
+from plate_simulation.superposition import ResponseCache, Superposition
+from tests.ensemble import get_params
+from tests.sensitivity import get_simulations
+
+
+def test_superposition(tmp_path):
+    cache = ResponseCache(tmp_path)
+    rng = np.random.default_rng(0)
+
+    for index, simulation in enumerate(get_simulations()):
+        n_blocks = 2 * index + 1
+        reference = rng.uniform(size=simulation.nC * n_blocks)
+        model = reference.copy()
+        cells = rng.choice(simulation.nC, 5, replace=False)
+        model.reshape(n_blocks, -1)[:, cells] += 1.0
+        expected = simulation.fields(model)
+
+        superposition = Superposition(simulation, reference, cache)
+        superposition.attach()
+        assert np.allclose(simulation.dpred(model), expected)
+        assert superposition.anomaly(np.isin(np.arange(simulation.nC), cells)).nC == 5
+
+        twin = get_simulations()[index]
+        Superposition(twin, reference, cache).attach()
+        assert np.allclose(twin.fields(reference), superposition.response)
+        assert np.allclose(twin.fields(model), expected)
+
+    assert len(list(cache.directory.glob("*.npy"))) == 2
+
+
+def test_superposition_supports():
+    density, susceptibility = get_simulations()
+    amplitude = magnetics.Simulation3DIntegral(
+        susceptibility.mesh,
+        survey=susceptibility.survey,
+        chiMap=maps.IdentityMap(nP=susceptibility.nC),
+        ind_active=susceptibility.ind_active,
+        is_amplitude_data=True,
+    )
+
+    assert Superposition.supports(density)
+    assert not Superposition.supports(amplitude)
+    with pytest.raises(ValueError, match="not supported"):
+        Superposition(amplitude, np.zeros(amplitude.nC))
+
+
+def get_magnetic_vector_params(workspace: Workspace) -> PlateSimulationParams:
+    params = get_params(workspace)
+    gravity = params.simulation.options
+    options = deepcopy(default_ui_json)
+    options["forward_only"] = True
+    options["geoh5"] = gravity["geoh5"]
+    options["topography_object"]["value"] = gravity["topography_object"]["value"]
+    options["data_object"]["value"] = gravity["data_object"]["value"]
+    options["tmi_channel_bool"]["value"] = True
+    options["inducing_field_inclination"]["value"] = 60.0
+    options["inducing_field_declination"]["value"] = 30.0
+    params.simulation.options = options
+
+    return params
+
+
+@pytest.mark.parametrize(
+    ("get_simulation_params", "component"),
+    [(get_params, "gz"), (get_magnetic_vector_params, "tmi")],
+)
+def test_superposed_simulation(tmp_path, monkeypatch, get_simulation_params, component):
+    monkeypatch.setenv(CACHE_DIRECTORY_VARIABLE, str(tmp_path / "cache"))
+    references = []
+    attach = Superposition.attach
+
+    def record(self):
+        references.append(self.reference)
+        attach(self)
+
+    monkeypatch.setattr(Superposition, "attach", record)
+
+    def simulate(params, plate, superposition=False):
+        params.model.plate.plate = plate
+        driver = PlateSimulationDriver(
+            params.model_copy(update={"superposition": superposition})
+        )
+        simulation_driver = driver.run()
+        survey = simulation_driver.inversion_data.entity
+        data = survey.get_data(f"Iteration_0_{component}")[0].values
+
+        return data, simulation_driver.models.starting
+
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        params = get_simulation_params(ws)
+        _, background = simulate(params, 0.0)
+        expected, _ = simulate(params, 0.5)
+        data = [simulate(params, plate, True)[0] for plate in [0.5, 1.0]]
+
+        assert np.abs(expected).max() > 0.0
+        assert np.allclose(data[0], expected, atol=1e-6 * np.abs(expected).max())
+        assert not np.allclose(data[1], expected)
+        assert len(references) == 2
+        assert all(
+            np.allclose(values, background, rtol=1e-6, atol=0.0)
+            for values in references
+        )
+        assert len(list(ResponseCache().directory.glob("*.npy"))) == 1
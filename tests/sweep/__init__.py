@@ -0,0 +1,42 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+import json
+
+from plate_simulation.models.params import ModelParams, OverburdenParams, PlateParams
+from plate_simulation.sweep import LOOKUP_FILE
+
+
+def get_model_params(**kwargs) -> ModelParams:
+    plate_params = PlateParams(
+        name="plate",
+        plate=0.5,
+        elevation=-250.0,
+        width=100.0,
+        strike_length=100.0,
+        dip_length=100.0,
+        dip=0.0,
+        dip_direction=0.0,
+        relative_locations=True,
+        **kwargs,
+    )
+    return ModelParams(
+        name="density",
+        background=0.0,
+        overburden=OverburdenParams(thickness=50.0, overburden=0.2),
+        plate=plate_params,
+    )
+
+
+def write_lookup(path, trials):
+    lookup = {
+        f"member_{i}": dict(trial, status="pending") for i, trial in enumerate(trials)
+    }
+    with open(path / LOOKUP_FILE, "w", encoding="utf8") as file:
+        json.dump(lookup, file)
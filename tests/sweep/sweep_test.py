@@ -0,0 +1,126 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+import json
+import shutil
+from copy import deepcopy
+
+import numpy as np
+from geoh5py import Workspace
+from geoh5py.groups import SimPEGGroup
+from simpeg_drivers.constants import default_ui_json
+
+from plate_simulation.driver import PlateSimulationDriver
+from plate_simulation.mesh.cache import CACHE_DIRECTORY_VARIABLE, MeshCache
+from plate_simulation.mesh.params import MeshParams
+from plate_simulation.models.params import ModelParams, OverburdenParams, PlateParams
+from plate_simulation.params import PlateSimulationParams
+from plate_simulation.sweep import (
+    LOOKUP_FILE,
+    apply_trial,
+    plate_envelope,
+    plate_geometry,
+    sweep_trials,
+)
+from tests.runtest import get_survey, get_topography
+from tests.sweep import get_model_params, write_lookup
+
+
+def test_sweep_trials(tmp_path):
+    assert not sweep_trials(tmp_path)
+
+    trials = [{"easting": 0.0, "plate": 1.0}, {"easting": 10.0, "plate": 1.0}]
+    write_lookup(tmp_path, trials)
+    assert sweep_trials(tmp_path) == trials
+
+    params = apply_trial(get_model_params(), {"easting": 10.0, "thickness": 5.0})
+    assert params.plate.easting == 10.0
+    assert params.overburden.thickness == 5.0
+    assert params.name == "density"
+
+
+def test_plate_envelope(tmp_path):
+    with Workspace(tmp_path / "test.geoh5") as ws:
+        topography = get_topography(ws)
+        survey = get_survey(ws, 10, 10)
+        params = get_model_params(number=3, spacing=150.0)
+
+        vertices, cells = plate_geometry(params, survey, topography)
+        assert vertices.shape == (24, 3)
+        assert cells.shape == (36, 3)
+        assert np.allclose(np.ptp(vertices[:, 1]), 400.0)
+
+        trials = [
+            {"easting": easting, "plate": value}
+            for easting in [-100.0, 0.0, 100.0]
+            for value in [0.5, 1.0]
+        ]
+        vertices, cells = plate_envelope(params, survey, topography, trials)
+        assert vertices.shape == (9 * 8, 3)
+        assert cells.max() == 9 * 8 - 1
+
+        reversed_vertices, _ = plate_envelope(params, survey, topography, trials[::-1])
+        assert np.all(reversed_vertices == vertices)
+
+        vertices, _ = plate_envelope(params, survey, topography, [])
+        expected, _ = plate_geometry(params, survey, topography)
+        assert np.all(np.sort(vertices, axis=0) == np.sort(expected, axis=0))
+
+
+def test_sweep_envelope_mesh(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIRECTORY_VARIABLE, str(tmp_path / "cache"))
+    sweep = tmp_path / "sweep"
+    sweep.mkdir()
+    trials = [{"easting": -100.0}, {"easting": 100.0}]
+    write_lookup(sweep, trials)
+
+    with Workspace(sweep / "member_0.ui.geoh5") as ws:
+        topography = get_topography(ws)
+        survey = get_survey(ws, 10, 10)
+        options = deepcopy(default_ui_json)
+        options["inversion_type"] = "gravity"
+        options["forward_only"] = True
+        options["geoh5"] = str(ws.h5file)
+        options["topography_object"]["value"] = str(topography.uid)
+        options["data_object"]["value"] = str(survey.uid)
+        simulation = SimPEGGroup.create(ws)
+        simulation.options = options
+
+    shutil.copy(sweep / "member_0.ui.geoh5", sweep / "member_1.ui.geoh5")
+
+    meshes = []
+    for member, trial in enumerate(trials):
+        with Workspace(sweep / f"member_{member}.ui.geoh5") as ws:
+            simulation = next(
+                group for group in ws.groups if isinstance(group, SimPEGGroup)
+            )
+            params = PlateSimulationParams(
+                title="test",
+                run_command="run",
+                geoh5=ws,
+                mesh=MeshParams(
+                    u_cell_size=10.0,
+                    v_cell_size=10.0,
+                    w_cell_size=10.0,
+                    padding_distance=1500.0,
+                    depth_core=600.0,
+                    max_distance=200.0,
+                    sweep_envelope=True,
+                ),
+                model=apply_trial(get_model_params(), trial),
+                simulation=simulation,
+            )
+            driver = PlateSimulationDriver(params)
+            meshes.append(driver.mesh.octree_cells.copy())
+
+            assert driver.envelope.vertices.shape == (16, 3)
+            assert len(driver.surfaces) == 1
+
+    assert np.all(meshes[0] == meshes[1])
+    assert len(list(MeshCache().directory.glob("*.geoh5"))) == 1
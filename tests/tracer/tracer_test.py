@@ -0,0 +1,87 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2025 Mira Geoscience Ltd.                                        '
+#                                                                                      '
+#  This file is part of plate-simulation package.                                      '
+#                                                                                      '
+#  plate-simulation is distributed under the terms and conditions of the MIT License   '
+#  (see LICENSE file at the root of this source code package).                         '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+import json
+import os
+import threading
+
+import numpy as np
+from geoh5py import Workspace
+from octree_creation_app.driver import OctreeDriver
+
+from plate_simulation.driver import PlateSimulationDriver
+from plate_simulation.report import stage
+from plate_simulation.tracer import (
+    TRACE_DIRECTORY_VARIABLE,
+    active_workspace,
+    span,
+    tracing,
+)
+from tests.models import get_octree_params
+
+
+def record_span():
+    with span("worker"):
+        pass
+
+
+def test_tracing_disabled(monkeypatch):
+    monkeypatch.delenv(TRACE_DIRECTORY_VARIABLE, raising=False)
+
+    with tracing() as tracer, span("ignored"):
+        assert tracer is None
+
+
+def test_tracing(tmp_path, monkeypatch):
+    monkeypatch.setenv(TRACE_DIRECTORY_VARIABLE, str(tmp_path / "traces"))
+    with Workspace.create(tmp_path / "test.geoh5") as ws:
+        _, params = get_octree_params(ws)
+    open_workspace = Workspace.__dict__["open"]
+
+    with tracing() as tracer:
+        assert Workspace.__dict__["open"] is open_workspace
+        assert tracer is not None
+        with tracing() as nested:
+            assert nested is tracer
+
+        with stage("outer"):
+            with span("inner", cells=10):
+                pass
+
+            worker = threading.Thread(target=record_span)
+            worker.start()
+            worker.join()
+
+        with active_workspace(ws, mode="r+"):
+            with active_workspace(ws, mode="r+"):
+                mesh = PlateSimulationDriver.build_octree(params)
+                expected = OctreeDriver(params).run()
+                assert np.all(mesh.octree_cells == expected.octree_cells)
+
+    files = list((tmp_path / "traces").glob("trace_*.json"))
+    assert files == [tracer.path]
+    with open(tracer.path, encoding="utf8") as file:
+        events = json.load(file)["traceEvents"]
+
+    names = [event["name"] for event in events if event["ph"] == "X"]
+    spans = {event["name"]: event for event in events if event["ph"] == "X"}
+    assert {"plate simulation", "outer", "inner", "refine topo"} <= set(spans)
+    assert names.count("open test.geoh5") == names.count("close test.geoh5") == 1
+    assert spans["open test.geoh5"]["ts"] <= spans["refine topo"]["ts"]
+    assert spans["refine topo"]["ts"] <= spans["close test.geoh5"]["ts"]
+    assert spans["worker"]["tid"] != spans["outer"]["tid"]
+    assert spans["inner"]["args"] == {"cells": "10"}
+    assert spans["outer"]["ts"] <= spans["inner"]["ts"]
+    assert (
+        spans["inner"]["ts"] + spans["inner"]["dur"]
+        <= spans["outer"]["ts"] + spans["outer"]["dur"]
+    )
+    assert all(event["pid"] == os.getpid() for event in events)
+    threads = [event for event in events if event["name"] == "thread_name"]
+    assert len(threads) == 2
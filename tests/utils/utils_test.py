@@ -11,7 +11,12 @@ import numpy as np
 from geoh5py import Workspace
 from geoh5py.objects import Surface
 
-from plate_simulation.utils import azimuth_to_unit_vector, replicate
+from plate_simulation.utils import (
+    azimuth_to_unit_vector,
+    merge_surfaces,
+    replicate,
+    volume_average,
+)
 
 
 def test_azimuth_to_unit_vector():
@@ -54,3 +59,32 @@ def test_replicate_odd(tmp_path):
     assert np.allclose(surfaces[0].vertices.mean(axis=0), np.array([0.0, -5.0, 0.0]))
     assert np.allclose(surfaces[1].vertices.mean(axis=0), np.array([0.0, 0.0, 0.0]))
     assert np.allclose(surfaces[2].vertices.mean(axis=0), np.array([0.0, 5.0, 0.0]))
+
+
+def test_merge_surfaces(tmp_path):
+    workspace = Workspace.create(tmp_path / "test.geoh5")
+    surface = Surface.create(
+        workspace,
+        name="test",
+        vertices=np.array([[-1, -1, 0], [1, -1, 0], [1, 1, 0], [-1, 1, 0]]),
+        cells=np.array([[0, 1, 2], [0, 2, 3]]),
+    )
+    assert merge_surfaces([surface], name="merged") is surface
+
+    surfaces = replicate(surface, 3, 5.0, 0.0)
+    merged = merge_surfaces(surfaces, name="merged")
+    assert merged.name == "merged"
+    assert merged.vertices is not None
+    assert merged.cells is not None
+    assert merged.vertices.shape == (12, 3)
+    assert np.all(merged.cells[2:4] == surface.cells + 4)
+    assert np.allclose(merged.vertices[merged.cells[4:]].mean(axis=(0, 1)), [0, 5, 0])
+
+
+def test_volume_average():
+    fraction = np.r_[0.0, 0.5, 1.0]
+    assert np.allclose(volume_average(np.r_[1.0, 1.0, 1.0], 3.0, fraction), [1, 2, 3])
+    assert np.allclose(
+        volume_average(np.r_[1.0, 1.0, 1.0], 3.0, fraction, harmonic=True),
+        [1.0, 1.5, 3.0],
+    )